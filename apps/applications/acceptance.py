@@ -0,0 +1,81 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Case, Exists, OuterRef, Value, When
+from django.utils import timezone
+from .models import Application
+from apps.jobs.models import Job
+from apps.jobs.counters import acceptance_updates, record_rejection
+from apps.jobs.feed import materialization_enabled, withdraw_jobs
+
+
+def pending_applications(job_id):
+    """The job's applications still awaiting a decision."""
+    return Application.objects.filter(job_id=job_id, status=Application.STATUS_PENDING)
+
+
+def accept_application(application):
+    """
+    Accept ``application``, assign its worker to the job and reject every
+    other pending application of the job, atomically.
+
+    The job is claimed with one conditional UPDATE that only matches while
+    both the job and this application are still pending, so of any number
+    of concurrent accepts on one job exactly one gets the row; the row lock
+    it takes holds the others back until the winner commits, after which
+    their condition no longer matches. The siblings are then settled in a
+    second UPDATE. Returns ``False``, having written nothing, when the job
+    or the application is no longer pending.
+    """
+    now = timezone.now()
+    still_pending = Application.objects.filter(
+        id=application.id, job_id=OuterRef('pk'), status=Application.STATUS_PENDING
+    )
+    with transaction.atomic():
+        claimed = Job.objects.filter(
+            Exists(still_pending), id=application.job_id, status=Job.STATUS_PENDING
+        ).update(
+            status=Job.STATUS_ACCEPTED, worker_id=application.worker_id, updated_at=now,
+            **acceptance_updates()
+        )
+        if not claimed:
+            return False
+
+        pending_applications(application.job_id).update(
+            status=Case(
+                When(id=application.id, then=Value(Application.STATUS_ACCEPTED)),
+                default=Value(Application.STATUS_REJECTED),
+            ),
+            updated_at=now,
+        )
+
+        # Bulk updates bypass the Job signals that maintain the feed
+        if materialization_enabled():
+            transaction.on_commit(partial(withdraw_jobs, [application.job]))
+
+    application.status = Application.STATUS_ACCEPTED
+    application.updated_at = now
+    application.job.status = Job.STATUS_ACCEPTED
+    application.job.worker_id = application.worker_id
+    application.job.updated_at = now
+    return True
+
+
+def reject_application(application):
+    """
+    Reject ``application`` if it is still pending, in one UPDATE (plus
+    one for the job's counters).
+
+    Returns ``False`` when it was settled in the meantime, e.g. accepted.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        rejected = Application.objects.filter(id=application.id, status=Application.STATUS_PENDING).update(
+            status=Application.STATUS_REJECTED, updated_at=now
+        )
+        if rejected:
+            record_rejection(application.job_id)
+    if rejected:
+        application.status = Application.STATUS_REJECTED
+        application.updated_at = now
+    return bool(rejected)
@@ -0,0 +1,31 @@
+"""Async-native application list (see ``jobboard_backend/async_views.py``)."""
+from .views import ApplicationsViewSet
+from jobboard_backend.async_db import fetch
+from jobboard_backend.async_views import Fallback, async_read_view, render
+from jobboard_backend.conditional import Validator
+from jobboard_backend.pagination import apaginate_page_number
+
+
+@async_read_view(ApplicationsViewSet, {'get': 'list'})
+async def application_list(request, view):
+    """
+    ``ApplicationsViewSet.list`` with its page-number pagination; the
+    ``?job=`` filter validates the job against the database and goes to
+    the sync view.
+    """
+    if 'job' in request.query_params:
+        raise Fallback
+    
+    queryset = view.filter_queryset(view.get_queryset())
+    validator = await Validator.afor_queryset(request, queryset, 'updated_at', 'job__updated_at')
+    not_modified = validator.not_modified()
+    if not_modified is not None:
+        return not_modified
+    
+    paginator = view.paginator
+    applications = await apaginate_page_number(paginator, queryset, request)
+    if applications is None:
+        applications = await fetch(queryset)
+        return validator.apply(render(view.get_serializer(applications, many=True).data))
+    data = view.get_serializer(applications, many=True).data
+    return validator.apply(render(paginator.get_paginated_response(data).data))
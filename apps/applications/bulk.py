@@ -0,0 +1,89 @@
+from functools import partial
+
+from django.db import transaction
+from .models import Application
+from .serializers import BulkApplicationSerializer, MockApplicationSerializer
+from apps.jobs.models import Job
+from apps.jobs.counters import record_new_applications
+from apps.jobs.feed import materialization_enabled, record_application
+
+# Largest number of applications accepted in one request
+BULK_APPLICATION_LIMIT = 500
+
+
+def apply_to_jobs(worker_id, items):
+    """
+    Apply ``worker_id`` to many jobs, returning one result per item in order.
+
+    Each item is ``{jobId, message, quote}``. Whatever the number of items
+    this costs one query for the jobs' statuses, one for the worker's
+    existing applications among them, one INSERT and one read-back: the
+    checks are set-based and duplicates that slip in concurrently are
+    skipped by the (job, worker) unique constraint.
+
+    A result is ``{'jobId', 'status', ...}`` where ``status`` is an HTTP
+    code: 201 with the ``application``, or 400/404 with ``detail``/``errors``.
+    """
+    results = [None] * len(items)
+    valid = {}
+    for index, item in enumerate(items):
+        serializer = BulkApplicationSerializer(data=item)
+        if not serializer.is_valid():
+            job_id = item.get('jobId') if isinstance(item, dict) else None
+            results[index] = {'jobId': job_id, 'status': 400, 'errors': serializer.errors}
+            continue
+        data = serializer.validated_data
+        if data['job_id'] in valid:
+            results[index] = _error(data['job_id'], 400, 'Job appears more than once in this request')
+            continue
+        valid[data['job_id']] = (index, data)
+
+    statuses = dict(Job.objects.filter(id__in=valid).values_list('id', 'status'))
+    applied = set(
+        Application.objects.filter(worker_id=worker_id, job_id__in=statuses).values_list('job_id', flat=True)
+    )
+
+    pending = []
+    for job_id, (index, data) in valid.items():
+        if job_id not in statuses:
+            results[index] = _error(job_id, 404, 'Job not found')
+        elif statuses[job_id] != Job.STATUS_PENDING:
+            results[index] = _error(job_id, 400, 'Job is not available for applications')
+        elif job_id in applied:
+            results[index] = _error(job_id, 400, 'You have already applied to this job')
+        else:
+            pending.append(Application(worker_id=worker_id, **data))
+
+    if pending:
+        with transaction.atomic():
+            Application.objects.bulk_create(pending, ignore_conflicts=True)
+            # Rows skipped on conflict are not ours: they were created by a
+            # concurrent request after the check above, with another stamp
+            stamps = {application.job_id: application.created_at for application in pending}
+            created = {
+                row['job_id']: row
+                for row in MockApplicationSerializer.values(
+                    Application.objects.filter(worker_id=worker_id, job_id__in=stamps)
+                )
+                if row['created_at'] == stamps[row['job_id']]
+            }
+            record_new_applications(list(created))
+            if materialization_enabled():
+                for job_id in created:
+                    transaction.on_commit(partial(record_application, worker_id, job_id))
+
+        for application in pending:
+            index = valid[application.job_id][0]
+            if application.job_id in created:
+                results[index] = {
+                    'jobId': application.job_id,
+                    'status': 201,
+                    'application': MockApplicationSerializer.to_representation(created[application.job_id]),
+                }
+            else:
+                results[index] = _error(application.job_id, 400, 'You have already applied to this job')
+    return results
+
+
+def _error(job_id, status, detail):
+    return {'jobId': job_id, 'status': status, 'detail': detail}
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_application_updated_at'),
+        ('jobs', '0006_hot_path_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # Create the composite indexes before dropping the single-column
+    # foreign key indexes they replace
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['worker', '-created_at'], name='application_worker_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'status'], name='application_job_status_idx'),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='job',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='jobs.job'),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='worker',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='applications', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -12,12 +12,20 @@ class Application(models.Model):
 		(STATUS_REJECTED, "Rejected"),
 	]
 
-	job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="applications")
-	worker = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="applications")
+	# Both foreign keys are served by the composite indexes in Meta
+	job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="applications", db_index=False)
+	worker = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="applications", db_index=False)
 	message = models.TextField()
 	quote = models.DecimalField(max_digits=12, decimal_places=2)
 	status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
 	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
 
 	class Meta:
 		unique_together = ("job", "worker")
+		indexes = [
+			# A worker's applications, newest first
+			models.Index(fields=["worker", "-created_at"], name="application_worker_created_idx"),
+			# Applications of a job by status (listing, rejecting siblings)
+			models.Index(fields=["job", "status"], name="application_job_status_idx"),
+		]
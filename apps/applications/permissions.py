@@ -26,6 +26,6 @@ class CanApplyToJob(permissions.BasePermission):
         job_id = view.kwargs.get('job_id')
         if job_id:
             from .models import Application
-            return not Application.objects.filter(job_id=job_id, worker=request.user).exists()
+            return not Application.objects.filter(job_id=job_id, worker_id=request.user.id).exists()
         
         return True
@@ -15,19 +15,46 @@ class ApplicationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'worker', 'status', 'created_at']
 
 class ApplicationCreateSerializer(serializers.ModelSerializer):
+    # Duplicate applications are rejected by the (job, worker) unique
+    # constraint when inserting; see JobsViewSet.applications
     class Meta:
         model = Application
         fields = ['message', 'quote']
+
+class BulkApplicationSerializer(ApplicationCreateSerializer):
+    """One item of a bulk application request."""
+    jobId = serializers.IntegerField(source='job_id', min_value=1)
+    
+    class Meta(ApplicationCreateSerializer.Meta):
+        fields = ['jobId', 'message', 'quote']
+
+class MockApplicationSerializer:
+    """
+    Mock API ``Application`` payload from plain rows, like
+    ``MockJobSerializer``, so neither the job nor the worker is loaded.
+    """
+    fields = ('id', 'job_id', 'worker_id', 'message', 'quote', 'status', 'created_at')
+    columns = ('id', 'jobId', 'workerId', 'message', 'quote', 'status', 'createdAt')
+    
+    @classmethod
+    def values(cls, queryset):
+        return queryset.values(*cls.fields)
+    
+    @classmethod
+    def row(cls, instance):
+        return {name: getattr(instance, name) for name in cls.fields}
     
-    def validate(self, data):
-        # Check if worker already applied to this job
-        job_id = self.context.get('job_id')
-        worker = self.context.get('request').user
-        
-        if Application.objects.filter(job_id=job_id, worker=worker).exists():
-            raise serializers.ValidationError("You have already applied to this job")
-        
-        return data
+    @staticmethod
+    def to_representation(row):
+        return {
+            'id': row['id'],
+            'jobId': row['job_id'],
+            'workerId': row['worker_id'],
+            'message': row['message'],
+            'quote': float(row['quote']),
+            'status': row['status'],
+            'createdAt': row['created_at'].isoformat()
+        }
 
 class ApplicationListSerializer(serializers.ModelSerializer):
     worker = UserPublicSerializer(read_only=True)
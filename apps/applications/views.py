@@ -3,11 +3,16 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Application
-from .serializers import ApplicationSerializer, ApplicationListSerializer
+from .serializers import ApplicationSerializer, ApplicationListSerializer, MockApplicationSerializer
 from .permissions import IsApplicationOwner, CanManageApplication, CanApplyToJob
+from .acceptance import accept_application, reject_application
+from .bulk import BULK_APPLICATION_LIMIT, apply_to_jobs
 from apps.jobs.models import Job
+from jobboard_backend.conditional import Validator
+from jobboard_backend.export import stream_export
+from jobboard_backend.timing import TimedViewMixin
 
-class ApplicationsViewSet(viewsets.ReadOnlyModelViewSet):
+class ApplicationsViewSet(TimedViewMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for managing job applications.
     Supports viewing applications with role-based filtering.
@@ -36,16 +41,78 @@ class ApplicationsViewSet(viewsets.ReadOnlyModelViewSet):
         if job_id:
             queryset = queryset.filter(job_id=job_id)
         
+        # Staff exports cover every application
+        if self.action == 'export' and self.request.user.is_staff:
+            return queryset.order_by('-created_at')
+        
         # Workers can only see their own applications
         if self.request.user.role == 'worker':
-            queryset = queryset.filter(worker=self.request.user)
+            queryset = queryset.filter(worker_id=self.request.user.id)
         
         # Clients can only see applications to their jobs
         elif self.request.user.role == 'client':
-            queryset = queryset.filter(job__client=self.request.user)
+            queryset = queryset.filter(job__client_id=self.request.user.id)
         
         return queryset.order_by('-created_at')
     
+    def list(self, request, *args, **kwargs):
+        """
+        Answer ``If-None-Match`` with a 304 before loading any application.
+
+        The payload embeds job fields, so job updates count as changes too.
+        """
+        validator = Validator.for_queryset(
+            request, self.filter_queryset(self.get_queryset()), 'updated_at', 'job__updated_at'
+        )
+        not_modified = validator.not_modified()
+        if not_modified is not None:
+            return not_modified
+        return validator.apply(super().list(request, *args, **kwargs))
+    
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """
+        Stream the visible applications (narrowed by ``job_id``/``client_id``
+        and the list filters), newest first, as NDJSON or (``?output=csv``) CSV.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).order_by('-created_at', '-id')
+        return stream_export(
+            request, MockApplicationSerializer.values(queryset),
+            MockApplicationSerializer.to_representation, MockApplicationSerializer.columns, 'applications'
+        )
+    
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Apply to many jobs at once.
+        Body is a list of ``{jobId, message, quote}``; the response holds one
+        result per item, in order, each with its own HTTP ``status``.
+        """
+        if request.user.role != 'worker':
+            return Response(
+                {"detail": "Only workers can apply to jobs"}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"detail": "Expected a non-empty list of applications"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > BULK_APPLICATION_LIMIT:
+            return Response(
+                {"detail": f"At most {BULK_APPLICATION_LIMIT} applications per request"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        results = apply_to_jobs(request.user.id, items)
+        return Response({
+            'results': results,
+            'created': sum(1 for result in results if result['status'] == status.HTTP_201_CREATED),
+            'failed': sum(1 for result in results if result['status'] != status.HTTP_201_CREATED)
+        })
+    
     @action(detail=True, methods=['post'], url_path='accept')
     def accept(self, request, pk=None):
         """
@@ -75,24 +142,17 @@ class ApplicationsViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Update application and job status
-        application.status = 'accepted'
-        application.save()
-        
-        application.job.status = 'accepted'
-        application.job.worker = application.worker
-        application.job.save()
-        
-        # Reject all other applications to this job
-        Application.objects.filter(
-            job=application.job,
-            status='pending'
-        ).exclude(id=application.id).update(status='rejected')
+        # One transaction; a concurrent accept that got the job first wins
+        if not accept_application(application):
+            return Response(
+                {"detail": "Job is not available for assignment"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         return Response({
             "detail": "Application accepted successfully",
             "job_status": "accepted",
-            "assigned_worker": application.worker.id
+            "assigned_worker": application.worker_id
         })
     
     @action(detail=True, methods=['post'], url_path='reject')
@@ -117,8 +177,11 @@ class ApplicationsViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Update application status
-        application.status = 'rejected'
-        application.save()
+        # Conditional, so it cannot undo a concurrent accept
+        if not reject_application(application):
+            return Response(
+                {"detail": "Application is not pending"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         return Response({"detail": "Application rejected successfully"})
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    name = 'apps.jobs'
+    label = 'jobs'
+
+    def ready(self):
+        # Register the geohash and materialized feed signal handlers
+        from . import signals  # noqa: F401
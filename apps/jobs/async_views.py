@@ -0,0 +1,72 @@
+"""Async-native job list and feed (see ``jobboard_backend/async_views.py``)."""
+from rest_framework import status
+from .feed import FEED_ORDERING, build_feed_queryset, materialization_enabled
+from .serializers import MockJobSerializer
+from .views import JobsViewSet
+from jobboard_backend.async_db import fetch
+from jobboard_backend.async_views import Fallback, async_read_view, render
+from jobboard_backend.conditional import Validator
+from jobboard_backend.geo import parse_near
+from jobboard_backend.pagination import KeysetPagination
+from jobboard_backend.timing import span
+
+
+def _jobs_data(rows):
+    with span('serialize'):
+        return MockJobSerializer.many(rows)
+
+
+@async_read_view(JobsViewSet, {'get': 'list', 'post': 'create'})
+async def job_list(request, view):
+    """``JobsViewSet.list``, both the plain list and ``?cursor=`` pages."""
+    queryset = view.filter_queryset(view.get_queryset())
+    validator = await Validator.afor_queryset(request, queryset)
+    not_modified = validator.not_modified()
+    if not_modified is not None:
+        return not_modified
+    
+    queryset = MockJobSerializer.values(queryset)
+    if KeysetPagination.is_requested(request):
+        paginator = KeysetPagination(ordering=('-created_at', '-id'))
+        rows = await paginator.apaginate_queryset(queryset, request)
+        return validator.apply(render({
+            'jobs': _jobs_data(rows),
+            'pagination': paginator.get_pagination_data()
+        }))
+    
+    return validator.apply(render(_jobs_data(await fetch(queryset))))
+
+
+@async_read_view(JobsViewSet, {'get': 'feed'})
+async def job_feed(request, view):
+    """
+    ``JobsViewSet.feed`` served from the live query; ``?near=`` and
+    materialized cursor pages go to the sync view.
+    """
+    if request.user.role != 'worker':
+        return render({"detail": "Only workers can access job feed"}, status=status.HTTP_403_FORBIDDEN)
+    
+    cursor = KeysetPagination.is_requested(request)
+    if parse_near(request.query_params) is not None or (cursor and materialization_enabled()):
+        raise Fallback
+    
+    queryset = build_feed_queryset(
+        request.user,
+        category=request.query_params.get('category'),
+        location=request.query_params.get('location'),
+    )
+    validator = await Validator.afor_queryset(request, queryset)
+    not_modified = validator.not_modified()
+    if not_modified is not None:
+        return not_modified
+    
+    queryset = MockJobSerializer.values(queryset)
+    if cursor:
+        paginator = KeysetPagination(ordering=FEED_ORDERING)
+        rows = await paginator.apaginate_queryset(queryset, request)
+        return validator.apply(render({
+            'jobs': _jobs_data(rows),
+            'pagination': paginator.get_pagination_data()
+        }))
+    
+    return validator.apply(render(_jobs_data(await fetch(queryset))))
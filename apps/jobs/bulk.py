@@ -0,0 +1,128 @@
+from functools import partial
+
+from django.db import transaction
+from django.utils import timezone
+from .models import Job
+from .serializers import STATUS_TRANSITIONS, BulkJobCreateSerializer, BulkJobStatusSerializer
+from .permissions import WORKER_STATUS_TRANSITIONS
+from .feed import materialization_enabled, publish_jobs, withdraw_jobs
+from apps.users.models import User
+from jobboard_backend.geo import assign_geohash
+
+# Largest number of jobs accepted in one bulk request
+BULK_JOB_LIMIT = 10000
+BATCH_SIZE = 1000
+
+
+class StatusConflict(Exception):
+    """A job changed status between the checks and the write."""
+
+
+def create_jobs(client_id, items):
+    """
+    Validate and insert many jobs for ``client_id``, all or nothing.
+
+    Returns ``(jobs, errors)``: the created jobs, or ``None`` and a list
+    with one error dict per item (empty for valid items). Invited workers
+    of the whole batch are checked in one ``IN`` query.
+    """
+    serializer = BulkJobCreateSerializer(data=items, many=True)
+    valid = serializer.is_valid()
+    errors = serializer.errors if not valid else [{} for _ in items]
+
+    rows = serializer.validated_data if valid else []
+    invited = {row['invited_worker_id'] for row in rows if row.get('invited_worker_id')}
+    if invited:
+        workers = set(User.objects.filter(id__in=invited, role='worker').values_list('id', flat=True))
+        for index, row in enumerate(rows):
+            if row.get('invited_worker_id') and row['invited_worker_id'] not in workers:
+                errors[index] = {'invited_worker_id': ['Invited worker must exist and have worker role']}
+                valid = False
+    if not valid:
+        return None, errors
+
+    jobs = []
+    for row in rows:
+        # Job has no column for the invitation; it is validated only, as
+        # for a single create
+        row = {key: value for key, value in row.items() if key != 'invited_worker_id'}
+        job = Job(client_id=client_id, **row)
+        # bulk_create skips the pre_save signal that derives the geohash
+        assign_geohash(job)
+        jobs.append(job)
+
+    with transaction.atomic():
+        jobs = Job.objects.bulk_create(jobs, batch_size=BATCH_SIZE)
+        if materialization_enabled():
+            transaction.on_commit(partial(publish_jobs, jobs))
+    return jobs, None
+
+
+def update_job_statuses(user, items):
+    """
+    Apply many ``{id, status}`` changes for ``user``, all or nothing.
+
+    The jobs are read in one query and every change is checked in memory
+    against ``STATUS_TRANSITIONS`` (clients, on their own jobs) or
+    ``WORKER_STATUS_TRANSITIONS`` (the assigned worker). The writes are one
+    conditional UPDATE per ``(from, to)`` pair, so a job that changed in
+    the meantime raises ``StatusConflict`` and rolls the batch back.
+
+    Returns ``(updated_count, errors)`` like ``create_jobs``.
+    """
+    serializer = BulkJobStatusSerializer(data=items, many=True)
+    if not serializer.is_valid():
+        return None, serializer.errors
+    changes = serializer.validated_data
+
+    jobs = {
+        row['id']: row
+        for row in Job.objects.filter(id__in={change['id'] for change in changes}).values(
+            'id', 'status', 'category', 'client_id', 'worker_id'
+        )
+    }
+
+    errors = []
+    groups = {}
+    seen = set()
+    for change in changes:
+        job = jobs.get(change['id'])
+        error = {}
+        if job is None:
+            error = {'id': ['Job not found']}
+        elif change['id'] in seen:
+            error = {'id': ['Job appears more than once in this request']}
+        elif job['client_id'] == user.id:
+            allowed = STATUS_TRANSITIONS.get(job['status'], [])
+        elif job['worker_id'] == user.id:
+            allowed = WORKER_STATUS_TRANSITIONS.get(job['status'], [])
+        else:
+            error = {'id': ['You do not have permission to update this job']}
+
+        if not error and change['status'] != job['status'] and change['status'] not in allowed:
+            error = {'status': [f"Invalid status transition from {job['status']} to {change['status']}"]}
+        if not error and change['status'] != job['status']:
+            groups.setdefault((job['status'], change['status']), []).append(change['id'])
+        seen.add(change['id'])
+        errors.append(error)
+    if any(errors):
+        return None, errors
+
+    now = timezone.now()
+    updated = 0
+    with transaction.atomic():
+        for (current, new), ids in groups.items():
+            count = Job.objects.filter(id__in=ids, status=current).update(status=new, updated_at=now)
+            if count != len(ids):
+                raise StatusConflict(f'{len(ids) - count} job(s) are no longer {current}')
+            updated += count
+
+        # Bulk updates bypass the Job signals that maintain the feed
+        withdrawn = [
+            Job(id=job_id, category=jobs[job_id]['category'])
+            for (current, new), ids in groups.items() if current == Job.STATUS_PENDING
+            for job_id in ids
+        ]
+        if withdrawn and materialization_enabled():
+            transaction.on_commit(partial(withdraw_jobs, withdrawn))
+    return updated, None
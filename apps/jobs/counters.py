@@ -0,0 +1,81 @@
+"""
+Application counters denormalized onto ``Job``.
+
+``application_count``, ``pending_application_count`` and
+``rejected_application_count`` are adjusted with F-expressions in the same
+transaction as the application writes (apply, bulk apply, accept, reject),
+so job payloads can show them without touching ``Application``. Writes
+that bypass those paths (admin edits, cascades from deleted users) are
+repaired by ``manage.py reconcile_application_counts``.
+"""
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+from .models import Job
+from apps.applications.models import Application
+
+
+def record_new_applications(job_ids):
+    """Count one new pending application on each of ``job_ids``."""
+    return Job.objects.filter(id__in=job_ids).update(
+        application_count=F('application_count') + 1,
+        pending_application_count=F('pending_application_count') + 1,
+        # Job payloads and their validators include the counters
+        updated_at=timezone.now(),
+    )
+
+
+def record_rejection(job_id):
+    """Move one application of the job from pending to rejected."""
+    return Job.objects.filter(id=job_id).update(
+        # Greatest: a drifted counter must not trip the >= 0 check
+        pending_application_count=Greatest(F('pending_application_count') - 1, 0),
+        rejected_application_count=F('rejected_application_count') + 1,
+        updated_at=timezone.now(),
+    )
+
+
+def acceptance_updates():
+    """
+    Counter changes for accepting one application of a job, to fold into
+    the UPDATE that claims the job: the other pending ones are rejected.
+    Every SET expression reads the row's values from before the update.
+    """
+    return {
+        'pending_application_count': Value(0),
+        'rejected_application_count': (
+            F('rejected_application_count') + Greatest(F('pending_application_count') - 1, 0)
+        ),
+    }
+
+
+def _count(**filters):
+    counted = (
+        Application.objects.filter(job_id=OuterRef('pk'), **filters)
+        .order_by().values('job_id').annotate(total=Count('pk')).values('total')
+    )
+    return Coalesce(Subquery(counted), 0)
+
+
+def actual_counts():
+    """Annotations recounting each job's applications from scratch."""
+    return {
+        'application_count': _count(),
+        'pending_application_count': _count(status=Application.STATUS_PENDING),
+        'rejected_application_count': _count(status=Application.STATUS_REJECTED),
+    }
+
+
+def reconcile(queryset, dry_run=False):
+    """
+    Recount the jobs in ``queryset`` whose counters drifted, in two
+    statements; returns how many did.
+    """
+    actual = {f'actual_{name}': expression for name, expression in actual_counts().items()}
+    drifted = Q()
+    for name in actual_counts():
+        drifted |= ~Q(**{name: F(f'actual_{name}')})
+    job_ids = list(queryset.annotate(**actual).filter(drifted).values_list('id', flat=True))
+    if job_ids and not dry_run:
+        Job.objects.filter(id__in=job_ids).update(**actual_counts(), updated_at=timezone.now())
+    return len(job_ids)
@@ -0,0 +1,222 @@
+import bisect
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Exists, OuterRef
+from .models import Job
+from apps.applications.models import Application
+
+# Ordering of the worker feed; matches the partial index on pending jobs and
+# is also the keyset used for cursor pagination.
+FEED_ORDERING = ('-created_at', '-id')
+
+
+def build_feed_queryset(worker, category=None, location=None):
+    """
+    Pending jobs the worker has not applied to yet, newest first.
+
+    ``category`` is matched exactly so the lookup is served by the partial
+    ``(category, created_at)`` index on pending jobs; the "already applied"
+    exclusion is a correlated NOT EXISTS against the ``(job, worker)``
+    unique index instead of a NOT IN over every application of the worker.
+    On PostgreSQL the ``location`` substring match uses the trigram index on
+    ``UPPER(location)``.
+    """
+    applied = Application.objects.filter(job_id=OuterRef('pk'), worker_id=worker.id)
+
+    queryset = Job.objects.filter(status=Job.STATUS_PENDING)
+    if category:
+        queryset = queryset.filter(category=category)
+    if location:
+        queryset = queryset.filter(location__icontains=location)
+
+    return queryset.filter(~Exists(applied)).select_related('client').order_by(*FEED_ORDERING)
+
+
+def paginate_feed(paginator, request, queryset, category=None, location=None):
+    """
+    Return one keyset page of ``queryset``, the requesting worker's feed as
+    built by ``build_feed_queryset`` (optionally narrowed with ``.values()``).
+
+    When feed materialization is enabled the page is looked up among the
+    precomputed candidate IDs of the category bucket; the candidate query
+    still applies every live predicate, so stale bucket entries can only be
+    dropped, never shown. Cold buckets, location searches, backwards paging
+    and windows that run short all fall back to the live query.
+    """
+    if materialization_enabled() and not location:
+        candidates = materialized_candidates(request.user.id, category, paginator, request)
+        if candidates is not None:
+            job_ids, exhaustive = candidates
+            page = paginator.paginate_queryset(queryset.filter(id__in=job_ids), request)
+            if paginator.has_more or exhaustive:
+                return page
+
+    return paginator.paginate_queryset(queryset, request)
+
+
+# ---------------------------------------------------------------------------
+# Materialized feed
+#
+# Each category (plus one bucket for "all categories") keeps the newest
+# FEED_MATERIALIZATION_SIZE pending jobs as a list of ``(-timestamp, -id)``
+# keys, i.e. ascending in feed order. Each worker keeps the set of job IDs
+# they applied to. Both are updated incrementally from signals (see
+# ``signals.py``) and expire after FEED_MATERIALIZATION_TTL so that updates
+# lost to concurrent writers heal on their own.
+# ---------------------------------------------------------------------------
+
+ALL_CATEGORIES = '*'
+
+
+def materialization_enabled():
+    return getattr(settings, 'FEED_MATERIALIZATION', False)
+
+
+def _cache():
+    return caches[getattr(settings, 'FEED_CACHE_ALIAS', 'default')]
+
+
+def _bucket_key(category):
+    return f'feed:bucket:{category or ALL_CATEGORIES}'
+
+
+def _applied_key(worker_id):
+    return f'feed:applied:{worker_id}'
+
+
+def _entry(created_at, job_id):
+    return (-created_at.timestamp(), -job_id)
+
+
+def warm_bucket(category=None):
+    """Rebuild one category bucket from the pending-jobs index."""
+    size = settings.FEED_MATERIALIZATION_SIZE
+    queryset = Job.objects.filter(status=Job.STATUS_PENDING)
+    if category:
+        queryset = queryset.filter(category=category)
+    rows = queryset.order_by(*FEED_ORDERING).values_list('created_at', 'id')[:size]
+    entries = [_entry(created_at, job_id) for created_at, job_id in rows]
+    bucket = {'entries': entries, 'complete': len(entries) < size}
+    _cache().set(_bucket_key(category), bucket, settings.FEED_MATERIALIZATION_TTL)
+    return bucket
+
+
+def warm_applied(worker_id):
+    """Rebuild the set of job IDs a worker has applied to."""
+    applied = set(Application.objects.filter(worker_id=worker_id).values_list('job_id', flat=True))
+    _cache().set(_applied_key(worker_id), applied, settings.FEED_MATERIALIZATION_TTL)
+    return applied
+
+
+def materialized_candidates(worker_id, category, paginator, request):
+    """
+    Pick the candidate job IDs for one page from the warm materialization.
+
+    Returns ``(job_ids, exhaustive)`` or ``None`` when the live query must
+    be used; ``exhaustive`` means no pending job exists past the last
+    candidate. A cold bucket or applied set is warmed for the next request.
+    """
+    cache = _cache()
+    bucket = cache.get(_bucket_key(category))
+    applied = cache.get(_applied_key(worker_id))
+    if bucket is None or applied is None:
+        if bucket is None:
+            warm_bucket(category)
+        if applied is None:
+            warm_applied(worker_id)
+        return None
+
+    position, reverse = paginator.get_position(Job, request)
+    if reverse:
+        return None
+
+    entries = bucket['entries']
+    start = 0
+    if position is not None:
+        start = bisect.bisect_right(entries, _entry(*position))
+
+    # Over-fetch so that a few stale entries do not force a fallback.
+    wanted = 2 * (paginator.get_limit(request) + 1)
+    job_ids = []
+    index = start
+    for index in range(start, len(entries)):
+        job_id = -entries[index][1]
+        if job_id in applied:
+            continue
+        job_ids.append(job_id)
+        if len(job_ids) == wanted:
+            break
+    else:
+        index = len(entries)
+
+    exhaustive = bucket['complete'] and index >= len(entries) - 1
+    return job_ids, exhaustive
+
+
+def _update_bucket(category, update):
+    cache = _cache()
+    key = _bucket_key(category)
+    bucket = cache.get(key)
+    if bucket is None:
+        # Cold buckets are rebuilt from the database on the next read.
+        return
+    update(bucket)
+    cache.set(key, bucket, settings.FEED_MATERIALIZATION_TTL)
+
+
+def publish_job(job):
+    """Insert a pending job into its category bucket and the global bucket."""
+    publish_jobs([job])
+
+
+def publish_jobs(jobs):
+    """Insert pending jobs into their buckets, one cache round trip per bucket."""
+    by_category = {}
+    for job in jobs:
+        by_category.setdefault(job.category, []).append(_entry(job.created_at, job.id))
+    size = settings.FEED_MATERIALIZATION_SIZE
+
+    def inserter(new_entries):
+        def insert(bucket):
+            entries = sorted(set(bucket['entries']).union(new_entries))
+            if len(entries) > size:
+                del entries[size:]
+                bucket['complete'] = False
+            bucket['entries'] = entries
+        return insert
+
+    if not by_category:
+        return
+    for category, entries in by_category.items():
+        _update_bucket(category, inserter(entries))
+    _update_bucket(None, inserter([entry for entries in by_category.values() for entry in entries]))
+
+
+def withdraw_jobs(jobs):
+    """Remove jobs that left ``pending`` (or were deleted) from the buckets."""
+    by_category = {}
+    for job in jobs:
+        by_category.setdefault(job.category, set()).add(-job.id)
+
+    def remover(ids):
+        def remove(bucket):
+            bucket['entries'] = [entry for entry in bucket['entries'] if entry[1] not in ids]
+        return remove
+
+    if not by_category:
+        return
+    for category, ids in by_category.items():
+        _update_bucket(category, remover(ids))
+    _update_bucket(None, remover(set().union(*by_category.values())))
+
+
+def record_application(worker_id, job_id):
+    """Add a job to the worker's applied set if it is materialized."""
+    cache = _cache()
+    key = _applied_key(worker_id)
+    applied = cache.get(key)
+    if applied is None:
+        return
+    applied.add(job_id)
+    cache.set(key, applied, settings.FEED_MATERIALIZATION_TTL)
@@ -0,0 +1,117 @@
+import json
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from rest_framework.test import APIRequestFactory
+from apps.jobs.feed import build_feed_queryset
+from apps.jobs.models import Job
+from apps.jobs.views import JobsViewSet
+from apps.jobs.worker_jobs import bucket_counts, bucket_queryset
+from apps.applications.acceptance import pending_applications
+from apps.applications.views import ApplicationsViewSet
+from apps.users.models import User
+from apps.workers.views import WorkersViewSet
+
+PAGE = 11
+
+# SQLite: a full table scan is "SCAN <table>" without an index; an ORDER BY
+# the index cannot deliver shows up as a temporary B-tree.
+SQLITE_TABLE_SCAN = re.compile(r'\bSCAN (\w+)$', re.MULTILINE)
+SQLITE_SORT = 'USE TEMP B-TREE FOR ORDER BY'
+
+factory = APIRequestFactory()
+
+
+def list_queryset(viewset, user, params=None):
+    """
+    The queryset ``viewset``'s list action runs for ``user`` with query
+    ``params``: its own ``get_queryset`` and filter backends, so the check
+    follows the views as they change.
+    """
+    view = viewset(action_map={'get': 'list'}, args=(), kwargs={}, format_kwarg=None)
+    request = view.initialize_request(factory.get('/', params or {}))
+    request.user = user
+    view.request = request
+    return view.filter_queryset(view.get_queryset())
+
+
+def hot_queries():
+    """``(name, queryset)`` for each hot list, feed and filter query."""
+    client = User(id=1, role='client')
+    worker = User(id=1, role='worker')
+    return [
+        ('jobs', list_queryset(JobsViewSet, client)[:PAGE]),
+        ('jobs by status', list_queryset(JobsViewSet, client, {'status': Job.STATUS_PENDING})[:PAGE]),
+        ('jobs by client', list_queryset(JobsViewSet, client, {'client_id': 1})[:PAGE]),
+        ('jobs by worker', list_queryset(JobsViewSet, client, {'worker_id': 1})[:PAGE]),
+        ('worker job buckets', bucket_counts(1)),
+        ('worker jobs by status', bucket_queryset(1, Job.STATUS_COMPLETED)[:PAGE]),
+        ('feed', build_feed_queryset(worker)[:PAGE]),
+        ('feed by category', build_feed_queryset(worker, category='Plumbing')[:PAGE]),
+        ('applications of worker', list_queryset(ApplicationsViewSet, worker)[:PAGE]),
+        ('pending applications of job', pending_applications(1)),
+        ('available workers', list_queryset(WorkersViewSet, client)[:PAGE]),
+        ('available workers by category', list_queryset(WorkersViewSet, client, {'category': 'Plumbing'})[:PAGE]),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN the hot list/feed/filter queries and fail if any of them '
+        'falls back to a sequential scan or an explicit sort.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias to explain against.')
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        if connection.vendor == 'postgresql':
+            explain = self.explain_postgres
+        elif connection.vendor == 'sqlite':
+            explain = self.explain_sqlite
+        else:
+            raise CommandError(f'Query plans cannot be checked on {connection.vendor}')
+
+        failures = []
+        for name, queryset in hot_queries():
+            queryset = queryset.using(options['database'])
+            plan, problems = explain(connection, queryset)
+            if problems:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f'FAIL {name}: {", ".join(problems)}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'ok   {name}'))
+            if problems or options['verbosity'] > 1:
+                self.stdout.write(plan)
+
+        if failures:
+            raise CommandError(f'{len(failures)} hot query plan(s) regressed: {", ".join(failures)}')
+
+    def explain_sqlite(self, connection, queryset):
+        plan = queryset.explain()
+        problems = [f'table scan of {table}' for table in SQLITE_TABLE_SCAN.findall(plan)]
+        if SQLITE_SORT in plan:
+            problems.append('sort')
+        return plan, problems
+
+    def explain_postgres(self, connection, queryset):
+        # Tiny or empty tables make a sequential scan the cheapest plan, so
+        # price them (and sorts) out: whatever remains has no index to use.
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('SET LOCAL enable_sort = off')
+            plan = queryset.explain(format='json')
+
+        problems = []
+        nodes = [json.loads(plan)[0]['Plan']]
+        while nodes:
+            node = nodes.pop()
+            if node['Node Type'] == 'Seq Scan':
+                problems.append(f'sequential scan of {node["Relation Name"]}')
+            elif node['Node Type'] == 'Sort':
+                problems.append('sort')
+            nodes.extend(node.get('Plans', []))
+        return plan, problems
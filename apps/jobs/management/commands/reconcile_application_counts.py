@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from apps.jobs.counters import reconcile
+from apps.jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = 'Recount the denormalized application counters on jobs and fix any that drifted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help='Jobs recounted per statement.')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many jobs drifted.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        drifted = 0
+        checked = 0
+        last_id = 0
+        # Walk the table in primary key ranges so no statement holds locks
+        # on more than one batch of jobs
+        while True:
+            job_ids = list(
+                Job.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not job_ids:
+                break
+            batch = Job.objects.filter(id__gte=job_ids[0], id__lte=job_ids[-1])
+            drifted += reconcile(batch, dry_run=options['dry_run'])
+            checked += len(job_ids)
+            last_id = job_ids[-1]
+
+        action = 'would be fixed' if options['dry_run'] else 'fixed'
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} jobs; {drifted} with drifted counters {action}.'))
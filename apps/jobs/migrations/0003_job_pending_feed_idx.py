@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['category', '-created_at', '-id'], name='job_pending_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # Create the composite indexes before dropping the single-column
+    # foreign key indexes they replace
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='job_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['client', '-created_at', '-id'], name='job_client_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['worker', '-created_at', '-id'], name='job_worker_created_idx'),
+        ),
+        migrations.AlterField(
+            model_name='job',
+            name='client',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='client_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='job',
+            name='worker',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='worker_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:49
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_applications(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    Application = apps.get_model('applications', 'Application')
+
+    def count(**filters):
+        counted = (
+            Application.objects.filter(job_id=OuterRef('pk'), **filters)
+            .order_by().values('job_id').annotate(total=Count('pk')).values('total')
+        )
+        return Coalesce(Subquery(counted), 0)
+
+    Job.objects.using(schema_editor.connection.alias).update(
+        application_count=count(),
+        pending_application_count=count(status='pending'),
+        rejected_application_count=count(status='rejected'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_hot_path_indexes'),
+        ('applications', '0005_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='application_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='pending_application_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='rejected_application_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_applications, migrations.RunPython.noop),
+    ]
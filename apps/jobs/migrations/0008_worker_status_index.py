@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_application_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['worker', 'status', '-created_at', '-id'], name='job_worker_status_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-17 14:30
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# The feed's ``location__icontains`` compiles to
+# ``UPPER(location::text) LIKE UPPER(%s)`` on PostgreSQL
+POSTGRES_FORWARD = [
+    "CREATE INDEX job_location_trgm_idx ON jobs_job USING gin (UPPER(location::text) gin_trgm_ops)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS job_location_trgm_idx",
+]
+
+
+def run_for_vendor(postgres):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == 'postgresql':
+            for statement in postgres:
+                schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_worker_status_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(run_for_vendor(POSTGRES_FORWARD), run_for_vendor(POSTGRES_BACKWARD)),
+    ]
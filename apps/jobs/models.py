@@ -15,8 +15,9 @@ class Job(models.Model):
 		(STATUS_CANCELLED, "Cancelled"),
 	]
 
-	client = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="client_jobs")
-	worker = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="worker_jobs")
+	# Both foreign keys are served by the composite indexes in Meta
+	client = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="client_jobs", db_index=False)
+	worker = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="worker_jobs", db_index=False)
 	title = models.CharField(max_length=255)
 	category = models.CharField(max_length=120)
 	description = models.TextField()
@@ -25,6 +26,35 @@ class Job(models.Model):
 	deadline = models.DateField(null=True, blank=True)
 	status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
 	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+	# Coordinates for proximity search; geohash is derived on save
+	# (jobboard_backend/geo.py)
+	latitude = models.FloatField(null=True, blank=True)
+	longitude = models.FloatField(null=True, blank=True)
+	geohash = models.CharField(max_length=12, blank=True, default="", db_index=True, editable=False)
+	# Application counters, kept in step by the application write paths
+	# (apps/jobs/counters.py)
+	application_count = models.PositiveIntegerField(default=0, editable=False)
+	pending_application_count = models.PositiveIntegerField(default=0, editable=False)
+	rejected_application_count = models.PositiveIntegerField(default=0, editable=False)
+
+	class Meta:
+		indexes = [
+			# Worker feed: pending jobs by category, newest first
+			models.Index(
+				fields=["category", "-created_at", "-id"],
+				condition=models.Q(status="pending"),
+				name="job_pending_feed_idx",
+			),
+			# Job lists, whole or by status, client or worker, newest first
+			# (also the keyset order of ?cursor= paging)
+			models.Index(fields=["-created_at", "-id"], name="job_created_idx"),
+			models.Index(fields=["status", "-created_at", "-id"], name="job_status_created_idx"),
+			models.Index(fields=["client", "-created_at", "-id"], name="job_client_created_idx"),
+			models.Index(fields=["worker", "-created_at", "-id"], name="job_worker_created_idx"),
+			# A worker's jobs bucketed by status (apps/jobs/worker_jobs.py)
+			models.Index(fields=["worker", "status", "-created_at", "-id"], name="job_worker_status_idx"),
+		]
 
 	def __str__(self) -> str:
 		return f"Job<{self.id}> {self.title}"
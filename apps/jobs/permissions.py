@@ -1,5 +1,12 @@
 from rest_framework import permissions
 
+# Status changes the assigned worker may make; clients may make any change
+# the serializer allows (STATUS_TRANSITIONS)
+WORKER_STATUS_TRANSITIONS = {
+    'accepted': ['in_progress'],
+    'in_progress': ['completed']
+}
+
 class IsJobOwner(permissions.BasePermission):
     """
     Allow access only to the client who owns the job.
@@ -34,10 +41,6 @@ class CanUpdateJobStatus(permissions.BasePermission):
         
         # Workers can only update status on assigned jobs
         if obj.worker == request.user:
-            allowed_transitions = {
-                'accepted': ['in_progress'],
-                'in_progress': ['completed']
-            }
-            return obj.status in allowed_transitions and new_status in allowed_transitions[obj.status]
+            return new_status in WORKER_STATUS_TRANSITIONS.get(obj.status, [])
         
         return False
@@ -1,7 +1,17 @@
+from django.utils import timezone
 from rest_framework import serializers
 from .models import Job
 from apps.users.serializers import UserPublicSerializer
 
+# Status changes allowed on a job (shared with the bulk status update)
+STATUS_TRANSITIONS = {
+    'pending': ['accepted', 'cancelled'],
+    'accepted': ['in_progress', 'cancelled'],
+    'in_progress': ['completed', 'cancelled'],
+    'completed': [],
+    'cancelled': []
+}
+
 class JobSerializer(serializers.ModelSerializer):
     client = UserPublicSerializer(read_only=True)
     worker = UserPublicSerializer(read_only=True)
@@ -10,26 +20,35 @@ class JobSerializer(serializers.ModelSerializer):
         model = Job
         fields = [
             'id', 'client', 'worker', 'title', 'category', 'description',
-            'location', 'budget', 'deadline', 'status', 'created_at'
+            'location', 'latitude', 'longitude', 'budget', 'deadline', 'status', 'created_at'
         ]
         read_only_fields = ['id', 'client', 'worker', 'created_at']
+        extra_kwargs = {
+            'latitude': {'min_value': -90, 'max_value': 90},
+            'longitude': {'min_value': -180, 'max_value': 180},
+        }
     
     def validate_status(self, value):
         if self.instance:
             # Check status transitions
             current_status = self.instance.status
-            allowed_transitions = {
-                'pending': ['accepted', 'cancelled'],
-                'accepted': ['in_progress', 'cancelled'],
-                'in_progress': ['completed', 'cancelled'],
-                'completed': [],
-                'cancelled': []
-            }
-            if value != current_status and value not in allowed_transitions.get(current_status, []):
+            if value != current_status and value not in STATUS_TRANSITIONS.get(current_status, []):
                 raise serializers.ValidationError(
                     f"Invalid status transition from {current_status} to {value}"
                 )
         return value
+    
+    def update(self, instance, validated_data):
+        # Write only the submitted fields: a full save would put back the
+        # application counters as they were read, undoing any F() update
+        # made since (apps/jobs/counters.py)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        update_fields = [*validated_data, 'updated_at']
+        if 'latitude' in validated_data or 'longitude' in validated_data:
+            update_fields.append('geohash')
+        instance.save(update_fields=update_fields)
+        return instance
 
 class JobCreateSerializer(serializers.ModelSerializer):
     invited_worker_id = serializers.IntegerField(required=False, allow_null=True)
@@ -37,9 +56,13 @@ class JobCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Job
         fields = [
-            'title', 'category', 'description', 'location', 'budget',
-            'deadline', 'invited_worker_id'
+            'title', 'category', 'description', 'location', 'latitude', 'longitude',
+            'budget', 'deadline', 'invited_worker_id'
         ]
+        extra_kwargs = {
+            'latitude': {'min_value': -90, 'max_value': 90},
+            'longitude': {'min_value': -180, 'max_value': 180},
+        }
     
     def validate_invited_worker_id(self, value):
         if value:
@@ -50,6 +73,23 @@ class JobCreateSerializer(serializers.ModelSerializer):
             except User.DoesNotExist:
                 raise serializers.ValidationError("Invited worker must exist and have worker role")
         return value
+    
+    def create(self, validated_data):
+        # Job has no column for the invitation; it is validated only
+        validated_data.pop('invited_worker_id', None)
+        return super().create(validated_data)
+
+class BulkJobCreateSerializer(JobCreateSerializer):
+    """
+    One job of a bulk import; invited workers are checked for the whole
+    batch at once (see ``bulk.create_jobs``) instead of one query per job.
+    """
+    def validate_invited_worker_id(self, value):
+        return value
+
+class BulkJobStatusSerializer(serializers.Serializer):
+    id = serializers.IntegerField(min_value=1)
+    status = serializers.ChoiceField(choices=Job.STATUS_CHOICES)
 
 class JobFeedSerializer(serializers.ModelSerializer):
     client = UserPublicSerializer(read_only=True)
@@ -60,3 +100,76 @@ class JobFeedSerializer(serializers.ModelSerializer):
             'id', 'client', 'title', 'category', 'description',
             'location', 'budget', 'deadline', 'status', 'created_at'
         ]
+
+class MockJobSerializer:
+    """
+    Fast path for the mock API ``Job`` payload (camelCase keys).
+
+    Reads plain ``.values()`` rows so no model instances, nested user
+    serializers or field introspection are involved; the output matches
+    what ``JobSerializer`` plus the old hand-written transform produced.
+    """
+    fields = (
+        'id', 'client_id', 'worker_id', 'title', 'description', 'category',
+        'location', 'budget', 'deadline', 'status', 'created_at',
+        'application_count', 'pending_application_count', 'rejected_application_count'
+    )
+    # Keys of the payload, in order (the CSV export header)
+    columns = (
+        'id', 'clientId', 'workerId', 'title', 'description', 'category',
+        'location', 'budget', 'deadline', 'status', 'createdAt',
+        'scheduledDate', 'completedDate', 'applicationCount',
+        'pendingApplicationCount', 'rejectedApplicationCount'
+    )
+
+    @classmethod
+    def values(cls, queryset, *extra):
+        """Restrict ``queryset`` to the columns the payload needs."""
+        return queryset.values(*cls.fields, *extra)
+
+    @classmethod
+    def row(cls, instance):
+        """Build a row from a model instance already in memory."""
+        return {name: getattr(instance, name) for name in cls.fields}
+
+    @staticmethod
+    def to_representation(row):
+        created_at = _format_datetime(row['created_at'])
+        deadline = row['deadline']
+        status = row['status']
+        return {
+            'id': row['id'],
+            'clientId': row['client_id'],
+            'workerId': row['worker_id'],
+            'title': row['title'],
+            'description': row['description'],
+            'category': row['category'],
+            'location': row['location'],
+            'budget': float(row['budget']),
+            'deadline': deadline.isoformat() if deadline is not None else None,
+            'status': status,
+            'createdAt': created_at,
+            'scheduledDate': None,
+            'completedDate': created_at if status == 'completed' else None,
+            'applicationCount': row['application_count'],
+            'pendingApplicationCount': row['pending_application_count'],
+            'rejectedApplicationCount': row['rejected_application_count']
+        }
+
+    @classmethod
+    def many(cls, rows):
+        to_representation = cls.to_representation
+        return [to_representation(row) for row in rows]
+
+
+def _format_datetime(value):
+    # Same output as DRF's DateTimeField: ISO 8601 in the current time zone
+    # with "Z" for UTC.
+    if value is None:
+        return None
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
@@ -0,0 +1,40 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from .models import Job
+from .feed import materialization_enabled, publish_job, withdraw_jobs, record_application
+from apps.applications.models import Application
+from jobboard_backend.geo import assign_geohash
+
+
+@receiver(pre_save, sender=Job)
+def set_job_geohash(sender, instance, **kwargs):
+    assign_geohash(instance)
+
+
+@receiver(post_save, sender=Job)
+def update_feed_on_job_save(sender, instance, created, **kwargs):
+    """Keep the materialized feed buckets in step with job status."""
+    if not materialization_enabled():
+        return
+    if instance.status == Job.STATUS_PENDING:
+        transaction.on_commit(partial(publish_job, instance))
+    elif not created:
+        transaction.on_commit(partial(withdraw_jobs, [instance]))
+
+
+@receiver(post_delete, sender=Job)
+def update_feed_on_job_delete(sender, instance, **kwargs):
+    if not materialization_enabled():
+        return
+    transaction.on_commit(partial(withdraw_jobs, [instance]))
+
+
+@receiver(post_save, sender=Application)
+def update_feed_on_application(sender, instance, created, **kwargs):
+    """Hide a job from the worker's materialized feed once they apply."""
+    if not materialization_enabled() or not created:
+        return
+    transaction.on_commit(partial(record_application, instance.worker_id, instance.job_id))
@@ -1,14 +1,26 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.generics import get_object_or_404
+from rest_framework.views import APIView
+from django.db import IntegrityError, transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Job
-from .serializers import JobSerializer, JobCreateSerializer, JobFeedSerializer
+from .serializers import JobSerializer, JobCreateSerializer, JobFeedSerializer, MockJobSerializer
 from .permissions import IsJobOwner, CanUpdateJobStatus
+from .feed import FEED_ORDERING, build_feed_queryset, paginate_feed
+from .bulk import BULK_JOB_LIMIT, StatusConflict, create_jobs, update_job_statuses
+from .counters import record_new_applications
+from .worker_jobs import WORKER_JOB_BUCKETS, bucket_page, bucket_summary
 from apps.applications.models import Application
-from apps.applications.serializers import ApplicationCreateSerializer
+from apps.applications.serializers import ApplicationCreateSerializer, MockApplicationSerializer
+from jobboard_backend.pagination import KeysetPagination
+from jobboard_backend.geo import nearest, parse_near, within_radius
+from jobboard_backend.conditional import Validator
+from jobboard_backend.export import stream_export
+from jobboard_backend.timing import TimedViewMixin, span
 
-class JobsViewSet(viewsets.ModelViewSet):
+class JobsViewSet(TimedViewMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing jobs.
     Supports CRUD operations with role-based permissions.
@@ -43,69 +55,63 @@ class JobsViewSet(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         # Set the client from the authenticated user
-        serializer.save(client=self.request.user)
+        serializer.save(client_id=self.request.user.id)
     
     def list(self, request, *args, **kwargs):
         """
         Override list to match mock API response format exactly.
+
+        Passing ``?cursor=`` (empty for the first page) switches to keyset
+        pagination on ``(created_at, id)`` and wraps the jobs in a
+        ``{'jobs': [...], 'pagination': {...}}`` envelope.
+
+        Answers ``If-None-Match`` with a 304 before any job is loaded.
         """
         queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        
-        # Transform to match mock API response structure
-        jobs_data = []
-        for item in serializer.data:
-            job_data = {
-                'id': item['id'],
-                'clientId': item['client']['id'],  # Mock has clientId
-                'workerId': item['worker']['id'] if item['worker'] else None,  # Mock has workerId
-                'title': item['title'],
-                'description': item['description'],
-                'category': item['category'],
-                'location': item['location'],
-                'budget': float(item['budget']),
-                'deadline': item['deadline'],
-                'status': item['status'],
-                'createdAt': item['created_at'],  # Mock has createdAt
-                'scheduledDate': None,  # Mock has scheduledDate
-                'completedDate': None if item['status'] != 'completed' else item['created_at']  # Mock has completedDate
-            }
-            jobs_data.append(job_data)
+        validator = Validator.for_queryset(request, queryset)
+        not_modified = validator.not_modified()
+        if not_modified is not None:
+            return not_modified
+        
+        queryset = MockJobSerializer.values(queryset)
+        paginator = None
+        if KeysetPagination.is_requested(request):
+            paginator = KeysetPagination(ordering=('-created_at', '-id'))
+            queryset = paginator.paginate_queryset(queryset, request)
+        
+        # Rows go straight to the mock API response structure
+        with span('serialize'):
+            jobs_data = MockJobSerializer.many(queryset)
         
-        return Response(jobs_data)
+        if paginator is not None:
+            return validator.apply(Response({
+                'jobs': jobs_data,
+                'pagination': paginator.get_pagination_data()
+            }))
+        
+        return validator.apply(Response(jobs_data))
     
     def retrieve(self, request, *args, **kwargs):
         """
         Override retrieve to match mock API response format exactly.
         """
         instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        data = serializer.data
-        
-        # Transform to match mock API response structure
-        job_data = {
-            'id': data['id'],
-            'clientId': data['client']['id'],
-            'workerId': data['worker']['id'] if data['worker'] else None,
-            'title': data['title'],
-            'description': data['description'],
-            'category': data['category'],
-            'location': data['location'],
-            'budget': float(data['budget']),
-            'deadline': data['deadline'],
-            'status': data['status'],
-            'createdAt': data['created_at'],
-            'scheduledDate': None,
-            'completedDate': None if data['status'] != 'completed' else data['created_at']
-        }
-        
-        return Response(job_data)
+        validator = Validator.for_instance(request, instance)
+        not_modified = validator.not_modified()
+        if not_modified is not None:
+            return not_modified
+        return validator.apply(Response(MockJobSerializer.to_representation(MockJobSerializer.row(instance))))
     
     @action(detail=False, methods=['get'], url_path='feed')
     def feed(self, request):
         """
         Get jobs feed for workers (pending jobs they can apply to).
         Matches mock API /api/v1/jobs?feed_for_worker_id=X
+
+        ``category`` is an exact match; ``?cursor=`` enables keyset paging
+        the same way as ``list``, served from the materialized feed when
+        ``FEED_MATERIALIZATION`` is on. ``?near=lat,lng[&radius_km=]``
+        returns the nearest ``limit`` jobs instead.
         """
         if request.user.role != 'worker':
             return Response(
@@ -113,49 +119,135 @@ class JobsViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Get pending jobs that the worker hasn't applied to
-        applied_job_ids = Application.objects.filter(
-            worker=request.user
-        ).values_list('job_id', flat=True)
+        category = request.query_params.get('category')
+        location = request.query_params.get('location')
         
-        queryset = Job.objects.filter(
-            status='pending'
-        ).exclude(
-            id__in=applied_job_ids
-        ).select_related('client').order_by('-created_at')
+        near = parse_near(request.query_params)
+        queryset = build_feed_queryset(request.user, category=category, location=location)
         
-        # Apply filters
-        category = request.query_params.get('category')
-        if category:
-            queryset = queryset.filter(category__icontains=category)
+        # The whole feed's validator also covers its pages and near views
+        validator = Validator.for_queryset(request, queryset)
+        not_modified = validator.not_modified()
+        if not_modified is not None:
+            return not_modified
         
-        location = request.query_params.get('location')
-        if location:
-            queryset = queryset.filter(location__icontains=location)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        
-        # Transform to match mock API response structure
-        jobs_data = []
-        for item in serializer.data:
-            job_data = {
-                'id': item['id'],
-                'clientId': item['client']['id'],
-                'workerId': None,  # Feed jobs don't have workers assigned
-                'title': item['title'],
-                'description': item['description'],
-                'category': item['category'],
-                'location': item['location'],
-                'budget': float(item['budget']),
-                'deadline': item['deadline'],
-                'status': item['status'],
-                'createdAt': item['created_at'],
-                'scheduledDate': None,
-                'completedDate': None
-            }
-            jobs_data.append(job_data)
+        paginator = None
+        if near is not None:
+            # Nearest pending jobs first, bounded to one page
+            latitude, longitude, radius_km = near
+            queryset = MockJobSerializer.values(queryset)
+            limit = KeysetPagination(ordering=FEED_ORDERING).get_limit(request)
+            if radius_km is None:
+                rows = nearest(queryset, latitude, longitude, limit)
+            else:
+                rows = list(within_radius(queryset, latitude, longitude, radius_km)[:limit])
+        elif KeysetPagination.is_requested(request):
+            paginator = KeysetPagination(ordering=FEED_ORDERING)
+            rows = paginate_feed(
+                paginator, request, MockJobSerializer.values(queryset),
+                category=category, location=location
+            )
+        else:
+            rows = MockJobSerializer.values(queryset)
+        
+        # Rows go straight to the mock API response structure
+        with span('serialize'):
+            jobs_data = MockJobSerializer.many(rows)
+            if near is not None:
+                for job_data, row in zip(jobs_data, rows):
+                    job_data['distanceKm'] = round(row['distance_km'], 3)
+        
+        if paginator is not None:
+            return validator.apply(Response({
+                'jobs': jobs_data,
+                'pagination': paginator.get_pagination_data()
+            }))
         
-        return Response(jobs_data)
+        return validator.apply(Response(jobs_data))
+    
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """
+        Stream the client's jobs, newest first, as NDJSON or (``?output=csv``)
+        CSV in the mock API shape; ``status``/``category`` filter as in list.
+        Staff may export any client's jobs with ``?client_id=``, or all jobs.
+        """
+        queryset = Job.objects.all()
+        if request.user.is_staff:
+            client_id = request.query_params.get('client_id')
+            if client_id:
+                queryset = queryset.filter(client_id=client_id)
+        elif request.user.role == 'client':
+            queryset = queryset.filter(client_id=request.user.id)
+        else:
+            return Response(
+                {"detail": "Only clients can export their jobs"}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        queryset = MockJobSerializer.values(self.filter_queryset(queryset).order_by(*FEED_ORDERING))
+        return stream_export(
+            request, queryset, MockJobSerializer.to_representation, MockJobSerializer.columns, 'jobs'
+        )
+    
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Create many jobs at once (clients only), all or nothing.
+        Body is a list of job payloads as for a single create; errors come
+        back as a list aligned with the input.
+        """
+        if request.user.role != 'client':
+            return Response(
+                {"detail": "Only clients can create jobs"}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        error = self._check_bulk_payload(request.data)
+        if error is not None:
+            return error
+        
+        jobs, errors = create_jobs(request.user.id, request.data)
+        if errors is not None:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({
+            'created': len(jobs),
+            'ids': [job.id for job in jobs]
+        }, status=status.HTTP_201_CREATED)
+    
+    @action(detail=False, methods=['patch'], url_path='bulk-status')
+    def bulk_status(self, request):
+        """
+        Change the status of many jobs at once, all or nothing.
+        Body is a list of ``{id, status}``; the same transition rules apply
+        as for a single update.
+        """
+        error = self._check_bulk_payload(request.data)
+        if error is not None:
+            return error
+        
+        try:
+            updated, errors = update_job_statuses(request.user, request.data)
+        except StatusConflict as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_409_CONFLICT)
+        if errors is not None:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({'updated': updated})
+    
+    def _check_bulk_payload(self, items):
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"detail": "Expected a non-empty list of jobs"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > BULK_JOB_LIMIT:
+            return Response(
+                {"detail": f"At most {BULK_JOB_LIMIT} jobs per request"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return None
     
     @action(detail=True, methods=['post'], url_path='applications')
     def applications(self, request, pk=None):
@@ -169,7 +261,9 @@ class JobsViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        job = self.get_object()
+        # Only the status is needed; get_object() would also check
+        # IsJobOwner, which no applying worker passes
+        job = get_object_or_404(Job.objects.only('id', 'status'), pk=pk)
         
         # Check if job is available for applications
         if job.status != 'pending':
@@ -178,39 +272,33 @@ class JobsViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Check if worker already applied
-        if Application.objects.filter(job=job, worker=request.user).exists():
+        serializer = ApplicationCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Insert first: the (job, worker) unique constraint is the
+        # duplicate check
+        try:
+            with transaction.atomic():
+                application = Application.objects.create(
+                    job_id=job.id,
+                    worker_id=request.user.id,
+                    **serializer.validated_data
+                )
+                record_new_applications([job.id])
+        except IntegrityError:
+            if not Application.objects.filter(job_id=job.id, worker_id=request.user.id).exists():
+                # The job was deleted in the meantime
+                raise
             return Response(
                 {"detail": "You have already applied to this job"}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        serializer = ApplicationCreateSerializer(
-            data=request.data,
-            context={'request': request, 'job_id': job.id}
-        )
+        # Return response in mock API format, from the values just written
+        response_data = MockApplicationSerializer.to_representation(MockApplicationSerializer.row(application))
         
-        if serializer.is_valid():
-            application = Application.objects.create(
-                job=job,
-                worker=request.user,
-                **serializer.validated_data
-            )
-            
-            # Return response in mock API format
-            response_data = {
-                'id': application.id,
-                'jobId': application.job.id,
-                'workerId': application.worker.id,
-                'message': application.message,
-                'quote': float(application.quote),
-                'status': application.status,
-                'createdAt': application.created_at.isoformat()
-            }
-            
-            return Response(response_data, status=status.HTTP_201_CREATED)
-        
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(response_data, status=status.HTTP_201_CREATED)
     
     @action(detail=True, methods=['post'], url_path='invitations')
     def invitations(self, request, pk=None):
@@ -240,29 +328,59 @@ class JobsViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Update job with invited worker
+        # Update job with invited worker; only updated_at is a column, and
+        # a full save would write back stale application counters
         job.invited_worker_id = worker_id
-        job.save()
+        job.save(update_fields=['updated_at'])
         
         # Return updated job in mock API format
-        serializer = self.get_serializer(job)
-        data = serializer.data
-        
-        job_data = {
-            'id': data['id'],
-            'clientId': data['client']['id'],
-            'workerId': data['worker']['id'] if data['worker'] else None,
-            'title': data['title'],
-            'description': data['description'],
-            'category': data['category'],
-            'location': data['location'],
-            'budget': float(data['budget']),
-            'deadline': data['deadline'],
-            'status': data['status'],
-            'createdAt': data['created_at'],
-            'scheduledDate': None,
-            'completedDate': None,
-            'invitedWorkerId': worker_id
-        }
+        job_data = MockJobSerializer.to_representation(MockJobSerializer.row(job))
+        job_data['completedDate'] = None
+        job_data['invitedWorkerId'] = worker_id
         
         return Response(job_data)
+
+
+class WorkerJobsView(TimedViewMixin, APIView):
+    """
+    A worker's assigned jobs grouped by status (matches mock API
+    ``/api/v1/worker/:id/jobs``, where ``:id`` is the worker's user id).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get(self, request, worker_id):
+        """
+        ``counts`` has the size of every bucket; ``buckets`` holds the first
+        keyset page of each, or with ``?status=`` only that bucket, paged
+        with ``?cursor=``/``?limit=``.
+        """
+        if request.user.id != worker_id and not request.user.is_staff:
+            return Response(
+                {"detail": "You can only view your own jobs"}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        statuses = WORKER_JOB_BUCKETS
+        requested = request.query_params.get('status')
+        if requested:
+            if requested not in WORKER_JOB_BUCKETS:
+                return Response(
+                    {"status": [f"Expected one of: {', '.join(WORKER_JOB_BUCKETS)}"]}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            statuses = (requested,)
+        
+        # The counts query doubles as the list validator
+        counts, last_modified = bucket_summary(worker_id)
+        validator = Validator(request, last_modified, sum(counts.values()))
+        not_modified = validator.not_modified()
+        if not_modified is not None:
+            return not_modified
+        
+        return validator.apply(Response({
+            'workerId': worker_id,
+            'counts': counts,
+            'buckets': {
+                bucket: bucket_page(worker_id, bucket, request, counts[bucket]) for bucket in statuses
+            }
+        }))
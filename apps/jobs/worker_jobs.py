@@ -0,0 +1,58 @@
+"""
+A worker's assigned jobs, bucketed by status.
+
+Every query here is answered by the ``(worker, status, created_at, id)``
+index: the per-bucket counts (and the list validator) come from a single
+GROUP BY over the worker's range of it, and each bucket page is a keyset
+range scan on its ``(worker, status)`` prefix.
+"""
+from django.db.models import Count, Max
+from .feed import FEED_ORDERING
+from .models import Job
+from .serializers import MockJobSerializer
+from jobboard_backend.pagination import KeysetPagination
+
+# Statuses a job can have once it is assigned, in display order
+WORKER_JOB_BUCKETS = (Job.STATUS_ACCEPTED, Job.STATUS_IN_PROGRESS, Job.STATUS_COMPLETED)
+
+
+def bucket_counts(worker_id):
+    """Size and newest ``updated_at`` of each of the worker's buckets, as a GROUP BY query."""
+    return (
+        Job.objects.filter(worker_id=worker_id, status__in=WORKER_JOB_BUCKETS)
+        .order_by().values('status').annotate(count=Count('pk'), last_modified=Max('updated_at'))
+    )
+
+
+def bucket_summary(worker_id):
+    """``({status: count}, newest updated_at)`` over the worker's bucketed jobs."""
+    counts = dict.fromkeys(WORKER_JOB_BUCKETS, 0)
+    stamps = []
+    for row in bucket_counts(worker_id):
+        counts[row['status']] = row['count']
+        stamps.append(row['last_modified'])
+    return counts, max(stamps) if stamps else None
+
+
+def bucket_queryset(worker_id, status):
+    """The worker's jobs in ``status``, newest first."""
+    return Job.objects.filter(worker_id=worker_id, status=status).order_by(*FEED_ORDERING)
+
+
+def bucket_page(worker_id, status, request, count):
+    """
+    One keyset page (``?cursor=``/``?limit=``) of the worker's jobs in
+    ``status``; ``count`` is the bucket size, empty buckets are not queried.
+    """
+    paginator = KeysetPagination(ordering=FEED_ORDERING)
+    if count:
+        rows = paginator.paginate_queryset(
+            MockJobSerializer.values(bucket_queryset(worker_id, status)), request
+        )
+    else:
+        paginator.limit = paginator.get_limit(request)
+        rows = []
+    return {
+        'jobs': MockJobSerializer.many(rows),
+        'pagination': paginator.get_pagination_data()
+    }
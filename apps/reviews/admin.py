@@ -0,0 +1,44 @@
+from django.contrib import admin
+from django.db import transaction
+from django.utils import timezone
+from .models import Review
+from .ratings import recompute
+from apps.workers.models import WorkerProfile
+from apps.workers.views import worker_cache
+
+@admin.register(Review)
+class ReviewAdmin(admin.ModelAdmin):
+    list_display = ('job', 'client', 'worker', 'rating', 'created_at')
+    list_filter = ('rating', 'created_at')
+    search_fields = ('job__title', 'client__email', 'worker__email', 'comment')
+    ordering = ('-created_at',)
+    
+    fieldsets = (
+        ('Review', {'fields': ('job', 'client', 'worker', 'rating', 'comment')}),
+        ('Timestamps', {'fields': ('created_at',)}),
+    )
+    
+    # Reviews come from the API; only the comment may be moderated here,
+    # so the worker ratings cannot drift from the reviews
+    readonly_fields = ('job', 'client', 'worker', 'rating', 'created_at')
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Worker payloads embed the latest reviews
+        WorkerProfile.objects.filter(user_id=obj.worker_id).update(updated_at=timezone.now())
+        transaction.on_commit(worker_cache.invalidate)
+    
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        recompute(WorkerProfile.objects.filter(user_id=obj.worker_id))
+    
+    def delete_queryset(self, request, queryset):
+        worker_ids = list(queryset.values_list('worker_id', flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        recompute(WorkerProfile.objects.filter(user_id__in=worker_ids))
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('job', 'client', 'worker')
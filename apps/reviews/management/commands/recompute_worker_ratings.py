@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from apps.reviews.ratings import recompute
+from apps.workers.models import WorkerProfile
+
+
+class Command(BaseCommand):
+    help = 'Rebuild worker ratings and review counts from their legacy share and the reviews, fixing any that drifted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help='Profiles recomputed per statement.')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many profiles drifted.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        drifted = 0
+        checked = 0
+        last_id = 0
+        # Walk the table in primary key ranges so no statement holds locks
+        # on more than one batch of profiles
+        while True:
+            profile_ids = list(
+                WorkerProfile.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not profile_ids:
+                break
+            batch = WorkerProfile.objects.filter(id__gte=profile_ids[0], id__lte=profile_ids[-1])
+            drifted += recompute(batch, dry_run=options['dry_run'])
+            checked += len(profile_ids)
+            last_id = profile_ids[-1]
+
+        action = 'would be fixed' if options['dry_run'] else 'fixed'
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} profiles; {drifted} with drifted ratings {action}.'))
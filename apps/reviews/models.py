@@ -0,0 +1,32 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+from django.conf import settings
+from apps.jobs.models import Job
+
+class Review(models.Model):
+	RATING_MIN = 1
+	RATING_MAX = 5
+
+	# One review per job, left by its client for the assigned worker
+	job = models.OneToOneField(Job, on_delete=models.CASCADE, related_name="review")
+	client = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="reviews_given")
+	# Served by the (worker, created_at) index in Meta
+	worker = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="reviews_received", db_index=False)
+	rating = models.PositiveSmallIntegerField(validators=[MinValueValidator(RATING_MIN), MaxValueValidator(RATING_MAX)])
+	comment = models.TextField(blank=True)
+	created_at = models.DateTimeField(auto_now_add=True)
+
+	class Meta:
+		indexes = [
+			# A worker's reviews, newest first
+			models.Index(fields=["worker", "-created_at", "-id"], name="review_worker_created_idx"),
+		]
+		constraints = [
+			models.CheckConstraint(
+				condition=models.Q(rating__gte=1, rating__lte=5),
+				name="review_rating_range",
+			),
+		]
+
+	def __str__(self) -> str:
+		return f"Review<{self.job_id}: {self.rating}>"
@@ -0,0 +1,89 @@
+"""
+Worker ratings maintained from reviews.
+
+``WorkerProfile`` keeps ``rating_sum`` and ``review_count`` next to the
+``rating`` it serves, so a new review folds into the mean with one
+constant-cost UPDATE in the review's transaction instead of re-aggregating
+the worker's reviews. The worker browse order (``-rating, -review_count``)
+therefore always reads indexed, up-to-date columns.
+
+``manage.py recompute_worker_ratings`` rebuilds the columns from the
+reviews for backfills and after writes that bypass ``record_review``. The
+ratings profiles carried before reviews were stored (``legacy_rating_sum``
+and ``legacy_review_count``, set by migration workers/0007) stay part of
+the mean.
+"""
+from django.db import transaction
+from django.db.models import (
+    Case, Count, DecimalField, Exists, F, FloatField, OuterRef, Q, Subquery, Sum, Value, When,
+)
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+from .models import Review
+from apps.workers.models import WorkerProfile
+from apps.workers.views import worker_cache
+
+def _rating_field():
+    field = WorkerProfile._meta.get_field('rating')
+    return DecimalField(max_digits=field.max_digits, decimal_places=field.decimal_places)
+
+
+def mean_rating(total, count):
+    """``total / count`` as a ``rating`` value; ``count`` must not be zero."""
+    return Cast(Cast(total, FloatField()) / count, _rating_field())
+
+
+def record_review(worker_id, rating):
+    """
+    Fold one new ``rating`` into the worker's profile. Every SET expression
+    reads the row's values from before the update.
+    """
+    updated = WorkerProfile.objects.filter(user_id=worker_id).update(
+        rating_sum=F('rating_sum') + rating,
+        review_count=F('review_count') + 1,
+        rating=mean_rating(F('rating_sum') + rating, F('review_count') + 1),
+        # Cached worker payloads and their validators include the rating
+        updated_at=timezone.now(),
+    )
+    if updated:
+        transaction.on_commit(worker_cache.invalidate)
+    return updated
+
+
+def _aggregate(function):
+    aggregated = (
+        Review.objects.filter(worker_id=OuterRef('user_id'))
+        .order_by().values('worker_id').annotate(total=function('rating')).values('total')
+    )
+    return Coalesce(Subquery(aggregated), 0)
+
+
+def recompute(queryset, dry_run=False):
+    """
+    Rebuild the rating columns of the profiles in ``queryset`` whose
+    ``rating_sum`` or ``review_count`` disagree with their legacy share plus
+    their reviews, in two statements; returns how many did.
+    """
+    drifted = ~Q(rating_sum=F('actual_sum')) | ~Q(review_count=F('actual_count'))
+    profile_ids = list(
+        queryset.annotate(
+            actual_sum=F('legacy_rating_sum') + _aggregate(Sum),
+            actual_count=F('legacy_review_count') + _aggregate(Count),
+        ).filter(drifted).values_list('id', flat=True)
+    )
+    if profile_ids and not dry_run:
+        actual_sum = F('legacy_rating_sum') + _aggregate(Sum)
+        actual_count = F('legacy_review_count') + _aggregate(Count)
+        WorkerProfile.objects.filter(id__in=profile_ids).update(
+            rating_sum=actual_sum,
+            review_count=actual_count,
+            # Profiles with neither legacy ratings nor reviews go back to the default
+            rating=Case(
+                When(Q(legacy_review_count__gt=0) | Exists(Review.objects.filter(worker_id=OuterRef('user_id'))),
+                     then=mean_rating(actual_sum, actual_count)),
+                default=Value(0, output_field=_rating_field()),
+            ),
+            updated_at=timezone.now(),
+        )
+        transaction.on_commit(worker_cache.invalidate)
+    return len(profile_ids)
@@ -0,0 +1,71 @@
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from rest_framework import serializers
+from .models import Review
+from jobboard_backend.async_db import fetch
+
+class ReviewCreateSerializer(serializers.ModelSerializer):
+    """Body of ``POST /api/v1/reviews``; the worker is the job's assignee."""
+    jobId = serializers.IntegerField(source='job_id', min_value=1)
+    
+    class Meta:
+        model = Review
+        fields = ['jobId', 'rating', 'comment']
+
+class MockReviewSerializer:
+    """
+    Mock API ``Review`` payload from plain rows, like
+    ``MockApplicationSerializer``; ``client`` is the reviewer's name.
+    """
+    fields = ('id', 'job_id', 'worker_id', 'client_id', 'client__name', 'rating', 'comment', 'created_at')
+    
+    @classmethod
+    def values(cls, queryset):
+        return queryset.values(*cls.fields)
+    
+    @classmethod
+    def latest_by_worker(cls, worker_ids, per_worker):
+        """
+        The newest ``per_worker`` reviews of each worker (user ids), in one
+        query ranking each worker's reviews with ROW_NUMBER, as
+        ``{worker_id: [payload, ...]}``.
+        """
+        return cls._group(cls._latest(worker_ids, per_worker))
+    
+    @classmethod
+    async def alatest_by_worker(cls, worker_ids, per_worker):
+        """``latest_by_worker`` for async views."""
+        return cls._group(await fetch(cls._latest(worker_ids, per_worker)))
+    
+    @classmethod
+    def _latest(cls, worker_ids, per_worker):
+        ranked = (
+            Review.objects.filter(worker_id__in=worker_ids)
+            .annotate(position=Window(
+                RowNumber(), partition_by=F('worker_id'), order_by=(F('created_at').desc(), F('id').desc())
+            ))
+            .filter(position__lte=per_worker)
+            .order_by('worker_id', 'position')
+        )
+        return cls.values(ranked)
+    
+    @classmethod
+    def _group(cls, rows):
+        reviews = {}
+        for row in rows:
+            reviews.setdefault(row['worker_id'], []).append(cls.to_representation(row))
+        return reviews
+    
+    @staticmethod
+    def to_representation(row):
+        return {
+            'id': row['id'],
+            'jobId': row['job_id'],
+            'workerId': row['worker_id'],
+            'clientId': row['client_id'],
+            'client': row['client__name'],
+            'rating': row['rating'],
+            'comment': row['comment'],
+            'date': row['created_at'].date().isoformat(),
+            'createdAt': row['created_at'].isoformat()
+        }
@@ -0,0 +1,65 @@
+from django.db import IntegrityError, transaction
+from rest_framework import viewsets, permissions, status
+from rest_framework.response import Response
+from .models import Review
+from .ratings import record_review
+from .serializers import ReviewCreateSerializer, MockReviewSerializer
+from apps.jobs.models import Job
+from jobboard_backend.timing import TimedViewMixin
+
+class ReviewsViewSet(TimedViewMixin, viewsets.GenericViewSet):
+    """
+    Reviews left by clients for the worker who completed their job
+    (matches mock API ``POST /api/v1/reviews``).
+    """
+    queryset = Review.objects.all()
+    serializer_class = ReviewCreateSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def create(self, request, *args, **kwargs):
+        """
+        Review a completed job. The worker's rating is updated in the same
+        transaction (see ``ratings.record_review``); a second review of the
+        job is rejected by the one-review-per-job constraint.
+        """
+        if request.user.role != 'client':
+            return Response(
+                {"detail": "Only clients can leave reviews"}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        job = Job.objects.filter(pk=data['job_id']).values('client_id', 'worker_id', 'status').first()
+        if job is None:
+            return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+        if job['client_id'] != request.user.id:
+            return Response(
+                {"detail": "You can only review your own jobs"}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        if job['status'] != Job.STATUS_COMPLETED or job['worker_id'] is None:
+            return Response(
+                {"detail": "Only completed jobs can be reviewed"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            with transaction.atomic():
+                review = Review.objects.create(
+                    client_id=request.user.id, worker_id=job['worker_id'], **data
+                )
+                record_review(review.worker_id, review.rating)
+        except IntegrityError:
+            if not Review.objects.filter(job_id=data['job_id']).exists():
+                raise
+            return Response(
+                {"detail": "This job has already been reviewed"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        row = {name: getattr(review, name) for name in MockReviewSerializer.fields if name != 'client__name'}
+        row['client__name'] = request.user.name
+        return Response(MockReviewSerializer.to_representation(row), status=status.HTTP_201_CREATED)
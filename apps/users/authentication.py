@@ -0,0 +1,79 @@
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser as BaseTokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# User fields copied into every token so that most requests can be served
+# without loading the User row.
+TOKEN_USER_CLAIMS = ('role', 'name', 'email', 'is_staff')
+
+
+def stamp_claims(token, user):
+    """Copy ``TOKEN_USER_CLAIMS`` from ``user`` into ``token``."""
+    for claim in TOKEN_USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    return token
+
+
+def tokens_for_user(user):
+    """Issue a refresh token (and its access token) carrying the user claims."""
+    return stamp_claims(RefreshToken.for_user(user), user)
+
+
+class TokenUser(BaseTokenUser):
+    """
+    Lightweight user built from token claims.
+
+    Compares equal to the ``User`` instance with the same primary key, so
+    object permissions such as ``obj.client == request.user`` keep working.
+    Use ``request.user.id`` rather than the object itself in ORM filters
+    and assignments; ``instance`` loads the full model when it is needed.
+    """
+
+    @cached_property
+    def role(self):
+        return self.token.get('role')
+
+    @cached_property
+    def name(self):
+        return self.token.get('name', '')
+
+    @cached_property
+    def email(self):
+        return self.token.get('email', '')
+
+    @cached_property
+    def instance(self):
+        from .models import User
+        return User.objects.get(pk=self.id)
+
+    def __eq__(self, other):
+        other_pk = getattr(other, 'pk', None)
+        if other_pk is None:
+            return NotImplemented
+        return str(self.pk) == str(other_pk)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(str(self.pk))
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that trusts the token claims instead of loading the
+    user on every request.
+
+    Tokens issued before the claims were added fall back to the regular
+    database lookup. The claims are trusted for the access token's short
+    lifetime only: refreshing (``TokenRefreshSerializer``) reloads the user,
+    refuses inactive ones and re-stamps the claims.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token or 'role' not in validated_token:
+            return super().get_user(validated_token)
+        return TokenUser(validated_token)
@@ -1,7 +1,38 @@
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer as BaseTokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from .authentication import stamp_claims
 from .models import User
 
 class UserPublicSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ["id", "email", "name", "role"]
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    """
+    Refresh that reloads the user: deleted and inactive users are refused,
+    and the new tokens carry the user's current claims (role, staff...)
+    instead of copies of the ones stamped at login.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh.get(api_settings.USER_ID_CLAIM)}
+        ).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed("User is inactive or no longer exists", code="user_inactive")
+        stamp_claims(refresh, user)
+
+        data = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION and hasattr(refresh, "blacklist"):
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
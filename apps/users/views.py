@@ -1,8 +1,10 @@
 from rest_framework import permissions, views, status
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenRefreshView
 from django.contrib.auth import authenticate
-from .serializers import UserPublicSerializer
+from .serializers import TokenRefreshSerializer, UserPublicSerializer
+from .authentication import tokens_for_user
+from jobboard_backend import metrics
 
 class LoginView(views.APIView):
 	permission_classes = [permissions.AllowAny]
@@ -12,10 +14,17 @@ class LoginView(views.APIView):
 		password = request.data.get("password")
 		user = authenticate(request, email=email, password=password)
 		if not user:
+			metrics.inc('jobboard_login_attempts_total', {'outcome': 'failure'})
 			return Response({"detail": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
-		refresh = RefreshToken.for_user(user)
+		metrics.inc('jobboard_login_attempts_total', {'outcome': 'success'})
+		refresh = tokens_for_user(user)
 		return Response({
 			"access": str(refresh.access_token),
 			"refresh": str(refresh),
 			"user": UserPublicSerializer(user).data
 		})
+
+
+class RefreshView(TokenRefreshView):
+	"""Token refresh that reloads the user (see ``TokenRefreshSerializer``)."""
+	serializer_class = TokenRefreshSerializer
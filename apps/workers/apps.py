@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class WorkersConfig(AppConfig):
+    name = 'apps.workers'
+    label = 'workers'
+
+    def ready(self):
+        # Register the geohash and search index signal handlers
+        from . import signals  # noqa: F401
@@ -0,0 +1,60 @@
+"""Async-native worker list (see ``jobboard_backend/async_views.py``)."""
+from functools import partial
+
+from .models import WorkerProfile
+from .views import WORKER_ORDERING, WORKER_REVIEWS_LIMIT, WorkersViewSet, worker_cache
+from apps.reviews.serializers import MockReviewSerializer
+from jobboard_backend.async_db import fetch
+from jobboard_backend.async_views import Fallback, async_read_view, render
+from jobboard_backend.conditional import Validator
+from jobboard_backend.geo import parse_near
+from jobboard_backend.pagination import KeysetPagination, acount_queryset
+
+
+@async_read_view(WorkersViewSet, {'get': 'list'})
+async def worker_list(request, view):
+    """
+    ``WorkersViewSet.list`` for browsing and filtering, sharing its
+    response cache entries; searches (``?q=``) and ``?near=`` go to the
+    sync view.
+    """
+    if request.query_params.get('q', '').strip() or parse_near(request.query_params) is not None:
+        raise Fallback
+    try:
+        page = int(request.query_params.get('page', 1))
+        limit = int(request.query_params.get('limit', 10))
+    except ValueError:
+        raise Fallback
+    
+    validator = await Validator.afor_queryset(
+        request, view.filter_queryset(WorkerProfile.objects.filter(available=True))
+    )
+    not_modified = validator.not_modified()
+    if not_modified is not None:
+        return not_modified
+    
+    key = worker_cache.make_key('list', request.query_params)
+    data = await worker_cache.aget_or_compute(key, partial(_list_data, request, view, page, limit))
+    return validator.apply(render(data))
+
+
+async def _list_data(request, view, page, limit):
+    queryset = view.filter_queryset(view.get_queryset())
+    
+    paginator = None
+    if KeysetPagination.is_requested(request):
+        paginator = KeysetPagination(ordering=WORKER_ORDERING)
+        instances = await paginator.apaginate_queryset(queryset, request)
+        limit = paginator.limit
+    else:
+        start = (page - 1) * limit
+        instances = await fetch(queryset[start:start + limit])
+    
+    reviews = await MockReviewSerializer.alatest_by_worker(
+        [instance.user_id for instance in instances], WORKER_REVIEWS_LIMIT
+    )
+    total = view._known_total(instances, page, limit, paginator, None)
+    if total is None:
+        total = await acount_queryset(queryset)
+    
+    return view._list_envelope(instances, reviews, None, page, limit, total, paginator)
@@ -2,7 +2,10 @@ import django_filters
 from .models import WorkerProfile
 
 class WorkerProfileFilter(django_filters.FilterSet):
-    category = django_filters.CharFilter(lookup_expr='icontains')
+    # Exact match on category (index-friendly, as in the mock API); location
+    # stays a substring match, served on PostgreSQL by the trigram index on
+    # UPPER(location), the expression icontains compiles to
+    category = django_filters.CharFilter(lookup_expr='exact')
     location = django_filters.CharFilter(lookup_expr='icontains')
     available = django_filters.BooleanFilter()
     min_hourly_rate = django_filters.NumberFilter(field_name='hourly_rate', lookup_expr='gte')
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:24
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+POSTGRES_FORWARD = [
+    "CREATE INDEX workerprofile_search_idx ON workers_workerprofile USING gin (search_vector)",
+    "CREATE INDEX workerprofile_location_trgm_idx ON workers_workerprofile USING gin (location gin_trgm_ops)",
+    """
+    UPDATE workers_workerprofile p SET search_vector =
+        setweight(to_tsvector('english', coalesce(u.name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(p.category, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(p.location, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(p.skills::text, '')), 'C')
+    FROM users_user u WHERE u.id = p.user_id
+    """,
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS workerprofile_location_trgm_idx",
+    "DROP INDEX IF EXISTS workerprofile_search_idx",
+]
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE workers_workerprofile_fts USING fts5(name, category, location, skills, tokenize='unicode61')",
+    """
+    INSERT INTO workers_workerprofile_fts (rowid, name, category, location, skills)
+    SELECT p.id, u.name, p.category, p.location, p.skills
+    FROM workers_workerprofile p JOIN users_user u ON u.id = p.user_id
+    """,
+]
+SQLITE_BACKWARD = [
+    "DROP TABLE IF EXISTS workers_workerprofile_fts",
+]
+
+
+def run_for_vendor(postgres, sqlite):
+    def run(apps, schema_editor):
+        statements = {'postgresql': postgres, 'sqlite': sqlite}.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0001_initial'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='workerprofile',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            run_for_vendor(POSTGRES_FORWARD, SQLITE_FORWARD),
+            run_for_vendor(POSTGRES_BACKWARD, SQLITE_BACKWARD),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0002_workerprofile_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workerprofile',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=12),
+        ),
+        migrations.AddField(
+            model_name='workerprofile',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='workerprofile',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0004_workerprofile_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workerprofile',
+            index=models.Index(condition=models.Q(('available', True)), fields=['-rating', '-review_count', 'id'], name='worker_browse_idx'),
+        ),
+    ]
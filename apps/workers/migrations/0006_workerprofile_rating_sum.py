@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:52
+
+from django.db import migrations, models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast, Round
+
+
+def derive_rating_sum(apps, schema_editor):
+    # Keep the existing ratings: later reviews extend their means
+    WorkerProfile = apps.get_model('workers', 'WorkerProfile')
+    WorkerProfile.objects.using(schema_editor.connection.alias).update(
+        rating_sum=Round(Cast(F('rating'), FloatField()) * F('review_count'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0005_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workerprofile',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(derive_rating_sum, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-17 14:05
+
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, Greatest
+
+
+def derive_legacy_ratings(apps, schema_editor):
+    # Whatever the counters hold beyond the Review rows predates them
+    WorkerProfile = apps.get_model('workers', 'WorkerProfile')
+    Review = apps.get_model('reviews', 'Review')
+
+    def aggregate(function):
+        aggregated = (
+            Review.objects.filter(worker_id=OuterRef('user_id'))
+            .order_by().values('worker_id').annotate(total=function('rating')).values('total')
+        )
+        return Coalesce(Subquery(aggregated), 0)
+
+    WorkerProfile.objects.using(schema_editor.connection.alias).update(
+        legacy_rating_sum=Greatest(F('rating_sum') - aggregate(Sum), 0),
+        legacy_review_count=Greatest(F('review_count') - aggregate(Count), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+        ('workers', '0006_workerprofile_rating_sum'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workerprofile',
+            name='legacy_rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='workerprofile',
+            name='legacy_review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(derive_legacy_ratings, migrations.RunPython.noop),
+    ]
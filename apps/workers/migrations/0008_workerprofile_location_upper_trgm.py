@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-17 14:30
+
+from django.db import migrations
+
+# ``location__icontains`` compiles to ``UPPER(location::text) LIKE UPPER(%s)``
+# on PostgreSQL; only a trigram index on that same expression can serve it.
+# The plain ``workerprofile_location_trgm_idx`` stays for the similarity
+# search on the raw column (search.py).
+POSTGRES_FORWARD = [
+    "CREATE INDEX workerprofile_location_upper_trgm_idx ON workers_workerprofile USING gin (UPPER(location::text) gin_trgm_ops)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS workerprofile_location_upper_trgm_idx",
+]
+
+
+def run_for_vendor(postgres):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == 'postgresql':
+            for statement in postgres:
+                schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0007_workerprofile_legacy_ratings'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_for_vendor(POSTGRES_FORWARD), run_for_vendor(POSTGRES_BACKWARD)),
+    ]
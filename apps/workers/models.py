@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.conf import settings
 
@@ -8,9 +9,37 @@ class WorkerProfile(models.Model):
 	hourly_rate = models.DecimalField(max_digits=10, decimal_places=2)
 	rating = models.DecimalField(max_digits=3, decimal_places=2, default=0)
 	review_count = models.IntegerField(default=0)
+	# Sum of the review ratings; ``rating`` is kept at rating_sum / review_count
+	# by apps/reviews/ratings.py
+	rating_sum = models.PositiveIntegerField(default=0, editable=False)
+	# Share of rating_sum / review_count from before there were Review rows;
+	# recomputing from the reviews adds onto it instead of dropping it
+	legacy_rating_sum = models.PositiveIntegerField(default=0, editable=False)
+	legacy_review_count = models.PositiveIntegerField(default=0, editable=False)
 	skills = models.JSONField(default=list, blank=True)
 	portfolio = models.JSONField(default=list, blank=True)
 	available = models.BooleanField(default=True)
+	updated_at = models.DateTimeField(auto_now=True)
+	# Coordinates for proximity search; geohash is derived on save
+	# (jobboard_backend/geo.py)
+	latitude = models.FloatField(null=True, blank=True)
+	longitude = models.FloatField(null=True, blank=True)
+	geohash = models.CharField(max_length=12, blank=True, default="", db_index=True, editable=False)
+	# Weighted name/category/location/skills document, maintained by
+	# apps/workers/search.py (PostgreSQL only; SQLite uses an FTS5 table)
+	search_vector = SearchVectorField(null=True, editable=False)
+
+	class Meta:
+		indexes = [
+			# Browse order of available workers (WORKER_ORDERING). Partial
+			# rather than leading with ``available``: the filter compiles to a
+			# bare ``WHERE available``, which SQLite only matches this way
+			models.Index(
+				fields=["-rating", "-review_count", "id"],
+				condition=models.Q(available=True),
+				name="worker_browse_idx",
+			),
+		]
 
 	def __str__(self) -> str:
 		return f"WorkerProfile<{self.user_id}>"
@@ -0,0 +1,118 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db import connections, router
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Coalesce
+from .models import WorkerProfile
+
+# PostgreSQL text search configuration used both for the stored vector and
+# for parsing ``?q=``; they must match for the GIN index to be used.
+SEARCH_CONFIG = 'english'
+
+# Minimum pg_trgm similarity for a fuzzy location match (the ``%`` operator
+# default, so the trigram GIN index can serve it).
+LOCATION_SIMILARITY = 0.3
+
+# SQLite FTS5 table mirroring name/category/location/skills; rowid is the
+# WorkerProfile id. Created by migration 0002.
+FTS_TABLE = 'workers_workerprofile_fts'
+
+# bm25 column weights for the FTS5 table, mirroring the A/A/B/C weights of
+# the PostgreSQL vector.
+FTS_WEIGHTS = (10.0, 10.0, 4.0, 2.0)
+
+
+def search_workers(queryset, query, ordering=()):
+    """
+    Filter ``queryset`` to profiles matching ``query`` and order them by
+    relevance, then by ``ordering``.
+
+    PostgreSQL uses the weighted ``search_vector`` plus trigram similarity
+    on location; SQLite uses the FTS5 mirror table with prefix matching.
+    """
+    vendor = connections[queryset.db].vendor
+    if vendor == 'postgresql':
+        queryset = _search_postgres(queryset, query)
+    elif vendor == 'sqlite':
+        queryset = _search_sqlite(queryset, query)
+    else:
+        queryset = _search_fallback(queryset, query)
+    return queryset.order_by('-search_rank', *ordering)
+
+
+def _search_postgres(queryset, query):
+    search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+    return queryset.filter(
+        Q(search_vector=search_query) | Q(location__trigram_similar=query)
+    ).annotate(
+        search_rank=Coalesce(SearchRank(F('search_vector'), search_query), Value(0.0))
+        + TrigramSimilarity('location', query)
+    )
+
+
+def _search_sqlite(queryset, query):
+    match = fts_match_expression(query)
+    if not match:
+        return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+    table = WorkerProfile._meta.db_table
+    weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+    return queryset.filter(
+        id__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match])
+    ).annotate(
+        search_rank=RawSQL(
+            f'SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = "{table}"."id"',
+            [match],
+            output_field=FloatField(),
+        )
+    )
+
+
+def _search_fallback(queryset, query):
+    condition = Q()
+    for term in query.split():
+        condition &= (
+            Q(user__name__icontains=term) | Q(category__icontains=term) | Q(location__icontains=term)
+        )
+    return queryset.filter(condition).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+def fts_match_expression(query):
+    """Turn free text into an FTS5 query of quoted prefix terms (AND-ed)."""
+    terms = re.findall(r'\w+', query.lower())
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def update_search_index(profile_ids):
+    """
+    Refresh the search data of the given profiles.
+
+    Ids of deleted profiles are accepted; on SQLite their FTS rows are
+    removed.
+    """
+    profile_ids = list(profile_ids)
+    if not profile_ids:
+        return
+    connection = connections[router.db_for_write(WorkerProfile)]
+    if connection.vendor == 'postgresql':
+        from apps.users.models import User
+        name = Subquery(User.objects.filter(pk=OuterRef('user_id')).values('name')[:1])
+        WorkerProfile.objects.filter(id__in=profile_ids).update(search_vector=(
+            SearchVector(name, weight='A', config=SEARCH_CONFIG)
+            + SearchVector('category', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('location', weight='B', config=SEARCH_CONFIG)
+            + SearchVector(Cast('skills', TextField()), weight='C', config=SEARCH_CONFIG)
+        ))
+    elif connection.vendor == 'sqlite':
+        placeholders = ', '.join(['%s'] * len(profile_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})', profile_ids)
+            cursor.execute(
+                f'INSERT INTO {FTS_TABLE} (rowid, name, category, location, skills) '
+                f'SELECT p.id, u.name, p.category, p.location, p.skills '
+                f'FROM workers_workerprofile p JOIN users_user u ON u.id = p.user_id '
+                f'WHERE p.id IN ({placeholders})',
+                profile_ids,
+            )
@@ -9,10 +9,14 @@ class WorkerProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = WorkerProfile
         fields = [
-            'id', 'user', 'user_id', 'category', 'location', 'hourly_rate',
-            'rating', 'review_count', 'skills', 'portfolio', 'available'
+            'id', 'user', 'user_id', 'category', 'location', 'latitude', 'longitude',
+            'hourly_rate', 'rating', 'review_count', 'skills', 'portfolio', 'available'
         ]
         read_only_fields = ['id', 'rating', 'review_count']
+        extra_kwargs = {
+            'latitude': {'min_value': -90, 'max_value': 90},
+            'longitude': {'min_value': -180, 'max_value': 180},
+        }
     
     def validate_user_id(self, value):
         from apps.users.models import User
@@ -33,6 +37,6 @@ class WorkerProfileListSerializer(serializers.ModelSerializer):
     class Meta:
         model = WorkerProfile
         fields = [
-            'id', 'user', 'category', 'location', 'hourly_rate',
-            'rating', 'review_count', 'available'
+            'id', 'user', 'category', 'location', 'latitude', 'longitude',
+            'hourly_rate', 'rating', 'review_count', 'available'
         ]
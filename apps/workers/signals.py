@@ -0,0 +1,57 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from .models import WorkerProfile
+from .search import update_search_index
+from .views import worker_cache
+from apps.reviews.models import Review
+from jobboard_backend.geo import assign_geohash
+
+
+@receiver(pre_save, sender=WorkerProfile)
+def set_profile_geohash(sender, instance, **kwargs):
+    assign_geohash(instance)
+
+
+@receiver(post_save, sender=WorkerProfile)
+@receiver(post_delete, sender=WorkerProfile)
+def update_search_on_profile_change(sender, instance, **kwargs):
+    """Re-index a profile after it is saved or deleted."""
+    transaction.on_commit(partial(update_search_index, [instance.id]))
+
+
+@receiver(post_save, sender=WorkerProfile)
+@receiver(post_delete, sender=WorkerProfile)
+def invalidate_worker_cache(sender, instance, **kwargs):
+    transaction.on_commit(worker_cache.invalidate)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def update_search_on_user_rename(sender, instance, update_fields=None, **kwargs):
+    """The worker's name is part of the search document."""
+    if instance.role != 'worker':
+        return
+    if update_fields is not None and 'name' not in update_fields:
+        return
+    profile_ids = list(WorkerProfile.objects.filter(user_id=instance.id).values_list('id', flat=True))
+    transaction.on_commit(partial(update_search_index, profile_ids))
+    if profile_ids:
+        # Cached worker payloads and their validators include the name as well
+        WorkerProfile.objects.filter(id__in=profile_ids).update(updated_at=timezone.now())
+        transaction.on_commit(worker_cache.invalidate)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def touch_reviewed_workers_on_client_rename(sender, instance, update_fields=None, **kwargs):
+    """Worker payloads embed reviews under the reviewing client's name."""
+    if instance.role != 'client':
+        return
+    if update_fields is not None and 'name' not in update_fields:
+        return
+    reviewed = Review.objects.filter(client_id=instance.id).values('worker_id')
+    if WorkerProfile.objects.filter(user_id__in=reviewed).update(updated_at=timezone.now()):
+        transaction.on_commit(worker_cache.invalidate)
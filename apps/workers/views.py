@@ -1,3 +1,8 @@
+import hashlib
+import json
+from functools import partial
+
+from django.http import Http404, HttpResponse
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -5,13 +10,46 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import WorkerProfile
 from .serializers import WorkerProfileSerializer, WorkerProfileListSerializer
 from .filters import WorkerProfileFilter
+from .search import search_workers
+from apps.reviews.serializers import MockReviewSerializer
+from jobboard_backend.pagination import KeysetPagination, count_queryset
+from jobboard_backend.geo import nearest, parse_near, within_radius
+from jobboard_backend.cache import ResponseCache, cache_stats
+from jobboard_backend.conditional import Validator
+from jobboard_backend.timing import TimedViewMixin, span
+
+# Browse order for worker profiles; ``id`` makes it total so pages are stable
+# and keyset cursors are unambiguous.
+WORKER_ORDERING = ('-rating', '-review_count', 'id')
+
+# Worker payloads do not depend on who is asking, so list and detail
+# responses are shared between users. signals.py invalidates the namespace
+# whenever a profile (or a worker's name) changes.
+worker_cache = ResponseCache('workers')
+
+# Newest reviews embedded in each worker payload
+WORKER_REVIEWS_LIMIT = 3
 
-class WorkersViewSet(viewsets.ReadOnlyModelViewSet):
+CATEGORIES = (
+    { 'id': 1, 'name': 'Plumbing', 'icon': '🔧' },
+    { 'id': 2, 'name': 'Cleaning', 'icon': '🧹' },
+    { 'id': 3, 'name': 'Electrical', 'icon': '⚡' },
+    { 'id': 4, 'name': 'Carpentry', 'icon': '🔨' },
+    { 'id': 5, 'name': 'Painting', 'icon': '🎨' },
+    { 'id': 6, 'name': 'Gardening', 'icon': '🌱' },
+    { 'id': 7, 'name': 'Moving', 'icon': '📦' },
+    { 'id': 8, 'name': 'General Labor', 'icon': '👷' }
+)
+# The category list only changes with a deploy, so it is rendered once
+CATEGORIES_BLOB = json.dumps(CATEGORIES, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+CATEGORIES_ETAG = '"%s"' % hashlib.md5(CATEGORIES_BLOB).hexdigest()
+
+class WorkersViewSet(TimedViewMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing worker profiles.
     Supports filtering by category, location, and other criteria.
     """
-    queryset = WorkerProfile.objects.select_related('user').filter(available=True)
+    queryset = WorkerProfile.objects.select_related('user').defer('search_vector').filter(available=True)
     serializer_class = WorkerProfileListSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
@@ -25,89 +63,173 @@ class WorkersViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         queryset = super().get_queryset()
         
-        # Apply additional filters
-        category = self.request.query_params.get('category')
-        if category:
-            queryset = queryset.filter(category__icontains=category)
-        
-        location = self.request.query_params.get('location')
-        if location:
-            queryset = queryset.filter(location__icontains=location)
+        # category/location filtering is done once, by WorkerProfileFilter.
+        # ?q= is a relevance-ranked full-text search (see search.py).
+        query = self.request.query_params.get('q', '').strip()
+        if query and self.action == 'list':
+            return search_workers(queryset, query, ordering=WORKER_ORDERING)
         
-        return queryset.order_by('-rating', '-review_count')
+        return queryset.order_by(*WORKER_ORDERING)
     
     @action(detail=False, methods=['get'], url_path='categories')
     def categories(self, request):
         """
         Get all categories (matches mock API /api/v1/categories).
         """
-        categories = [
-            { 'id': 1, 'name': 'Plumbing', 'icon': '🔧' },
-            { 'id': 2, 'name': 'Cleaning', 'icon': '🧹' },
-            { 'id': 3, 'name': 'Electrical', 'icon': '⚡' },
-            { 'id': 4, 'name': 'Carpentry', 'icon': '🔨' },
-            { 'id': 5, 'name': 'Painting', 'icon': '🎨' },
-            { 'id': 6, 'name': 'Gardening', 'icon': '🌱' },
-            { 'id': 7, 'name': 'Moving', 'icon': '📦' },
-            { 'id': 8, 'name': 'General Labor', 'icon': '👷' }
-        ]
-        return Response(categories)
+        if request.headers.get('If-None-Match') == CATEGORIES_ETAG:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = HttpResponse(CATEGORIES_BLOB, content_type='application/json')
+        response['ETag'] = CATEGORIES_ETAG
+        response['Cache-Control'] = 'private, max-age=3600'
+        return response
+    
+    @action(detail=False, methods=['get'], url_path='cache-stats',
+            permission_classes=[permissions.IsAdminUser])
+    def cache_metrics(self, request):
+        """
+        Response cache hit/miss counters of the serving process.
+        """
+        return Response(cache_stats())
     
     def list(self, request, *args, **kwargs):
         """
         Override list to match mock API response format exactly.
+
+        ``?page=`` uses OFFSET paging as before; ``?cursor=`` switches to
+        keyset paging on ``(-rating, -review_count, id)``. Either way the
+        total is counted at most once (see ``count_queryset``).
+
+        ``?near=lat,lng&radius_km=`` orders by distance within the radius;
+        without ``radius_km`` it returns the ``limit`` nearest workers.
+
+        Responses are cached per normalized query string (see ``worker_cache``).
         """
+        # Every listing is drawn from the available, filtered profiles, so
+        # their validator covers searches, near queries and all pages
+        validator = Validator.for_queryset(request, self.filter_queryset(WorkerProfile.objects.filter(available=True)))
+        not_modified = validator.not_modified()
+        if not_modified is not None:
+            return not_modified
+        
+        key = worker_cache.make_key('list', request.query_params)
+        return validator.apply(Response(worker_cache.get_or_compute(key, partial(self._list_data, request))))
+    
+    def _list_data(self, request):
         queryset = self.filter_queryset(self.get_queryset())
         
         # Get pagination parameters
         page = int(request.query_params.get('page', 1))
         limit = int(request.query_params.get('limit', 10))
         
-        # Manual pagination to match mock format
+        near = parse_near(request.query_params)
+        
+        paginator = None
         start = (page - 1) * limit
-        end = start + limit
-        paginated_queryset = queryset[start:end]
+        if near is not None and near[2] is None:
+            # ?near= without a radius: the `limit` nearest workers
+            paginated_queryset = nearest(queryset, near[0], near[1], limit)
+        elif near is not None:
+            queryset = within_radius(queryset, *near)
+            paginated_queryset = list(queryset[start:start + limit])
+        # Relevance order has no keyset, so searches always use page paging
+        elif KeysetPagination.is_requested(request) and not request.query_params.get('q', '').strip():
+            # Keyset paging: no OFFSET, cost independent of depth
+            paginator = KeysetPagination(ordering=WORKER_ORDERING)
+            paginated_queryset = paginator.paginate_queryset(queryset, request)
+            limit = paginator.limit
+        else:
+            # Manual pagination to match mock format
+            end = start + limit
+            paginated_queryset = list(queryset[start:end])
+        
+        # One query for the whole page's reviews, whatever its size
+        reviews = MockReviewSerializer.latest_by_worker(
+            [instance.user_id for instance in paginated_queryset], WORKER_REVIEWS_LIMIT
+        )
         
+        # A short page already tells us the total; otherwise count once
+        total = self._known_total(paginated_queryset, page, limit, paginator, near)
+        if total is None:
+            total = count_queryset(queryset)
+        
+        return self._list_envelope(paginated_queryset, reviews, near, page, limit, total, paginator)
+    
+    def _known_total(self, rows, page, limit, paginator, near):
+        """The list total when the page itself reveals it, else ``None``."""
+        if near is not None and near[2] is None:
+            return len(rows)
+        if paginator is None and len(rows) < limit and (rows or page == 1):
+            return (page - 1) * limit + len(rows)
+        return None
+    
+    def _list_envelope(self, instances, reviews, near, page, limit, total, paginator):
         # Serialize with mock-compatible format
-        serializer = self.get_serializer(paginated_queryset, many=True)
+        with span('serialize'):
+            serializer = self.get_serializer(instances, many=True)
         
-        # Transform to match mock API response structure
-        workers_data = []
-        for item in serializer.data:
-            worker_data = {
-                'id': item['id'],
-                'name': item['user']['name'],
-                'category': item['category'],
-                'categoryId': item.get('category_id', 1),  # Mock has categoryId
-                'location': item['location'],
-                'hourlyRate': float(item['hourly_rate']),  # Mock has hourlyRate
-                'rating': float(item['rating']),
-                'reviewCount': item['review_count'],  # Mock has reviewCount
-                'skills': item.get('skills', []),
-                'experience': '3 years',  # Mock has experience field
-                'available': item['available'],
-                'portfolio': item.get('portfolio', []),
-                'reviews': []  # Mock has reviews array
-            }
-            workers_data.append(worker_data)
+            # Transform to match mock API response structure
+            workers_data = []
+            for instance, item in zip(instances, serializer.data):
+                worker_data = {
+                    'id': item['id'],
+                    'name': item['user']['name'],
+                    'category': item['category'],
+                    'categoryId': item.get('category_id', 1),  # Mock has categoryId
+                    'location': item['location'],
+                    'hourlyRate': float(item['hourly_rate']),  # Mock has hourlyRate
+                    'rating': float(item['rating']),
+                    'reviewCount': item['review_count'],  # Mock has reviewCount
+                    'skills': item.get('skills', []),
+                    'experience': '3 years',  # Mock has experience field
+                    'available': item['available'],
+                    'portfolio': item.get('portfolio', []),
+                    'reviews': reviews.get(instance.user_id, []),
+                    'latitude': item['latitude'],
+                    'longitude': item['longitude']
+                }
+                if near is not None:
+                    worker_data['distanceKm'] = round(instance.distance_km, 3)
+                workers_data.append(worker_data)
+        
+        pagination = {
+            'page': page,
+            'limit': limit,
+            'total': total,
+            'totalPages': (total + limit - 1) // limit
+        }
+        if paginator is not None:
+            pagination.update(paginator.get_pagination_data())
         
-        return Response({
+        return {
             'workers': workers_data,
-            'pagination': {
-                'page': page,
-                'limit': limit,
-                'total': queryset.count(),
-                'totalPages': (queryset.count() + limit - 1) // limit
-            }
-        })
+            'pagination': pagination
+        }
     
     def retrieve(self, request, *args, **kwargs):
         """
         Override retrieve to match mock API response format exactly.
         """
+        try:
+            lookup = int(kwargs[self.lookup_field])
+        except (TypeError, ValueError):
+            raise Http404
+        updated_at = self.queryset.filter(pk=lookup).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            raise Http404
+        validator = Validator(request, updated_at)
+        not_modified = validator.not_modified()
+        if not_modified is not None:
+            return not_modified
+        
+        key = worker_cache.make_key(f'retrieve:{lookup}')
+        return validator.apply(Response(worker_cache.get_or_compute(key, self._retrieve_data)))
+    
+    def _retrieve_data(self):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
-        data = serializer.data
+        with span('serialize'):
+            data = serializer.data
         
         # Transform to match mock API response structure
         worker_data = {
@@ -123,7 +245,11 @@ class WorkersViewSet(viewsets.ReadOnlyModelViewSet):
             'experience': '3 years',
             'available': data['available'],
             'portfolio': data.get('portfolio', []),
-            'reviews': []
+            'reviews': MockReviewSerializer.latest_by_worker(
+                [instance.user_id], WORKER_REVIEWS_LIMIT
+            ).get(instance.user_id, []),
+            'latitude': data['latitude'],
+            'longitude': data['longitude']
         }
         
-        return Response(worker_data)
+        return worker_data
@@ -1,5 +1,5 @@
 """
-ASGI config for fundihub project.
+ASGI config for jobboard project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
@@ -11,6 +11,8 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'fundihub.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobboard_backend.settings')
+# Serve the hot read endpoints with their async views (urls_async.py)
+os.environ.setdefault('ASYNC_READ_VIEWS', 'True')
 
 application = get_asgi_application()
@@ -0,0 +1,46 @@
+"""
+Database access for the async views.
+
+Django's async ORM methods (``aget``, ``acount``, ``async for``...) run
+their queries through ``sync_to_async(thread_sensitive=True)``, i.e. one
+after another in a single thread shared by the whole process, so under
+load an async view would queue on its queries just as a sync view queues
+as a whole. ``database_sync_to_async`` runs ORM work in a pool of
+``ASYNC_DB_THREADS`` threads instead, each with its own connection, and
+closes expired connections around every call as the request signals do
+for sync views.
+"""
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import SyncToAsync
+from django.conf import settings
+from django.db import close_old_connections
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'ASYNC_DB_THREADS', 32), thread_name_prefix='async-db'
+        )
+    return _executor
+
+
+def database_sync_to_async(func):
+    """Awaitable version of ``func`` (which uses the ORM) run in the database pool."""
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return SyncToAsync(run, thread_sensitive=False, executor=_get_executor())
+
+
+async def fetch(queryset):
+    """Evaluate ``queryset`` in the database pool and return its rows as a list."""
+    return await database_sync_to_async(list)(queryset)
@@ -0,0 +1,96 @@
+"""
+Async-native versions of the hot read endpoints, for ASGI deployments.
+
+Under ASGI a synchronous DRF view runs through ``sync_to_async`` in the
+one thread reserved for sync code, so requests queue behind each other
+for the whole view: authentication, query building, serialization and
+rendering. The views built with ``async_read_view`` are coroutines. They
+authenticate from the token claims, build querysets with the viewset's own
+``get_queryset``/``filter_queryset``, run the queries in the database
+thread pool of ``async_db.py`` and render JSON in the event loop.
+
+The synchronous viewsets stay the reference implementation: anything an
+async view does not serve natively (writes, tokens without user claims,
+the browsable API, invalid parameters and the options listed on each
+view) is handed to them unchanged. ``jobboard_backend/urls_async.py``
+routes to these views and is the URLconf when ``ASYNC_READ_VIEWS`` is on,
+which ``asgi.py`` turns on by default.
+"""
+import functools
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import ForcedAuthentication, Request
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from apps.users.authentication import StatelessJWTAuthentication, TokenUser
+from .timing import span
+
+
+class Fallback(Exception):
+    """Raised by an async view to let the synchronous view answer."""
+
+
+def async_read_view(viewset, actions):
+    """
+    Turn ``handler(request, view, **kwargs)`` into the async view of one
+    route of ``viewset``; ``actions`` maps methods to actions as in
+    ``as_view``, and only the ``get`` action is served natively.
+    """
+    sync_view = sync_to_async(viewset.as_view(actions))
+
+    def decorator(handler):
+        @csrf_exempt
+        @functools.wraps(handler)
+        async def view(http_request, *args, **kwargs):
+            request = _authenticated_request(http_request)
+            if request is not None:
+                instance = viewset(
+                    request=request, action=actions['get'], format_kwarg=None, args=args, kwargs=kwargs
+                )
+                try:
+                    with span('view', include_db=True):
+                        return await handler(request, instance, **kwargs)
+                except (Fallback, ValidationError, NotFound):
+                    # The sync view produces the canonical error responses
+                    pass
+            return await sync_view(http_request, *args, **kwargs)
+        return view
+    return decorator
+
+
+def render(data, status=200):
+    """JSON response rendered like DRF's ``JSONRenderer``."""
+    response = HttpResponse(JSONRenderer().render(data), content_type='application/json', status=status)
+    patch_vary_headers(response, ['Accept'])
+    return response
+
+
+_authentication = StatelessJWTAuthentication()
+
+
+def _authenticated_request(http_request):
+    """
+    DRF ``Request`` authenticated from the token claims alone, or ``None``
+    when the request must go to the sync view.
+    """
+    if http_request.method != 'GET' or 'format' in http_request.GET:
+        return None
+    if 'text/html' in http_request.headers.get('Accept', ''):
+        return None
+    header = _authentication.get_header(http_request)
+    raw_token = _authentication.get_raw_token(header) if header else None
+    if raw_token is None:
+        return None
+    try:
+        token = _authentication.get_validated_token(raw_token)
+    except (InvalidToken, TokenError):
+        return None
+    # Tokens without the user claims need a database lookup
+    if api_settings.USER_ID_CLAIM not in token or 'role' not in token:
+        return None
+    return Request(http_request, authenticators=(ForcedAuthentication(TokenUser(token), token),))
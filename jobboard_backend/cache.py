@@ -0,0 +1,174 @@
+"""
+Versioned response cache for read-heavy endpoints.
+
+Entries live in a Django cache (local memory by default, or the file-based
+backend as a stand-in for Redis, see ``CACHE_BACKEND`` in settings). Keys
+include a per-namespace version number, so invalidating a namespace is a
+single ``incr``; old entries simply stop being addressed and age out.
+
+Each entry carries a soft expiry shortly before its hard TTL. The first
+request to see a stale entry takes a short lock and recomputes it while
+concurrent requests keep serving the stale copy, and a cold key is
+computed by one request while the others wait briefly for it, so an
+expiry never turns into a stampede of identical queries.
+"""
+import asyncio
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+LOCK_TIMEOUT = 10
+COLD_WAIT_SECONDS = 0.5
+COLD_POLL_SECONDS = 0.05
+# Lookup outcome: another request holds the lock on a cold key
+_WAIT = object()
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def record(namespace, outcome):
+    with _stats_lock:
+        counters = _stats.setdefault(namespace, {'hit': 0, 'stale': 0, 'miss': 0})
+        counters[outcome] += 1
+
+
+def cache_stats():
+    """Hit/stale/miss counters of this process, per namespace."""
+    with _stats_lock:
+        result = {}
+        for namespace, counters in _stats.items():
+            total = sum(counters.values())
+            served = counters['hit'] + counters['stale']
+            result[namespace] = dict(counters, hitRatio=round(served / total, 4) if total else None)
+        return result
+
+
+class ResponseCache:
+    """Cache of computed response data for one namespace (e.g. ``workers``)."""
+
+    def __init__(self, namespace, ttl=None, alias=None):
+        self.namespace = namespace
+        self.ttl = ttl if ttl is not None else getattr(settings, 'RESPONSE_CACHE_TTL', 60)
+        self.alias = alias or getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def version_key(self):
+        return f'rc:{self.namespace}:version'
+
+    def version(self):
+        version = self.cache.get(self.version_key)
+        if version is None:
+            self.cache.add(self.version_key, 1, None)
+            version = self.cache.get(self.version_key, 1)
+        return version
+
+    def invalidate(self):
+        """Make every existing entry of the namespace unreachable."""
+        try:
+            self.cache.incr(self.version_key)
+        except ValueError:
+            self.cache.set(self.version_key, 2, None)
+
+    def make_key(self, name, params=None):
+        """
+        Key for ``name`` (e.g. ``list``) and its query parameters.
+
+        Parameters are normalized: sorted, empty values dropped, repeated
+        values kept in order.
+        """
+        parts = []
+        if params is not None:
+            for param in sorted(params.keys()):
+                values = [value for value in params.getlist(param) if value != '']
+                if values:
+                    parts.append(f'{param}={",".join(values)}')
+        digest = hashlib.md5('&'.join(parts).encode('utf-8')).hexdigest()
+        return f'rc:{self.namespace}:v{self.version()}:{name}:{digest}'
+
+    def get_or_compute(self, key, compute):
+        found, data = self._lookup(key)
+        if found:
+            return data
+        # Only the request whose ``cache.add`` took the lock may release it
+        locked = data is not _WAIT
+        if not locked:
+            # Someone else is computing this key; give them a moment
+            deadline = time.time() + COLD_WAIT_SECONDS
+            while time.time() < deadline:
+                time.sleep(COLD_POLL_SECONDS)
+                found, data = self._poll(key)
+                if found:
+                    return data
+        record(self.namespace, 'miss')
+        try:
+            return self._store(key, compute())
+        finally:
+            if locked:
+                self.cache.delete(f'{key}:lock')
+
+    async def aget_or_compute(self, key, compute):
+        """
+        ``get_or_compute`` for async views, with a coroutine function as
+        ``compute``. Cache calls stay synchronous: the local-memory and file
+        backends answer them without blocking on the network.
+        """
+        found, data = self._lookup(key)
+        if found:
+            return data
+        locked = data is not _WAIT
+        if not locked:
+            deadline = time.time() + COLD_WAIT_SECONDS
+            while time.time() < deadline:
+                await asyncio.sleep(COLD_POLL_SECONDS)
+                found, data = self._poll(key)
+                if found:
+                    return data
+        record(self.namespace, 'miss')
+        try:
+            return self._store(key, await compute())
+        finally:
+            if locked:
+                self.cache.delete(f'{key}:lock')
+
+    def _lookup(self, key):
+        """
+        ``(True, data)`` when the entry can be served, else ``(False, _WAIT)``
+        if another request is computing a cold key or ``(False, None)`` once
+        this request holds the lock and must compute it.
+        """
+        cache = self.cache
+        entry = cache.get(key)
+        if entry is not None:
+            if time.time() < entry['fresh_until']:
+                record(self.namespace, 'hit')
+                return True, entry['data']
+            # Stale: one request refreshes, the rest serve the old copy
+            if not cache.add(f'{key}:lock', 1, LOCK_TIMEOUT):
+                record(self.namespace, 'stale')
+                return True, entry['data']
+            return False, None
+        if not cache.add(f'{key}:lock', 1, LOCK_TIMEOUT):
+            return False, _WAIT
+        return False, None
+
+    def _poll(self, key):
+        entry = self.cache.get(key)
+        if entry is None:
+            return False, None
+        record(self.namespace, 'hit')
+        return True, entry['data']
+
+    def _store(self, key, data):
+        # Entries turn stale at 80% of their life so the refresh happens
+        # while the old copy can still be served
+        entry = {'data': data, 'fresh_until': time.time() + self.ttl * 0.8}
+        self.cache.set(key, entry, self.ttl)
+        return data
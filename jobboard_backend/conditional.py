@@ -0,0 +1,83 @@
+"""
+Conditional GET for the polling-heavy list and detail endpoints.
+
+A list's validator is ``(max(updated_at), count)`` over the filtered
+queryset, one aggregate that never loads a row: an insert or update moves
+the timestamp and a delete (or a row leaving the filter) changes the count.
+The ETag also covers the request path, query string and user, since page,
+limit and the per-user filters all shape the payload.
+
+Lists only answer ``If-None-Match``: a ``Last-Modified`` date alone cannot
+see a row that disappeared. Detail responses carry both validators.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from .async_db import database_sync_to_async
+
+
+class Validator:
+    def __init__(self, request, last_modified, count=None):
+        self.request = request
+        self.last_modified = last_modified
+        self.count = count
+        material = '|'.join([
+            request.get_full_path(),
+            str(getattr(request.user, 'id', '')),
+            last_modified.isoformat() if last_modified else '',
+            '' if count is None else str(count),
+        ])
+        self.etag = 'W/"%s"' % hashlib.md5(material.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def for_queryset(cls, request, queryset, *fields):
+        """Validator of a list: newest of ``fields`` (default ``updated_at``) and the row count."""
+        aggregates = cls._aggregates(fields)
+        return cls._from_aggregate(request, queryset.order_by().aggregate(**aggregates))
+
+    @classmethod
+    async def afor_queryset(cls, request, queryset, *fields):
+        """``for_queryset`` for async views."""
+        aggregates = cls._aggregates(fields)
+        aggregate = database_sync_to_async(queryset.order_by().aggregate)
+        return cls._from_aggregate(request, await aggregate(**aggregates))
+
+    @staticmethod
+    def _aggregates(fields):
+        fields = fields or ('updated_at',)
+        aggregates = {f'last_{index}': Max(field) for index, field in enumerate(fields)}
+        aggregates['count'] = Count('pk')
+        return aggregates
+
+    @classmethod
+    def _from_aggregate(cls, request, result):
+        count = result.pop('count')
+        stamps = [stamp for stamp in result.values() if stamp is not None]
+        return cls(request, max(stamps) if stamps else None, count)
+
+    @classmethod
+    def for_instance(cls, request, instance, field='updated_at'):
+        return cls(request, getattr(instance, field))
+
+    @property
+    def is_list(self):
+        return self.count is not None
+
+    def not_modified(self):
+        """Return a 304 response if the client's copy is current, else ``None``."""
+        last_modified = None
+        if self.last_modified and not self.is_list:
+            last_modified = int(self.last_modified.timestamp())
+        response = get_conditional_response(self.request._request, etag=self.etag, last_modified=last_modified)
+        if response is not None:
+            self.apply(response)
+        return response
+
+    def apply(self, response):
+        response['ETag'] = self.etag
+        if self.last_modified and not self.is_list:
+            response['Last-Modified'] = http_date(self.last_modified.timestamp())
+        patch_vary_headers(response, ['Authorization'])
+        return response
@@ -0,0 +1,125 @@
+"""
+Read-replica routing.
+
+``ReplicaRouter`` sends reads to one of ``DATABASE_REPLICAS`` only while
+``ReplicaRoutingMiddleware`` has marked the current request as a safe
+(GET/HEAD/OPTIONS) read; everything else -- writes, the reads of write
+requests, management commands, scripts -- uses ``default``, the primary.
+
+Replicas lag behind the primary, so a user who just applied to a job or
+accepted an application could read their change back from a replica that
+has not seen it yet. After a successful write the middleware pins the
+user (from the token's user id claim) to the primary for
+``REPLICA_PIN_SECONDS``. Pins live in the default cache, which must be
+shared between processes (see ``CACHE_BACKEND``) for them to hold across
+workers.
+"""
+import contextvars
+import random
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from apps.users.authentication import StatelessJWTAuthentication
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_replica_reads = contextvars.ContextVar('replica_reads', default=False)
+
+
+def replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        aliases = replicas()
+        if aliases and _replica_reads.get():
+            return random.choice(aliases)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema from replication
+        return db not in replicas()
+
+
+def _pin_key(user_id):
+    return f'primary-pin:{user_id}'
+
+
+def pin_to_primary(user_id):
+    """Serve ``user_id``'s reads from the primary for ``REPLICA_PIN_SECONDS``."""
+    cache.set(_pin_key(user_id), True, getattr(settings, 'REPLICA_PIN_SECONDS', 10))
+
+
+def is_pinned(user_id):
+    return cache.get(_pin_key(user_id), False)
+
+
+_authentication = StatelessJWTAuthentication()
+
+
+def _token_user_id(request):
+    """User id claim of the request's access token, without a database lookup."""
+    header = _authentication.get_header(request)
+    raw_token = _authentication.get_raw_token(header) if header else None
+    if raw_token is None:
+        return None
+    try:
+        return _authentication.get_validated_token(raw_token).get(api_settings.USER_ID_CLAIM)
+    except (InvalidToken, TokenError):
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """Marks safe requests of unpinned users as replica reads; pins writers."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not replicas():
+            return self.get_response(request)
+        user_id, marker = self._before(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _replica_reads.reset(marker)
+        self._after(request, user_id, response)
+        return response
+
+    async def __acall__(self, request):
+        if not replicas():
+            return await self.get_response(request)
+        user_id, marker = self._before(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _replica_reads.reset(marker)
+        self._after(request, user_id, response)
+        return response
+
+    def _before(self, request):
+        user_id = _token_user_id(request)
+        replica_read = request.method in SAFE_METHODS and not (user_id is not None and is_pinned(user_id))
+        return user_id, _replica_reads.set(replica_read)
+
+    def _after(self, request, user_id, response):
+        if request.method not in SAFE_METHODS and user_id is not None and response.status_code < 400:
+            pin_to_primary(user_id)
@@ -0,0 +1,211 @@
+"""
+Proximity search on plain latitude/longitude columns, without PostGIS.
+
+Rows carry a geohash of their coordinates in an indexed column. A radius
+query first restricts to the 3x3 block of geohash cells around the centre,
+at the finest precision whose cells are at least as large as the radius
+(one ``>= prefix AND < successor`` range scan on the index per cell, which
+unlike ``LIKE`` needs no special operator class), then to the bounding
+box, and only computes exact great-circle distances for the rows that
+remain. Successors stay within the geohash alphabet, so the ranges hold
+under any collation that orders digits before letters, not just ``C``.
+"""
+import math
+
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Sin, Sqrt
+from rest_framework.exceptions import ValidationError
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+GEOHASH_PRECISION = 9
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+MAX_RADIUS_KM = 500.0
+# Starting radius and growth factor when looking for the k nearest rows
+# without an explicit radius.
+KNN_INITIAL_RADIUS_KM = 2.0
+KNN_GROWTH = 4.0
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if longitude >= mid:
+                value = (value << 1) | 1
+                lng_range[0] = mid
+            else:
+                value <<= 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                value = (value << 1) | 1
+                lat_range[0] = mid
+            else:
+                value <<= 1
+                lat_range[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(GEOHASH_ALPHABET[value])
+            bits = 0
+            value = 0
+    return ''.join(chars)
+
+
+def assign_geohash(instance):
+    """Set ``instance.geohash`` from its coordinates (blank if unset)."""
+    if instance.latitude is None or instance.longitude is None:
+        instance.geohash = ''
+    else:
+        instance.geohash = encode_geohash(instance.latitude, instance.longitude)
+
+
+def cell_size(precision):
+    """Return ``(lat_degrees, lng_degrees)`` spanned by a geohash cell."""
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def _degree_spans(latitude, radius_km):
+    lat_span = radius_km / KM_PER_DEGREE
+    cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+    lng_span = radius_km / (KM_PER_DEGREE * cos_lat)
+    return lat_span, lng_span
+
+
+def cover_cells(latitude, longitude, radius_km):
+    """
+    Geohash prefixes whose union contains the circle, or ``[]`` if the
+    circle is too large for any cell block to be selective.
+    """
+    lat_span, lng_span = _degree_spans(latitude, radius_km)
+    precision = 0
+    for candidate in range(1, GEOHASH_PRECISION + 1):
+        cell_lat, cell_lng = cell_size(candidate)
+        if cell_lat < lat_span or cell_lng < lng_span:
+            break
+        precision = candidate
+    if precision == 0:
+        return []
+
+    cell_lat, cell_lng = cell_size(precision)
+    cells = set()
+    for dlat in (-cell_lat, 0.0, cell_lat):
+        for dlng in (-cell_lng, 0.0, cell_lng):
+            lat = min(max(latitude + dlat, -90.0), 90.0)
+            lng = (longitude + dlng + 180.0) % 360.0 - 180.0
+            cells.add(encode_geohash(lat, lng, precision))
+    return sorted(cells)
+
+
+def distance_km(latitude, longitude):
+    """Haversine distance from a point to the row's coordinates, in km."""
+    lat = Radians(F('latitude'))
+    lng = Radians(F('longitude'))
+    origin_lat = math.radians(latitude)
+    origin_lng = math.radians(longitude)
+    half_chord = (
+        Power(Sin((lat - Value(origin_lat)) / 2), 2)
+        + Value(math.cos(origin_lat)) * Cos(lat) * Power(Sin((lng - Value(origin_lng)) / 2), 2)
+    )
+    # Rounding can push the chord a hair above 1 for antipodal points
+    return Value(2 * EARTH_RADIUS_KM) * ASin(Least(Sqrt(half_chord), Value(1.0)), output_field=FloatField())
+
+
+def cell_successor(cell):
+    """
+    The smallest geohash of ``cell``'s length or shorter that sorts after
+    every geohash starting with ``cell``, or ``None`` when there is none
+    (``cell`` is all ``z``).
+    """
+    cell = cell.rstrip(GEOHASH_ALPHABET[-1])
+    if not cell:
+        return None
+    return cell[:-1] + GEOHASH_ALPHABET[GEOHASH_ALPHABET.index(cell[-1]) + 1]
+
+
+def within_radius(queryset, latitude, longitude, radius_km):
+    """
+    Rows within ``radius_km`` of the point, annotated with ``distance_km``
+    and ordered nearest first.
+    """
+    cells = cover_cells(latitude, longitude, radius_km)
+    if cells:
+        cell_filter = Q()
+        for cell in cells:
+            successor = cell_successor(cell)
+            in_cell = Q(geohash__gte=cell)
+            if successor is not None:
+                in_cell &= Q(geohash__lt=successor)
+            cell_filter |= in_cell
+        queryset = queryset.filter(cell_filter)
+
+    lat_span, lng_span = _degree_spans(latitude, radius_km)
+    queryset = queryset.filter(
+        latitude__gte=latitude - lat_span,
+        latitude__lte=latitude + lat_span,
+    )
+    if lng_span < 180.0 and -180.0 <= longitude - lng_span and longitude + lng_span <= 180.0:
+        queryset = queryset.filter(
+            longitude__gte=longitude - lng_span,
+            longitude__lte=longitude + lng_span,
+        )
+    return queryset.annotate(
+        distance_km=distance_km(latitude, longitude)
+    ).filter(distance_km__lte=radius_km).order_by('distance_km', 'id')
+
+
+def nearest(queryset, latitude, longitude, k, max_radius_km=MAX_RADIUS_KM):
+    """
+    The ``k`` nearest rows, searched in growing rings so the work stays
+    proportional to the local density rather than the table size.
+    """
+    radius = KNN_INITIAL_RADIUS_KM
+    while True:
+        radius = min(radius, max_radius_km)
+        candidates = within_radius(queryset, latitude, longitude, radius)
+        rows = list(candidates[:k])
+        if len(rows) >= k or radius >= max_radius_km:
+            return rows
+        radius *= KNN_GROWTH
+
+
+def parse_near(query_params):
+    """
+    Parse ``?near=lat,lng&radius_km=`` into ``(lat, lng, radius_km)``.
+
+    Returns ``None`` when ``near`` is absent; ``radius_km`` is ``None`` when
+    not given. Raises ``ValidationError`` on malformed values.
+    """
+    near = query_params.get('near')
+    if not near:
+        return None
+    try:
+        lat_text, lng_text = near.split(',')
+        latitude, longitude = float(lat_text), float(lng_text)
+    except ValueError:
+        raise ValidationError({'near': 'Expected "lat,lng"'})
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        raise ValidationError({'near': 'Coordinates out of range'})
+
+    radius = query_params.get('radius_km')
+    if radius in (None, ''):
+        return latitude, longitude, None
+    try:
+        radius = float(radius)
+    except ValueError:
+        raise ValidationError({'radius_km': 'Expected a number'})
+    if not 0 < radius <= MAX_RADIUS_KM:
+        raise ValidationError({'radius_km': f'Must be between 0 and {MAX_RADIUS_KM:g}'})
+    return latitude, longitude, radius
@@ -0,0 +1,285 @@
+"""
+Prometheus metrics shared by every worker process.
+
+Each process counts in memory and periodically writes a snapshot to its
+own JSON file in ``METRICS_DIR`` (at most every ``METRICS_FLUSH_SECONDS``,
+after a request, and at exit). ``GET /metrics`` on any worker flushes its
+own snapshot, sums the files of all processes and renders the Prometheus
+text format, so a scrape sees the whole server without a push gateway or
+other external service.
+
+Files are named per process start (at its first flush, so workers forked
+from a preloaded master do not share one), so a restarted worker never
+overwrites the counters of its predecessor and totals stay monotonic. A scrape folds
+the files of processes that have exited into ``merged.json`` and deletes
+them, so the directory holds one file per live process plus one; the
+process ids are checked locally, so ``METRICS_DIR`` must not be shared
+between hosts. Clear it when deploying to reset the totals.
+"""
+import atexit
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.http import HttpResponse
+from .cache import cache_stats
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no flock, and os.kill(pid, 0) would send a CTRL_C_EVENT, so
+    # the files of exited processes are summed but never folded
+    fcntl = None
+
+# Upper bounds (seconds) of the request duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS = {
+    'jobboard_http_requests_total': ('counter', 'HTTP requests by route, method and status code.'),
+    'jobboard_http_request_duration_seconds': ('histogram', 'HTTP request duration by route and method.'),
+    'jobboard_db_queries_total': ('counter', 'Database queries run while serving requests, by route and method.'),
+    'jobboard_cache_requests_total': ('counter', 'Response cache lookups by namespace and outcome.'),
+    'jobboard_cache_hit_ratio': ('gauge', 'Share of response cache lookups served from the cache.'),
+    'jobboard_login_attempts_total': ('counter', 'Login attempts by outcome.'),
+}
+
+# Totals of the processes that have exited (see ``collect``)
+MERGED_FILE = 'merged.json'
+
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+# Chosen on first flush, so workers forked from a preloaded master each get
+# their own file
+_process_id = None
+_last_flush = 0.0
+
+
+def _after_fork():
+    """Start the child's counters and snapshot file afresh."""
+    global _lock, _process_id, _last_flush
+    # The parent's lock may have been held by another thread
+    _lock = threading.Lock()
+    _counters.clear()
+    _histograms.clear()
+    _process_id = None
+    _last_flush = 0.0
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def _key(name, labels):
+    return json.dumps([name, sorted(labels.items())])
+
+
+def inc(name, labels=None, value=1):
+    """Add ``value`` to the ``name`` counter with ``labels``."""
+    key = _key(name, labels or {})
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name, labels, seconds):
+    """Record one ``seconds`` observation in the ``name`` histogram."""
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = {'buckets': [0] * len(DURATION_BUCKETS), 'sum': 0.0, 'count': 0}
+        for index, bound in enumerate(DURATION_BUCKETS):
+            if seconds <= bound:
+                histogram['buckets'][index] += 1
+                break
+        histogram['sum'] += seconds
+        histogram['count'] += 1
+
+
+def _snapshot():
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: dict(value, buckets=list(value['buckets'])) for key, value in _histograms.items()}
+    for namespace, stats in cache_stats().items():
+        for outcome in ('hit', 'stale', 'miss'):
+            counters[_key('jobboard_cache_requests_total', {'namespace': namespace, 'outcome': outcome})] = stats[outcome]
+    return {'counters': counters, 'histograms': histograms}
+
+
+def _directory():
+    directory = getattr(settings, 'METRICS_DIR', None) or os.path.join(tempfile.gettempdir(), 'jobboard-metrics')
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def _write(path, snapshot):
+    temporary = f'{path}.tmp'
+    with open(temporary, 'w') as f:
+        json.dump(snapshot, f)
+    # Readers never see a partly written file
+    os.replace(temporary, path)
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def flush():
+    """Write this process's snapshot to its file."""
+    global _process_id, _last_flush
+    if _process_id is None:
+        _process_id = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+    _last_flush = time.monotonic()
+    _write(os.path.join(_directory(), f'{_process_id}.json'), _snapshot())
+
+
+def maybe_flush():
+    """``flush`` unless this process flushed within ``METRICS_FLUSH_SECONDS``."""
+    if time.monotonic() - _last_flush >= getattr(settings, 'METRICS_FLUSH_SECONDS', 1):
+        flush()
+
+
+atexit.register(flush)
+
+
+def _add(totals, snapshot):
+    counters, histograms = totals['counters'], totals['histograms']
+    for key, value in snapshot['counters'].items():
+        counters[key] = counters.get(key, 0) + value
+    for key, value in snapshot['histograms'].items():
+        total = histograms.setdefault(key, {'buckets': [0] * len(DURATION_BUCKETS), 'sum': 0.0, 'count': 0})
+        total['buckets'] = [a + b for a, b in zip(total['buckets'], value['buckets'])]
+        total['sum'] += value['sum']
+        total['count'] += value['count']
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, under another user
+        return True
+    return True
+
+
+def _fold_exited(directory, paths):
+    """
+    Add the snapshots of exited processes to ``merged.json`` and delete
+    their files; returns the paths left. The caller holds the lock.
+    """
+    merged_path = os.path.join(directory, MERGED_FILE)
+    merged = _read(merged_path) or {'counters': {}, 'histograms': {}, 'folded': []}
+    # Files folded by a scrape that died before deleting them
+    folded = {name for name in merged['folded'] if os.path.exists(os.path.join(directory, name))}
+    exited = []
+    for path in paths:
+        name = os.path.basename(path)
+        pid = name.split('-', 1)[0]
+        if not pid.isdigit() or _alive(int(pid)):
+            continue
+        exited.append(path)
+        snapshot = _read(path)
+        if name not in folded and snapshot is not None:
+            _add(merged, snapshot)
+            folded.add(name)
+    if not exited:
+        return paths
+    merged['folded'] = sorted(folded)
+    _write(merged_path, merged)
+    for path in exited:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    return [path for path in paths if path not in exited]
+
+
+def collect():
+    """Snapshots of all processes, summed."""
+    flush()
+    directory = _directory()
+    totals = {'counters': {}, 'histograms': {}}
+    # Scrapes of different workers take turns so none reads a file that
+    # another is folding into merged.json
+    with open(os.path.join(directory, 'merged.lock'), 'w') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        paths = [path for path in glob.glob(os.path.join(directory, '*.json'))
+                 if os.path.basename(path) != MERGED_FILE]
+        if fcntl is not None:
+            paths = _fold_exited(directory, paths)
+        merged = _read(os.path.join(directory, MERGED_FILE))
+        if merged is not None:
+            _add(totals, merged)
+        for path in paths:
+            snapshot = _read(path)
+            if snapshot is not None:
+                _add(totals, snapshot)
+    return totals['counters'], totals['histograms']
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    escaped = [
+        (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    ]
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def render(counters, histograms):
+    """Prometheus text exposition of summed snapshots."""
+    samples = {name: [] for name in METRICS}
+    cache_lookups = {}
+    for key, value in sorted(counters.items()):
+        name, labels = json.loads(key)
+        samples[name].append(f'{name}{_labels(labels)} {value}')
+        if name == 'jobboard_cache_requests_total':
+            labels = dict(labels)
+            served, total = cache_lookups.get(labels['namespace'], (0, 0))
+            served += value if labels['outcome'] != 'miss' else 0
+            cache_lookups[labels['namespace']] = (served, total + value)
+    for namespace, (served, total) in sorted(cache_lookups.items()):
+        if total:
+            samples['jobboard_cache_hit_ratio'].append(
+                f'jobboard_cache_hit_ratio{_labels([("namespace", namespace)])} {served / total:.4f}'
+            )
+    for key, histogram in sorted(histograms.items()):
+        name, labels = json.loads(key)
+        cumulative = 0
+        for bound, count in zip(DURATION_BUCKETS, histogram['buckets']):
+            cumulative += count
+            samples[name].append(f'{name}_bucket{_labels(labels + [["le", bound]])} {cumulative}')
+        samples[name].append(f'{name}_bucket{_labels(labels + [["le", "+Inf"]])} {histogram["count"]}')
+        samples[name].append(f'{name}_sum{_labels(labels)} {histogram["sum"]:.6f}')
+        samples[name].append(f'{name}_count{_labels(labels)} {histogram["count"]}')
+
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        lines.extend(samples[name])
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """
+    ``GET /metrics``. When ``METRICS_TOKEN`` is set the scraper must send
+    it as a bearer token.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponse(status=401)
+    return HttpResponse(render(*collect()), content_type='text/plain; version=0.0.4; charset=utf-8')
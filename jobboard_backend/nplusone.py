@@ -0,0 +1,78 @@
+"""
+N+1 query detection.
+
+A request that runs the same query shape (its SQL with literals and
+parameters blanked out) again and again is usually loading a relation per
+row: ``application.job.client`` in a permission check, a nested serializer
+without ``select_related``... With ``N_PLUS_ONE_DETECTION`` on (the default
+under ``DEBUG``) ``PerformanceMiddleware`` feeds every query of a request
+to a ``QueryShapes`` and logs a warning on the ``jobboard.nplusone`` logger
+for each shape run ``N_PLUS_ONE_THRESHOLD`` times or more, with the stack
+that ran it.
+
+``scripts/check_query_budgets.py`` uses ``repeated_shapes`` to explain
+query budget failures.
+"""
+import os
+import re
+import traceback
+from collections import Counter
+
+from django.conf import settings
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_LIST = re.compile(r'\((?:\s*(?:%s|\?)\s*,)*\s*(?:%s|\?)\s*\)')
+_PLACEHOLDER = re.compile(r'%s')
+# The instrumentation's own frames
+_INTERNAL = {
+    os.path.abspath(__file__),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'timing.py'),
+}
+
+
+def shape(sql):
+    """``sql`` with its literals, parameters and ``IN`` lists blanked out."""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    return _PLACEHOLDER_LIST.sub('(...)', sql)
+
+
+def repeated_shapes(statements, threshold):
+    """``[(shape, count)]`` of the shapes run at least ``threshold`` times."""
+    counts = Counter(shape(sql) for sql in statements)
+    return [(sql, count) for sql, count in counts.most_common() if count >= threshold]
+
+
+def _project_stack():
+    """The calling frames that belong to this project, outermost first."""
+    root = str(settings.BASE_DIR)
+    frames = [
+        frame for frame in traceback.extract_stack()
+        if frame.filename.startswith(root) and frame.filename not in _INTERNAL
+        and os.sep + 'site-packages' + os.sep not in frame.filename
+    ]
+    return ''.join(traceback.format_list(frames))
+
+
+class QueryShapes:
+    """Query shapes of one request, with the stack of each repeated one."""
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.counts = Counter()
+        self.stacks = {}
+
+    def record(self, sql):
+        key = shape(sql)
+        self.counts[key] += 1
+        if self.counts[key] == self.threshold:
+            # Only repeated shapes pay for a stack
+            self.stacks[key] = _project_stack()
+
+    def repeated(self):
+        """``[(shape, count, stack)]``, most repeated first."""
+        return [(key, self.counts[key], stack) for key, stack in sorted(
+            self.stacks.items(), key=lambda item: -self.counts[item[0]]
+        )]
@@ -0,0 +1,225 @@
+"""
+Keyset (cursor) pagination shared by the mock-compatible list endpoints.
+
+Unlike OFFSET paging, each page is located with a range predicate on the
+ordering columns, so the cost of a page does not grow with its depth.
+Cursors are opaque base64 tokens holding the ordering values of the row
+at the page boundary.
+
+``count_queryset`` backs the ``total``/``totalPages`` fields: it runs at most
+one COUNT per distinct query, caches it briefly, and on PostgreSQL uses the
+planner's row estimate instead once a result set is large.
+"""
+import base64
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from .async_db import database_sync_to_async, fetch
+
+
+class KeysetPagination:
+    """
+    Seek pagination over a fixed ordering, e.g. ``('-created_at', '-id')``.
+
+    The last ordering field must be unique (normally the primary key) so
+    every row has a distinct position.
+    """
+    cursor_query_param = 'cursor'
+    limit_query_param = 'limit'
+    default_limit = settings.REST_FRAMEWORK.get('PAGE_SIZE', 10)
+    max_limit = 100
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self, ordering, default_limit=None, max_limit=None):
+        self.ordering = tuple(ordering)
+        if default_limit is not None:
+            self.default_limit = default_limit
+        if max_limit is not None:
+            self.max_limit = max_limit
+        self.next_cursor = None
+        self.previous_cursor = None
+        self.has_more = False
+        self.limit = self.default_limit
+
+    @classmethod
+    def is_requested(cls, request):
+        """Cursor mode is opt-in: it is enabled by passing ``?cursor=``."""
+        return cls.cursor_query_param in request.query_params
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get(self.limit_query_param, self.default_limit))
+        except (TypeError, ValueError):
+            return self.default_limit
+        if limit < 1:
+            return self.default_limit
+        return min(limit, self.max_limit)
+
+    def paginate_queryset(self, queryset, request):
+        """
+        Return one page of ``queryset`` as a list.
+
+        Works on model querysets as well as ``.values()`` querysets.
+        """
+        queryset, position, reverse = self._page_queryset(queryset, request)
+        return self._finish_page(list(queryset), position, reverse)
+
+    async def apaginate_queryset(self, queryset, request):
+        """``paginate_queryset`` for async views."""
+        queryset, position, reverse = self._page_queryset(queryset, request)
+        return self._finish_page(await fetch(queryset), position, reverse)
+
+    def _page_queryset(self, queryset, request):
+        self.limit = self.get_limit(request)
+        position, reverse = self.get_position(queryset.model, request)
+
+        ordering = self._reversed_ordering() if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._seek_filter(position, reverse))
+        return queryset[:self.limit + 1], position, reverse
+
+    def _finish_page(self, rows, position, reverse):
+        self.has_more = len(rows) > self.limit
+        rows = rows[:self.limit]
+        if reverse:
+            rows.reverse()
+
+        self.next_cursor = None
+        self.previous_cursor = None
+        if rows:
+            if self.has_more or reverse:
+                self.next_cursor = self.encode_cursor(rows[-1], reverse=False)
+            if (self.has_more and reverse) or (position is not None and not reverse):
+                self.previous_cursor = self.encode_cursor(rows[0], reverse=True)
+        return rows
+
+    def get_position(self, model, request):
+        """Decode the request cursor into ``(values | None, reverse)``."""
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        return self.decode_cursor(model, token)
+
+    def get_pagination_data(self):
+        return {
+            'limit': self.limit,
+            'nextCursor': self.next_cursor,
+            'prevCursor': self.previous_cursor,
+        }
+
+    def encode_cursor(self, row, reverse=False):
+        values = [self._value(row, field.lstrip('-')) for field in self.ordering]
+        payload = {'v': [None if value is None else str(value) for value in values]}
+        if reverse:
+            payload['r'] = 1
+        raw = json.dumps(payload, separators=(',', ':')).encode('ascii')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, model, token):
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            raw_values = payload['v']
+            if len(raw_values) != len(self.ordering):
+                raise ValueError('cursor arity mismatch')
+            values = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, raw_values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return tuple(values), bool(payload.get('r'))
+
+    def _reversed_ordering(self):
+        return tuple(field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering)
+
+    def _seek_filter(self, position, reverse):
+        """
+        Build ``(a, b, id) < (va, vb, vid)`` as an OR of prefix matches.
+
+        The row-value form is not portable across backends, but this
+        expansion is still answered by a range scan on a matching index.
+        """
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            lookup = f'{name}__lt' if descending else f'{name}__gt'
+            condition |= Q(**equal, **{lookup: value})
+            equal[name] = value
+        return condition
+
+    @staticmethod
+    def _value(row, name):
+        if isinstance(row, dict):
+            return row[name]
+        return getattr(row, name)
+
+
+def count_queryset(queryset):
+    """
+    Return the number of rows in ``queryset`` with at most one COUNT query.
+
+    Results are cached for ``PAGINATION_COUNT_CACHE_TTL`` seconds, keyed on
+    the compiled SQL. On PostgreSQL the planner estimate is used when it is
+    above ``PAGINATION_COUNT_ESTIMATE_THRESHOLD`` rows, where an exact count
+    would mean scanning most of the table and nobody pages that deep.
+    """
+    queryset, sql, params, key, cache = _count_key(queryset)
+    total = cache.get(key)
+    if total is not None:
+        return total
+
+    total = _estimate_count(queryset, sql, params)
+    if total is None:
+        total = queryset.count()
+    cache.set(key, total, getattr(settings, 'PAGINATION_COUNT_CACHE_TTL', 60))
+    return total
+
+
+async def acount_queryset(queryset):
+    """``count_queryset`` for async views."""
+    queryset, sql, params, key, cache = _count_key(queryset)
+    total = cache.get(key)
+    if total is not None:
+        return total
+
+    total = await database_sync_to_async(_estimate_count)(queryset, sql, params)
+    if total is None:
+        total = await database_sync_to_async(queryset.count)()
+    cache.set(key, total, getattr(settings, 'PAGINATION_COUNT_CACHE_TTL', 60))
+    return total
+
+
+def _count_key(queryset):
+    queryset = queryset.order_by()
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.md5(f'{queryset.db}:{sql}:{params!r}'.encode('utf-8')).hexdigest()
+    cache = caches[getattr(settings, 'PAGINATION_COUNT_CACHE_ALIAS', 'default')]
+    return queryset, sql, params, f'pagination:count:{digest}', cache
+
+
+async def apaginate_page_number(paginator, queryset, request):
+    """``PageNumberPagination.paginate_queryset`` for async views."""
+    return await database_sync_to_async(paginator.paginate_queryset)(queryset, request)
+
+
+def _estimate_count(queryset, sql, params):
+    threshold = getattr(settings, 'PAGINATION_COUNT_ESTIMATE_THRESHOLD', None)
+    connection = connections[queryset.db]
+    if not threshold or connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]['Plan']['Plan Rows'])
+    return estimate if estimate >= threshold else None
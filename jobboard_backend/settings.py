@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 import os
+import tempfile
 
 from dotenv import load_dotenv
 
@@ -41,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third-party
     'rest_framework',
     'rest_framework_simplejwt',
@@ -51,21 +53,30 @@ INSTALLED_APPS = [
     'apps.workers',
     'apps.jobs',
     'apps.applications',
+    'apps.reviews',
 ]
 
 MIDDLEWARE = [
+    'jobboard_backend.timing.PerformanceMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'jobboard_backend.db_router.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Async-native hot read endpoints (jobboard_backend/async_views.py); asgi.py
+# turns them on unless ASYNC_READ_VIEWS is set
+ASYNC_READ_VIEWS = os.getenv('ASYNC_READ_VIEWS', 'False') == 'True'
+# Threads (and so database connections) the async views run queries in
+ASYNC_DB_THREADS = int(os.getenv('ASYNC_DB_THREADS', '32'))
+
 # Corrected to match the actual project package name
-ROOT_URLCONF = 'jobboard_backend.urls'
+ROOT_URLCONF = 'jobboard_backend.urls_async' if ASYNC_READ_VIEWS else 'jobboard_backend.urls'
 
 TEMPLATES = [
     {
@@ -95,6 +106,8 @@ if os.getenv('USE_SQLITE', 'False') == 'True':
             'NAME': BASE_DIR / 'db.sqlite3',
         }
     }
+    # A second SQLite file standing in for a read replica in development
+    REPLICA_NAMES = [os.getenv('SQLITE_REPLICA_NAME')] if os.getenv('SQLITE_REPLICA_NAME') else []
 else:
     DATABASES = {
         'default': {
@@ -106,6 +119,33 @@ else:
             'PORT': os.getenv('DB_PORT', '5432'),
         }
     }
+    # Streaming replicas of the primary, same credentials
+    REPLICA_NAMES = os.getenv('DB_REPLICA_HOSTS', '').split(',') if os.getenv('DB_REPLICA_HOSTS') else []
+
+# Persistent connections: each worker thread reuses its connection for
+# CONN_MAX_AGE seconds and checks it is still usable before reusing it
+DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv('CONN_MAX_AGE', '60'))
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+if os.getenv('DB_POOL', 'False') == 'True' and 'postgresql' in DATABASES['default']['ENGINE']:
+    # psycopg 3 connection pool (pip install "psycopg[pool]"), health
+    # checked on checkout; replaces persistent connections
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {'pool': {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '20')),
+    }}
+
+# Read replicas, used for safe-method request reads by
+# jobboard_backend/db_router.py; writers read from the primary for
+# REPLICA_PIN_SECONDS afterwards
+DATABASE_REPLICAS = []
+for index, name in enumerate(REPLICA_NAMES, start=1):
+    alias = f'replica{index}'
+    key = 'NAME' if DATABASES['default']['ENGINE'].endswith('sqlite3') else 'HOST'
+    DATABASES[alias] = dict(DATABASES['default'], **{key: name, 'TEST': {'MIRROR': 'default'}})
+    DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ['jobboard_backend.db_router.ReplicaRouter']
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', '10'))
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -149,7 +189,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # DRF configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # Builds request.user from token claims; see apps/users/authentication.py
+        'apps.users.authentication.StatelessJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -161,14 +202,87 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Cache
+# CACHE_BACKEND=locmem (default) keeps a cache per process; CACHE_BACKEND=file
+# shares one directory between the processes of a host, standing in for Redis.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+if CACHE_BACKEND == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_LOCATION', os.path.join(tempfile.gettempdir(), 'jobboard-cache')),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Response cache for read-heavy endpoints (jobboard_backend/cache.py)
+RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', '60'))
+RESPONSE_CACHE_ALIAS = 'default'
+
+# Row counts behind paginated totals (jobboard_backend/pagination.py)
+PAGINATION_COUNT_CACHE_TTL = int(os.getenv('PAGINATION_COUNT_CACHE_TTL', '60'))
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = int(os.getenv('PAGINATION_COUNT_ESTIMATE_THRESHOLD', '100000'))
+
 # SimpleJWT
 SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
+    # Requests trust the role/staff claims of access tokens without loading
+    # the user (apps/users/authentication.py), so keep them short-lived;
+    # refreshing reloads the user and re-stamps the claims
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=int(os.getenv('ACCESS_TOKEN_LIFETIME', '5'))),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=14),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': False,
 }
 
+# Materialized worker feed (apps/jobs/feed.py). Use a shared cache backend
+# when running several processes; with the local-memory cache each process
+# keeps its own copy and relies on the TTL to pick up other writers.
+FEED_MATERIALIZATION = os.getenv('FEED_MATERIALIZATION', 'False') == 'True'
+FEED_MATERIALIZATION_SIZE = int(os.getenv('FEED_MATERIALIZATION_SIZE', '500'))
+FEED_MATERIALIZATION_TTL = int(os.getenv('FEED_MATERIALIZATION_TTL', '300'))
+FEED_CACHE_ALIAS = 'default'
+
+# Share of requests timed by jobboard_backend/timing.py (Server-Timing
+# header, jobboard.performance log line, per-route histograms); 0 disables
+PERFORMANCE_SAMPLE_RATE = float(os.getenv('PERFORMANCE_SAMPLE_RATE', '1.0' if DEBUG else '0.05'))
+
+# Prometheus metrics (jobboard_backend/metrics.py): each worker process
+# writes its counters to METRICS_DIR, which GET /metrics sums
+METRICS_DIR = os.getenv('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'jobboard-metrics'))
+METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', '1'))
+# Bearer token required to scrape /metrics; empty leaves it open
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+# Log query shapes repeated N_PLUS_ONE_THRESHOLD times in one request
+# (jobboard_backend/nplusone.py); meant for development and staging
+N_PLUS_ONE_DETECTION = os.getenv('N_PLUS_ONE_DETECTION', str(DEBUG)) == 'True'
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', '5'))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'jobboard.performance': {
+            'handlers': ['console'],
+            'level': os.getenv('PERFORMANCE_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+        'jobboard.nplusone': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
+
 # CORS
 CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', '').split(',') if os.getenv('CORS_ALLOWED_ORIGINS') else []
 
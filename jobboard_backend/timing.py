@@ -0,0 +1,239 @@
+"""
+Per-request performance instrumentation.
+
+``PerformanceMiddleware`` counts every request, its duration and its
+queries in the process metrics (``metrics.py``), and samples
+``PERFORMANCE_SAMPLE_RATE`` of the requests for a detailed breakdown. For
+a sampled request it records:
+
+* ``db``: number and time of the queries run, from an execute wrapper
+  installed on every connection (including the async views' pool threads);
+* ``serialize``: time spent in the views' transform loops, marked with
+  ``span('serialize')``;
+* ``view``: time in the view itself (``TimedViewMixin`` on the DRF views,
+  ``async_read_view`` for the async ones);
+* ``total``: time in the middleware and everything below it.
+
+It adds them to the response as a ``Server-Timing`` header, logs one JSON
+line on the ``jobboard.performance`` logger and folds them into per-route
+histograms of this process (``route_stats``, served to staff by
+``RouteStatsView``). Unsampled requests cost a counter increment per
+query. With ``N_PLUS_ONE_DETECTION`` every request's queries also go
+through the N+1 detector (``nplusone.py``).
+"""
+import contextvars
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from . import metrics
+from .nplusone import QueryShapes
+
+logger = logging.getLogger('jobboard.performance')
+nplusone_logger = logging.getLogger('jobboard.nplusone')
+
+# Upper bounds (ms) of the request duration histogram buckets
+DURATION_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_current = contextvars.ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    def __init__(self, sampled, shapes=None):
+        self.sampled = sampled
+        self.shapes = shapes
+        self.db_queries = 0
+        self.db_ms = 0.0
+        self.spans = {}
+
+
+@contextmanager
+def span(name, include_db=False):
+    """
+    Add the time spent in the block to the ``name`` timing of the current
+    sampled request; queries run in the block are left to ``db`` unless
+    ``include_db``.
+    """
+    timings = _current.get()
+    if timings is None or not timings.sampled:
+        yield
+        return
+    db_before = timings.db_ms
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - started) * 1000.0
+        if not include_db:
+            elapsed -= timings.db_ms - db_before
+        timings.spans[name] = timings.spans.get(name, 0.0) + elapsed
+
+
+class TimedViewMixin:
+    """Records the ``view`` timing of DRF views."""
+
+    def dispatch(self, request, *args, **kwargs):
+        with span('view', include_db=True):
+            return super().dispatch(request, *args, **kwargs)
+
+
+def _record_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    if timings.shapes is not None:
+        timings.shapes.record(sql)
+    if not timings.sampled:
+        timings.db_queries += 1
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db_queries += 1
+        timings.db_ms += (time.perf_counter() - started) * 1000.0
+
+
+def _install(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+connection_created.connect(_install)
+
+
+_stats_lock = threading.Lock()
+_routes = {}
+
+
+def _record_route(route, total_ms, timings):
+    with _stats_lock:
+        stats = _routes.get(route)
+        if stats is None:
+            stats = _routes[route] = {
+                'count': 0, 'totalMs': 0.0, 'dbMs': 0.0, 'dbQueries': 0, 'serializeMs': 0.0,
+                'buckets': [0] * (len(DURATION_BUCKETS) + 1),
+            }
+        stats['count'] += 1
+        stats['totalMs'] += total_ms
+        stats['dbMs'] += timings.db_ms
+        stats['dbQueries'] += timings.db_queries
+        stats['serializeMs'] += timings.spans.get('serialize', 0.0)
+        index = 0
+        while index < len(DURATION_BUCKETS) and total_ms > DURATION_BUCKETS[index]:
+            index += 1
+        stats['buckets'][index] += 1
+
+
+def route_stats():
+    """
+    Sampled requests of this process per route: counts, summed timings and
+    ``buckets``, the request counts per ``DURATION_BUCKETS`` bound (the
+    last one is above every bound).
+    """
+    with _stats_lock:
+        return {route: dict(stats, buckets=list(stats['buckets'])) for route, stats in _routes.items()}
+
+
+class RouteStatsView(APIView):
+    """
+    ``route_stats`` of the serving process, for staff, with the bucket
+    bounds in ``bucketsMs``.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({'bucketsMs': list(DURATION_BUCKETS), 'routes': route_stats()})
+
+
+def _route(request):
+    match = request.resolver_match
+    if match is None:
+        return 'unresolved'
+    return match.url_name or match.route
+
+
+class PerformanceMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        # Connections opened before this module was imported
+        for connection in connections.all(initialized_only=True):
+            _install(connection)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        timings, marker, started = self._before()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(marker)
+        self._after(request, response, timings, started)
+        return response
+
+    async def __acall__(self, request):
+        timings, marker, started = self._before()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(marker)
+        self._after(request, response, timings, started)
+        return response
+
+    def _before(self):
+        rate = getattr(settings, 'PERFORMANCE_SAMPLE_RATE', 0)
+        shapes = None
+        if getattr(settings, 'N_PLUS_ONE_DETECTION', False):
+            shapes = QueryShapes(getattr(settings, 'N_PLUS_ONE_THRESHOLD', 5))
+        timings = RequestTimings(sampled=rate >= 1 or random.random() < rate, shapes=shapes)
+        return timings, _current.set(timings), time.perf_counter()
+
+    def _after(self, request, response, timings, started):
+        total_ms = (time.perf_counter() - started) * 1000.0
+        route = _route(request)
+        labels = {'method': request.method, 'route': route}
+        metrics.inc('jobboard_http_requests_total', dict(labels, status=str(response.status_code)))
+        metrics.observe('jobboard_http_request_duration_seconds', labels, total_ms / 1000.0)
+        metrics.inc('jobboard_db_queries_total', labels, timings.db_queries)
+        metrics.maybe_flush()
+        if timings.shapes is not None:
+            for sql, count, stack in timings.shapes.repeated():
+                nplusone_logger.warning(
+                    'Possible N+1 in %s %s: %d x %s\n%s', request.method, request.path, count, sql, stack
+                )
+        if not timings.sampled:
+            return
+
+        entries = [f'db;dur={timings.db_ms:.1f};desc="{timings.db_queries} queries"']
+        entries += [f'{name};dur={duration:.1f}' for name, duration in timings.spans.items()]
+        entries.append(f'total;dur={total_ms:.1f}')
+        response['Server-Timing'] = ', '.join(entries)
+
+        route = f'{request.method} {route}'
+        _record_route(route, total_ms, timings)
+        fields = {
+            'route': route,
+            'path': request.path,
+            'status': response.status_code,
+            'totalMs': round(total_ms, 2),
+            'dbQueries': timings.db_queries,
+            'dbMs': round(timings.db_ms, 2),
+        }
+        fields.update({f'{name}Ms': round(duration, 2) for name, duration in timings.spans.items()})
+        logger.info(json.dumps(fields), extra={'performance': fields})
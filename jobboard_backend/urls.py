@@ -17,20 +17,26 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import TokenRefreshView
-from apps.users.views import LoginView
+from apps.users.views import LoginView, RefreshView
 from apps.workers.views import WorkersViewSet
-from apps.jobs.views import JobsViewSet
+from apps.jobs.views import JobsViewSet, WorkerJobsView
 from apps.applications.views import ApplicationsViewSet
+from apps.reviews.views import ReviewsViewSet
+from .metrics import metrics_view
+from .timing import RouteStatsView
 
 router = DefaultRouter()
 router.register(r"workers", WorkersViewSet, basename="workers")
 router.register(r"jobs", JobsViewSet, basename="jobs")
 router.register(r"applications", ApplicationsViewSet, basename="applications")
+router.register(r"reviews", ReviewsViewSet, basename="reviews")
 
 urlpatterns = [
 	path('admin/', admin.site.urls),
 	path('api/v1/', include(router.urls)),
+	path('api/v1/worker/<int:worker_id>/jobs', WorkerJobsView.as_view()),
 	path('api/v1/auth/login', LoginView.as_view()),
-	path('api/v1/auth/refresh', TokenRefreshView.as_view(), name='token_refresh'),
+	path('api/v1/auth/refresh', RefreshView.as_view(), name='token_refresh'),
+	path('api/v1/performance/routes', RouteStatsView.as_view(), name='performance-routes'),
+	path('metrics', metrics_view, name='metrics'),
 ]
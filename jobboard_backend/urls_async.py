@@ -0,0 +1,19 @@
+"""
+URL configuration for ASGI deployments (``ASYNC_READ_VIEWS``).
+
+The hot read endpoints resolve to their async-native views first; every
+other route, and every request those views hand back, is served by the
+regular URLconf. They share the names of the routes they shadow.
+"""
+from django.urls import path
+from apps.jobs.async_views import job_feed, job_list
+from apps.workers.async_views import worker_list
+from apps.applications.async_views import application_list
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+	path('api/v1/jobs/', job_list, name='jobs-list'),
+	path('api/v1/jobs/feed/', job_feed, name='jobs-feed'),
+	path('api/v1/workers/', worker_list, name='workers-list'),
+	path('api/v1/applications/', application_list, name='applications-list'),
+] + sync_urlpatterns
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+"""
+WSGI vs ASGI throughput of the hot read endpoints.
+
+Seeds a scratch database, then keeps ``--connections`` clients busy
+requesting ``/api/v1/jobs/``, ``/api/v1/jobs/feed/``, ``/api/v1/workers/``
+and ``/api/v1/applications/`` for ``--seconds`` in each mode, reporting
+requests/s and latency percentiles:
+
+* WSGI: Django's WSGI handler with the synchronous views, served by a pool
+  of ``--threads`` server threads (the connections queue for them, as on a
+  threaded WSGI server).
+* ASGI: Django's ASGI handler with the async views (``urls_async.py``),
+  every connection a coroutine on one event loop.
+
+The handlers are driven in-process, without sockets, so the numbers
+compare the application paths rather than HTTP servers.
+
+    python scripts/bench_asgi.py --connections 500 --seconds 10
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from decimal import Decimal
+from io import BytesIO
+
+from bench_common import scratch_database, report
+
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connection
+from django.test.utils import override_settings
+from django.urls import clear_url_caches
+
+from apps.users.models import User
+from apps.users.authentication import tokens_for_user
+from apps.jobs.models import Job
+from apps.applications.models import Application
+from apps.workers.models import WorkerProfile
+
+CATEGORIES = ['Plumbing', 'Cleaning', 'Electrical', 'Carpentry', 'Painting', 'Gardening', 'Moving', 'General Labor']
+
+
+def seed(num_workers, num_jobs):
+    rng = random.Random(21)
+    client = User.objects.create(email='client@bench.local', name='Client', role='client')
+    workers = User.objects.bulk_create(
+        [User(email=f'worker{i}@bench.local', name=f'Worker {i}', role='worker') for i in range(num_workers)]
+    )
+    WorkerProfile.objects.bulk_create([
+        WorkerProfile(
+            user=worker, category=rng.choice(CATEGORIES), location='Nairobi',
+            hourly_rate=Decimal(rng.randint(300, 2000)), rating=Decimal(rng.randint(30, 50)) / 10,
+        )
+        for worker in workers
+    ])
+    jobs = Job.objects.bulk_create([
+        Job(
+            client=client, title=f'Job {i}', category=rng.choice(CATEGORIES), description='Benchmark job',
+            location='Nairobi', budget=Decimal(rng.randint(500, 20000)),
+        )
+        for i in range(num_jobs)
+    ])
+    Application.objects.bulk_create([
+        Application(job=job, worker=worker, message='Available', quote=job.budget)
+        for job in jobs[:50] for worker in rng.sample(workers, 3)
+    ])
+    return client, workers[0]
+
+
+def request_plan(client, worker):
+    """``(path, query_string, token)`` of each request, cycled by every connection."""
+    client_token = f'Bearer {tokens_for_user(client).access_token}'
+    worker_token = f'Bearer {tokens_for_user(worker).access_token}'
+    return [
+        ('/api/v1/jobs/', 'cursor=&limit=20', client_token),
+        ('/api/v1/jobs/feed/', 'cursor=&limit=20', worker_token),
+        ('/api/v1/workers/', 'category=Plumbing&page=2', client_token),
+        ('/api/v1/applications/', '', client_token),
+    ]
+
+
+def run_wsgi(plan, connections, threads, seconds):
+    handler = WSGIHandler()
+    latencies = []
+    errors = []
+
+    def call(path, query_string, token):
+        environ = {
+            'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': query_string,
+            'SERVER_NAME': 'testserver', 'SERVER_PORT': '80', 'HTTP_HOST': 'testserver',
+            'HTTP_AUTHORIZATION': token, 'wsgi.input': BytesIO(), 'wsgi.url_scheme': 'http',
+            'wsgi.errors': BytesIO(),
+        }
+        status = []
+        body = handler(environ, lambda code, headers: status.append(code))
+        b''.join(body)
+        body.close()
+        return status[0]
+
+    requests = itertools.cycle(plan)
+    start = time.perf_counter()
+    deadline = start + seconds
+    with ThreadPoolExecutor(max_workers=threads) as server:
+        # Every connection keeps one request queued or in flight; latency
+        # includes the wait for a server thread
+        pending = {}
+        for _ in range(connections):
+            pending[server.submit(call, *next(requests))] = time.perf_counter()
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                started = pending.pop(future)
+                latencies.append((time.perf_counter() - started) * 1000.0)
+                if not future.result().startswith('200'):
+                    errors.append(future.result())
+                if time.perf_counter() < deadline:
+                    pending[server.submit(call, *next(requests))] = time.perf_counter()
+    return len(latencies) / (time.perf_counter() - start), latencies, errors
+
+
+def run_asgi(plan, connections, seconds):
+    handler = ASGIHandler()
+    latencies = []
+    errors = []
+
+    async def call(path, query_string, token):
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'root_path': '',
+            'query_string': query_string.encode(), 'client': ('127.0.0.1', 50000),
+            'server': ('testserver', 80),
+            'headers': [(b'host', b'testserver'), (b'authorization', token.encode())],
+        }
+        disconnect = asyncio.Event()
+        status = []
+
+        async def receive():
+            if not status:
+                status.append(None)
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await disconnect.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status[0] = message['status']
+            elif not message.get('more_body'):
+                disconnect.set()
+
+        await handler(scope, receive, send)
+        return status[0]
+
+    async def connection_loop(requests, deadline):
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            status = await call(*next(requests))
+            if status != 200:
+                errors.append(status)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+
+    async def main():
+        requests = itertools.cycle(plan)
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(connection_loop(requests, deadline) for _ in range(connections)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return len(latencies) / (time.perf_counter() - start), latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--connections', type=int, default=500)
+    parser.add_argument('--threads', type=int, default=32, help='WSGI server threads.')
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=2000)
+    parser.add_argument('--jobs', type=int, default=5000)
+    args = parser.parse_args()
+    logging.getLogger('django.request').setLevel(logging.CRITICAL)
+
+    if connection.vendor == 'sqlite':
+        # Server threads need their own connections to one shared database
+        connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.gettempdir(), 'bench_asgi.sqlite3')
+        connection.settings_dict['OPTIONS'].setdefault('timeout', 30)
+
+    with scratch_database():
+        plan = request_plan(*seed(args.workers, args.jobs))
+        print(f"{args.connections} connections, {args.seconds:.0f}s per mode, {connection.vendor}")
+
+        modes = [
+            ('wsgi', 'jobboard_backend.urls', lambda: run_wsgi(plan, args.connections, args.threads, args.seconds)),
+            ('asgi', 'jobboard_backend.urls_async', lambda: run_asgi(plan, args.connections, args.seconds)),
+        ]
+        for label, urlconf, run in modes:
+            cache.clear()
+            with override_settings(ROOT_URLCONF=urlconf):
+                clear_url_caches()
+                rate, latencies, errors = run()
+            clear_url_caches()
+            report(f'{label}: {rate:.0f} req/s, {len(errors)} errors', latencies)
+
+
+if __name__ == '__main__':
+    main()
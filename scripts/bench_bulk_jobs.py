@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Bulk job import and status update benchmark.
+
+Creates ``--jobs`` jobs in one ``POST /api/v1/jobs/bulk/`` request, cancels
+them all in one ``PATCH /api/v1/jobs/bulk-status/`` request, and compares
+the per-job cost with ``--single`` one-at-a-time ``POST /api/v1/jobs/``
+calls.
+
+    python scripts/bench_bulk_jobs.py --jobs 10000
+"""
+
+import argparse
+import random
+
+from bench_common import scratch_database, timed
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+
+CATEGORIES = ['Plumbing', 'Cleaning', 'Electrical', 'Carpentry', 'Painting', 'Gardening', 'Moving', 'General Labor']
+
+
+def job_payloads(count, invited_ids):
+    rng = random.Random(7)
+    return [
+        {
+            'title': f'Imported job {i}',
+            'category': rng.choice(CATEGORIES),
+            'description': 'Imported from the agency catalogue',
+            'location': 'Nairobi',
+            'latitude': -1.29 + rng.uniform(-0.2, 0.2),
+            'longitude': 36.82 + rng.uniform(-0.2, 0.2),
+            'budget': f'{rng.randint(500, 20000)}.00',
+            'invited_worker_id': rng.choice(invited_ids) if i % 10 == 0 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def measure(label, count, fn, *args, **kwargs):
+    with CaptureQueriesContext(connection) as queries:
+        elapsed_ms, response = timed(fn, *args, **kwargs)
+    assert response.status_code in (200, 201), response.content[:500]
+    print(
+        f"{label}: {count} jobs in {elapsed_ms:.0f}ms "
+        f"({count / (elapsed_ms / 1000.0):.0f} jobs/s, {len(queries)} queries)"
+    )
+    return response, elapsed_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=10000)
+    parser.add_argument('--single', type=int, default=200)
+    args = parser.parse_args()
+
+    with scratch_database():
+        client = User.objects.create(email='agency@bench.local', name='Agency', role='client')
+        workers = User.objects.bulk_create(
+            [User(email=f'worker{i}@bench.local', name=f'Worker {i}', role='worker') for i in range(50)]
+        )
+        api = APIClient()
+        api.force_authenticate(client)
+
+        single = job_payloads(args.single, [worker.id for worker in workers])
+        single_ms = 0.0
+        for payload in single:
+            elapsed_ms, response = timed(api.post, '/api/v1/jobs/', payload, format='json')
+            assert response.status_code == 201, response.content[:500]
+            single_ms += elapsed_ms
+        print(f"single create: {args.single} jobs in {single_ms:.0f}ms ({args.single / (single_ms / 1000.0):.0f} jobs/s)")
+
+        payloads = job_payloads(args.jobs, [worker.id for worker in workers])
+        response, _ = measure('bulk create', args.jobs, api.post, '/api/v1/jobs/bulk/', payloads, format='json')
+        changes = [{'id': job_id, 'status': 'cancelled'} for job_id in response.json()['ids']]
+        measure('bulk status', args.jobs, api.patch, '/api/v1/jobs/bulk-status/', changes, format='json')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Shared helpers for the benchmark scripts in this directory.
+
+Benchmarks always run against a throwaway test database (the same one
+``manage.py test`` would create), never against the configured database.
+"""
+
+import os
+import sys
+import time
+import contextlib
+
+# Add the project directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobboard_backend.settings')
+# Keep per-request timing (and its log lines) out of the measurements
+os.environ.setdefault('PERFORMANCE_SAMPLE_RATE', '0')
+
+import django
+
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+
+@contextlib.contextmanager
+def scratch_database(keepdb=False):
+    """Create the test database, yield, then destroy it."""
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+        teardown_test_environment()
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def timed(fn, *args, **kwargs):
+    """Run ``fn`` and return ``(elapsed_ms, result)``."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000.0, result
+
+
+def report(label, samples_ms):
+    """Print p50/p95/p99/max for a list of latencies in milliseconds."""
+    print(
+        f"{label}: n={len(samples_ms)} "
+        f"p50={percentile(samples_ms, 50):.2f}ms "
+        f"p95={percentile(samples_ms, 95):.2f}ms "
+        f"p99={percentile(samples_ms, 99):.2f}ms "
+        f"max={max(samples_ms) if samples_ms else 0:.2f}ms"
+    )
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Worker job feed benchmark.
+
+Seeds a scratch database with workers, pending jobs and applications, then
+reports feed latency percentiles for the legacy NOT IN / icontains query and
+for the index-backed NOT EXISTS feed served through ``/api/v1/jobs/feed/``.
+
+    python scripts/bench_feed.py --workers 10000 --jobs 500000
+"""
+
+import argparse
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+from bench_common import scratch_database, timed, report
+
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.jobs.models import Job
+from apps.jobs.feed import build_feed_queryset
+from apps.applications.models import Application
+
+CATEGORIES = ['Plumbing', 'Cleaning', 'Electrical', 'Carpentry', 'Painting', 'Gardening', 'Moving', 'General Labor']
+LOCATIONS = ['Nairobi West', 'Nairobi Central', 'Nairobi East', 'Westlands', 'Kilimani', 'Karen']
+STATUSES = ['pending'] * 6 + ['accepted', 'in_progress', 'completed', 'cancelled']
+BATCH_SIZE = 5000
+
+
+def seed(num_workers, num_clients, num_jobs, apps_per_worker):
+    rng = random.Random(42)
+    print(f"Seeding {num_clients} clients, {num_workers} workers, {num_jobs} jobs...")
+
+    User.objects.bulk_create(
+        [User(email=f'client{i}@bench.local', name=f'Client {i}', role='client') for i in range(num_clients)],
+        batch_size=BATCH_SIZE,
+    )
+    User.objects.bulk_create(
+        [User(email=f'worker{i}@bench.local', name=f'Worker {i}', role='worker') for i in range(num_workers)],
+        batch_size=BATCH_SIZE,
+    )
+    client_ids = list(User.objects.filter(role='client').values_list('id', flat=True))
+    worker_ids = list(User.objects.filter(role='worker').values_list('id', flat=True))
+
+    now = timezone.now()
+    for start in range(0, num_jobs, BATCH_SIZE):
+        Job.objects.bulk_create([
+            Job(
+                client_id=rng.choice(client_ids),
+                title=f'Job {i}',
+                category=rng.choice(CATEGORIES),
+                description='Benchmark job',
+                location=rng.choice(LOCATIONS),
+                budget=Decimal(rng.randint(500, 20000)),
+                status=rng.choice(STATUSES),
+            )
+            for i in range(start, min(start + BATCH_SIZE, num_jobs))
+        ])
+    # auto_now_add stamps every row with "now"; spread the batches out so
+    # the ordering column has realistic cardinality.
+    job_ids = list(Job.objects.order_by('id').values_list('id', flat=True))
+    for start in range(0, len(job_ids), 100):
+        Job.objects.filter(id__in=job_ids[start:start + 100]).update(
+            created_at=now - timedelta(minutes=len(job_ids) - start)
+        )
+
+    pending_ids = list(Job.objects.filter(status='pending').values_list('id', flat=True))
+    applications = []
+    for worker_id in worker_ids:
+        for job_id in rng.sample(pending_ids, min(apps_per_worker, len(pending_ids))):
+            applications.append(Application(job_id=job_id, worker_id=worker_id, message='bench', quote=Decimal('100')))
+        if len(applications) >= BATCH_SIZE:
+            Application.objects.bulk_create(applications, ignore_conflicts=True)
+            applications = []
+    Application.objects.bulk_create(applications, ignore_conflicts=True)
+    return worker_ids
+
+
+def legacy_feed(worker, category):
+    applied_job_ids = Application.objects.filter(worker=worker).values_list('job_id', flat=True)
+    queryset = Job.objects.filter(status='pending').exclude(id__in=applied_job_ids).select_related('client').order_by('-created_at')
+    return queryset.filter(category__icontains=category)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the worker job feed')
+    parser.add_argument('--workers', type=int, default=10000)
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--jobs', type=int, default=500000)
+    parser.add_argument('--apps-per-worker', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    with scratch_database():
+        worker_ids = seed(args.workers, args.clients, args.jobs, args.apps_per_worker)
+        rng = random.Random(7)
+        sample = [(User(id=rng.choice(worker_ids), role='worker'), rng.choice(CATEGORIES)) for _ in range(args.requests)]
+
+        legacy, engine, endpoint = [], [], []
+        for worker, category in sample:
+            elapsed, _ = timed(lambda: list(legacy_feed(worker, category)[:args.limit]))
+            legacy.append(elapsed)
+            elapsed, _ = timed(lambda: list(build_feed_queryset(worker, category=category)[:args.limit]))
+            engine.append(elapsed)
+
+        api = APIClient()
+        for worker, category in sample:
+            api.force_authenticate(worker)
+            elapsed, response = timed(api.get, '/api/v1/jobs/feed/', {'cursor': '', 'limit': args.limit, 'category': category})
+            assert response.status_code == 200, response.content
+            endpoint.append(elapsed)
+
+        print(f"\n{args.workers} workers x {args.jobs} jobs, page size {args.limit}")
+        report('legacy NOT IN query  ', legacy)
+        report('NOT EXISTS feed query', engine)
+        report('feed endpoint        ', endpoint)
+
+
+if __name__ == '__main__':
+    main()
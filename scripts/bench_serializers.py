@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Job payload serialization microbenchmark.
+
+Compares the per-item cost of the original path (``JobSerializer`` with
+nested users, then a hand-built camelCase dict) with ``MockJobSerializer``
+working on ``.values()`` rows, including the query, for N jobs.
+
+    python scripts/bench_serializers.py --jobs 10000
+"""
+
+import argparse
+import random
+from decimal import Decimal
+
+from bench_common import scratch_database, timed
+
+from apps.users.models import User
+from apps.jobs.models import Job
+from apps.jobs.serializers import JobSerializer, MockJobSerializer
+
+STATUSES = ['pending', 'accepted', 'in_progress', 'completed', 'cancelled']
+
+
+def seed(num_jobs):
+    rng = random.Random(42)
+    clients = User.objects.bulk_create([User(email=f'client{i}@bench.local', name=f'Client {i}', role='client') for i in range(50)])
+    workers = User.objects.bulk_create([User(email=f'worker{i}@bench.local', name=f'Worker {i}', role='worker') for i in range(50)])
+    Job.objects.bulk_create([
+        Job(
+            client=rng.choice(clients),
+            worker=rng.choice(workers) if rng.random() < 0.5 else None,
+            title=f'Job {i}',
+            category='Plumbing',
+            description='Benchmark job',
+            location='Nairobi',
+            budget=Decimal(rng.randint(500, 20000)),
+            deadline='2024-03-01' if i % 2 else None,
+            status=rng.choice(STATUSES),
+        )
+        for i in range(num_jobs)
+    ], batch_size=2000)
+
+
+def legacy_payload(queryset):
+    serializer = JobSerializer(queryset, many=True)
+    jobs_data = []
+    for item in serializer.data:
+        jobs_data.append({
+            'id': item['id'],
+            'clientId': item['client']['id'],
+            'workerId': item['worker']['id'] if item['worker'] else None,
+            'title': item['title'],
+            'description': item['description'],
+            'category': item['category'],
+            'location': item['location'],
+            'budget': float(item['budget']),
+            'deadline': item['deadline'],
+            'status': item['status'],
+            'createdAt': item['created_at'],
+            'scheduledDate': None,
+            'completedDate': None if item['status'] != 'completed' else item['created_at']
+        })
+    return jobs_data
+
+
+def fast_payload(queryset):
+    return MockJobSerializer.many(MockJobSerializer.values(queryset))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark job payload serialization')
+    parser.add_argument('--jobs', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    with scratch_database():
+        seed(args.jobs)
+        queryset = Job.objects.select_related('client', 'worker').order_by('-created_at', '-id')
+
+        assert legacy_payload(queryset) == fast_payload(queryset), 'payloads differ'
+
+        for label, fn in (('JobSerializer + transform', legacy_payload), ('MockJobSerializer      ', fast_payload)):
+            best = min(timed(fn, queryset)[0] for _ in range(args.rounds))
+            print(f"{label}: {best:.1f}ms for {args.jobs} jobs, {best * 1000 / args.jobs:.2f}us/item (best of {args.rounds})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+"""
+Per-endpoint query budgets.
+
+Every route of ``jobboard_backend/urls.py`` (outside the admin) declares, per
+HTTP method, the most queries one request may run. Routes that return or
+accept a variable number of items are requested with 1, 10 and 100 of them
+(``?limit=``, the number of jobs a client owns, the length of a bulk
+payload...), so a query per item shows up as a budget failure at the
+larger sizes. Each request runs against a freshly seeded scratch database
+inside a rolled-back transaction, with the caches cleared, and savepoint
+statements are not counted.
+
+The check fails (exit status 1) when a request exceeds its budget, does not
+return the expected status, or when a route has no budget declared for one
+of its methods. Failures list the query shapes the request repeated (see
+``jobboard_backend/nplusone.py``).
+
+    python scripts/check_query_budgets.py [--verbose]
+"""
+
+import argparse
+import random
+import sys
+from collections import namedtuple
+from decimal import Decimal
+
+from bench_common import scratch_database
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.users.authentication import tokens_for_user
+from apps.jobs.models import Job
+from apps.applications.models import Application
+from apps.workers.models import WorkerProfile
+from apps.reviews.models import Review
+from jobboard_backend.nplusone import repeated_shapes
+
+SIZES = (1, 10, 100)
+# Shapes repeated this often in one request are reported on failure
+REPEAT_THRESHOLD = 3
+REVIEWS_PER_WORKER = 4
+PASSWORD = 'budget-password'
+
+# ``build(fixture, size)`` returns ``(path, data)``; ``size`` is None for
+# routes that do not scale with an item count.
+Case = namedtuple('Case', 'method route user budget status build sized')
+
+
+def case(method, route, user, budget, build, status=200, sized=False):
+    return Case(method, route, user, budget, status, build, sized)
+
+
+CASES = [
+    case('GET', 'api-root', 'client', 0, lambda f, n: ('/api/v1/', None)),
+    case('POST', 'api/v1/auth/login', None, 1,
+         lambda f, n: ('/api/v1/auth/login', {'email': f.client(1).email, 'password': PASSWORD})),
+    case('POST', 'token_refresh', None, 1,
+         lambda f, n: ('/api/v1/auth/refresh', {'refresh': str(tokens_for_user(f.client(1)))})),
+    case('GET', 'metrics', None, 0, lambda f, n: ('/metrics', None)),
+    case('GET', 'performance-routes', 'staff', 0, lambda f, n: ('/api/v1/performance/routes', None)),
+
+    case('GET', 'workers-list', 'client', 4, sized=True,
+         build=lambda f, n: (f'/api/v1/workers/?limit={n}', None)),
+    case('GET', 'workers-cache-metrics', 'staff', 0, lambda f, n: ('/api/v1/workers/cache-stats/', None)),
+    case('GET', 'workers-categories', 'client', 0, lambda f, n: ('/api/v1/workers/categories/', None)),
+    case('GET', 'workers-detail', 'client', 3,
+         lambda f, n: (f'/api/v1/workers/{f.workers[0].worker_profile.id}/', None)),
+
+    case('GET', 'jobs-list', 'sized-client', 2, sized=True,
+         build=lambda f, n: ('/api/v1/jobs/', None)),
+    case('POST', 'jobs-list', 'client', 1, status=201,
+         build=lambda f, n: ('/api/v1/jobs/', f.job_payload(0))),
+    case('GET', 'jobs-feed', 'worker', 2, sized=True,
+         build=lambda f, n: (f'/api/v1/jobs/feed/?cursor=&limit={n}', None)),
+    case('GET', 'jobs-export', 'staff', 1, sized=True,
+         build=lambda f, n: (f'/api/v1/jobs/export/?client_id={f.client(n).id}', None)),
+    case('POST', 'jobs-bulk', 'client', 2, status=201, sized=True,
+         build=lambda f, n: ('/api/v1/jobs/bulk/', [f.job_payload(i) for i in range(n)])),
+    case('PATCH', 'jobs-bulk-status', 'sized-client', 2, sized=True,
+         build=lambda f, n: ('/api/v1/jobs/bulk-status/', [
+             {'id': job_id, 'status': Job.STATUS_CANCELLED} for job_id in f.pending_job_ids(n)
+         ])),
+    case('GET', 'jobs-detail', 'client', 1, lambda f, n: (f'/api/v1/jobs/{f.job(1).id}/', None)),
+    case('PUT', 'jobs-detail', 'client', 2, lambda f, n: (f'/api/v1/jobs/{f.job(1).id}/', f.job_payload(0))),
+    case('PATCH', 'jobs-detail', 'client', 2,
+         lambda f, n: (f'/api/v1/jobs/{f.job(1).id}/', {'title': 'Renamed job'})),
+    case('DELETE', 'jobs-detail', 'client', 4, status=204, build=lambda f, n: (f'/api/v1/jobs/{f.job(1).id}/', None)),
+    case('POST', 'jobs-applications', 'applicant', 3, status=201,
+         build=lambda f, n: (f'/api/v1/jobs/{f.job(1).id}/applications/', {'message': 'Available', 'quote': 500})),
+    case('POST', 'jobs-invitations', 'client', 2,
+         lambda f, n: (f'/api/v1/jobs/{f.job(1).id}/invitations/', {'workerId': f.workers[0].id})),
+
+    case('GET', 'applications-list', 'sized-client', 3, sized=True,
+         build=lambda f, n: (f'/api/v1/applications/?job_id={f.job(n).id}', None)),
+    case('GET', 'applications-export', 'sized-client', 1, sized=True,
+         build=lambda f, n: (f'/api/v1/applications/export/?job_id={f.job(n).id}', None)),
+    case('POST', 'applications-bulk', 'applicant', 5, sized=True,
+         build=lambda f, n: ('/api/v1/applications/bulk/', [
+             {'jobId': job_id, 'message': 'Available', 'quote': 500} for job_id in f.pending_job_ids(n)
+         ])),
+    case('GET', 'applications-detail', 'client', 1,
+         lambda f, n: (f'/api/v1/applications/{f.application(1).id}/', None)),
+    case('POST', 'applications-accept', 'client', 3,
+         lambda f, n: (f'/api/v1/applications/{f.application(1).id}/accept/', None)),
+    case('POST', 'applications-reject', 'client', 3,
+         lambda f, n: (f'/api/v1/applications/{f.application(1).id}/reject/', None)),
+
+    case('POST', 'reviews-list', 'reviewer', 3, status=201,
+         build=lambda f, n: ('/api/v1/reviews/', {'jobId': f.unreviewed_job.id, 'rating': 5, 'comment': 'Great'})),
+    case('GET', 'api/v1/worker/<int:worker_id>/jobs', 'worker', 4, sized=True,
+         build=lambda f, n: (f'/api/v1/worker/{f.workers[0].id}/jobs?limit={n}', None)),
+]
+
+
+class Fixture:
+    """
+    Seed data: for every size ``n`` a client owning ``n`` pending jobs, the
+    first of which has ``n`` applications; 100 workers with reviews; 100
+    jobs per status bucket assigned to the first worker; one completed job
+    without a review.
+    """
+
+    def __init__(self):
+        rng = random.Random(25)
+        self.staff = User.objects.create(email='staff@budget.local', name='Staff', role='client', is_staff=True)
+        self.workers = User.objects.bulk_create(
+            [User(email=f'worker{i}@budget.local', name=f'Worker {i}', role='worker') for i in range(max(SIZES))]
+        )
+        WorkerProfile.objects.bulk_create([
+            WorkerProfile(user=worker, category='Plumbing', location='Nairobi', hourly_rate=500)
+            for worker in self.workers
+        ])
+        self.applicant = User.objects.create(email='applicant@budget.local', name='Applicant', role='worker')
+
+        self.clients = {}
+        self.jobs = {}
+        for size in SIZES:
+            client = User(email=f'client{size}@budget.local', name=f'Client {size}', role='client')
+            client.set_password(PASSWORD)
+            client.save()
+            self.clients[size] = client
+            self.jobs[size] = Job.objects.bulk_create([self._job(client, i) for i in range(size)])
+        self.applications = {
+            size: Application.objects.bulk_create([
+                Application(job=self.jobs[size][0], worker=worker, message='Available', quote=Decimal(400))
+                for worker in self.workers[:size]
+            ])
+            for size in SIZES
+        }
+        for size in SIZES:
+            Job.objects.filter(id=self.jobs[size][0].id).update(application_count=size, pending_application_count=size)
+
+        reviewer = self.clients[max(SIZES)]
+        assigned = [
+            self._job(reviewer, i, worker=self.workers[0], status=status)
+            for status in (Job.STATUS_ACCEPTED, Job.STATUS_IN_PROGRESS, Job.STATUS_COMPLETED)
+            for i in range(max(SIZES))
+        ]
+        reviewed = [
+            self._job(reviewer, i, worker=worker, status=Job.STATUS_COMPLETED)
+            for worker in self.workers for i in range(REVIEWS_PER_WORKER)
+        ]
+        Job.objects.bulk_create(assigned + reviewed)
+        Review.objects.bulk_create([
+            Review(job=job, client=reviewer, worker_id=job.worker_id, rating=rng.randint(1, 5), comment='Fine')
+            for job in reviewed
+        ])
+        self.unreviewed_job = Job.objects.create(**self._fields(reviewer, 'Unreviewed', self.workers[1], Job.STATUS_COMPLETED))
+
+    def _fields(self, client, title, worker=None, status=Job.STATUS_PENDING):
+        return dict(
+            client=client, worker=worker, status=status, title=title, category='Plumbing',
+            description='Budget check job', location='Nairobi', budget=Decimal(1000),
+        )
+
+    def _job(self, client, index, worker=None, status=Job.STATUS_PENDING):
+        return Job(**self._fields(client, f'Job {index}', worker, status))
+
+    def client(self, size):
+        return self.clients[size]
+
+    def job(self, size):
+        return self.jobs[size][0]
+
+    def application(self, size):
+        return self.applications[size][0]
+
+    def pending_job_ids(self, size):
+        return [job.id for job in self.jobs[size]]
+
+    def job_payload(self, index):
+        return {
+            'title': f'New job {index}', 'category': 'Plumbing', 'description': 'Budget check job',
+            'location': 'Nairobi', 'budget': '1000.00',
+        }
+
+    def user(self, role, size):
+        return {
+            'client': self.clients[1],
+            'sized-client': self.clients[size or 1],
+            'reviewer': self.clients[max(SIZES)],
+            'staff': self.staff,
+            'worker': self.workers[0],
+            'applicant': self.applicant,
+        }[role]
+
+
+def declared_routes():
+    """``{(method, route)}`` of every non-admin route, from the URLconf."""
+    routes = set()
+
+    def walk(patterns, prefix=''):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                if getattr(pattern, 'app_name', None) != 'admin':
+                    walk(pattern.url_patterns, prefix + str(pattern.pattern))
+                continue
+            if not isinstance(pattern, URLPattern) or 'format' in pattern.pattern.regex.groupindex:
+                continue
+            callback = pattern.callback
+            route = pattern.name or prefix + str(pattern.pattern)
+            if getattr(callback, 'actions', None):
+                methods = callback.actions
+            elif getattr(callback, 'view_class', None):
+                methods = [
+                    method for method in callback.view_class.http_method_names
+                    if method not in ('options', 'head') and hasattr(callback.view_class, method)
+                ]
+            else:
+                methods = ['get']
+            routes.update((method.upper(), route) for method in methods)
+
+    walk(get_resolver().url_patterns)
+    return routes
+
+
+def counted(queries):
+    """SQL of the captured queries, without transaction control statements."""
+    return [
+        query['sql'] for query in queries
+        if not query['sql'].upper().startswith(('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT'))
+    ]
+
+
+class Rollback(Exception):
+    pass
+
+
+def run(fixture, check, size):
+    api = APIClient()
+    user = fixture.user(check.user, size) if check.user else None
+    if user is not None:
+        api.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens_for_user(user).access_token}')
+    path, data = check.build(fixture, size)
+    cache.clear()
+    try:
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                if data is None:
+                    response = getattr(api, check.method.lower())(path)
+                else:
+                    response = getattr(api, check.method.lower())(path, data, format='json')
+                if getattr(response, 'streaming', False):
+                    b''.join(response.streaming_content)
+            raise Rollback
+    except Rollback:
+        pass
+    return response.status_code, counted(queries.captured_queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--verbose', action='store_true', help='Print the queries of failing requests.')
+    args = parser.parse_args()
+
+    failures = []
+    covered = {(check.method, check.route) for check in CASES}
+    for method, route in sorted(declared_routes() - covered):
+        failures.append(f'{method} {route}: no query budget declared')
+
+    with scratch_database():
+        fixture = Fixture()
+        for check in CASES:
+            for size in SIZES if check.sized else (None,):
+                status, statements = run(fixture, check, size)
+                label = f'{check.method} {check.route}' + (f' [{size}]' if size else '')
+                print(f'{label}: {len(statements)}/{check.budget} queries, status {status}')
+                problems = []
+                if status != check.status:
+                    problems.append(f'status {status}, expected {check.status}')
+                if len(statements) > check.budget:
+                    problems.append(f'{len(statements)} queries, budget {check.budget}')
+                if problems:
+                    failures.append(f'{label}: {"; ".join(problems)}')
+                    for sql, count in repeated_shapes(statements, REPEAT_THRESHOLD):
+                        failures.append(f'    repeated {count}x: {sql}')
+                    if args.verbose:
+                        failures.extend(f'    {sql}' for sql in statements)
+
+    if failures:
+        sys.exit('\n'.join(['FAILED:'] + failures))
+    print('OK: every route within its query budget')
+
+
+if __name__ == '__main__':
+    main()
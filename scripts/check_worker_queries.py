@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Worker list query-count check.
+
+Seeds workers with several reviews each and requests pages of 10, 50 and
+100 workers (``?limit=``), failing if the number of queries grows with the
+page size, i.e. if embedding the latest reviews turned into N+1 queries.
+The response and count caches are cleared before every request.
+
+    python scripts/check_worker_queries.py
+"""
+
+import argparse
+import random
+import sys
+
+from bench_common import scratch_database, timed
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.jobs.models import Job
+from apps.workers.models import WorkerProfile
+from apps.workers.views import WORKER_REVIEWS_LIMIT
+from apps.reviews.models import Review
+
+
+def seed(num_workers, reviews_per_worker):
+    rng = random.Random(19)
+    client = User.objects.create(email='client@bench.local', name='Client', role='client')
+    workers = User.objects.bulk_create(
+        [User(email=f'worker{i}@bench.local', name=f'Worker {i}', role='worker') for i in range(num_workers)]
+    )
+    WorkerProfile.objects.bulk_create([
+        WorkerProfile(user=worker, category='Plumbing', location='Nairobi', hourly_rate=500)
+        for worker in workers
+    ])
+    jobs = Job.objects.bulk_create([
+        Job(client=client, worker=worker, status=Job.STATUS_COMPLETED, title='Job', category='Plumbing',
+            description='Benchmark job', location='Nairobi', budget=1000)
+        for worker in workers for _ in range(reviews_per_worker)
+    ])
+    Review.objects.bulk_create([
+        Review(job=job, client=client, worker_id=job.worker_id, rating=rng.randint(1, 5), comment='Fine')
+        for job in jobs
+    ])
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reviews', type=int, default=WORKER_REVIEWS_LIMIT + 2, help='Reviews per worker.')
+    args = parser.parse_args()
+
+    with scratch_database():
+        api = APIClient()
+        api.force_authenticate(seed(150, args.reviews))
+
+        counts = {}
+        for limit in (10, 50, 100):
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                elapsed_ms, response = timed(api.get, '/api/v1/workers/', {'limit': limit})
+            workers = response.json()['workers']
+            assert len(workers) == limit, len(workers)
+            assert all(len(worker['reviews']) == min(args.reviews, WORKER_REVIEWS_LIMIT) for worker in workers)
+            counts[limit] = len(queries)
+            print(f"limit={limit}: {len(queries)} queries, {elapsed_ms:.1f}ms")
+
+        if len(set(counts.values())) != 1:
+            sys.exit(f"Query count grows with the page size: {counts}")
+        print("OK: constant query count")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Concurrent application acceptance stress test.
+
+Each round posts a job with ``--applicants`` applications and fires one
+accept per application at ``/api/v1/applications/{id}/accept/`` from as
+many threads at once, then checks that exactly one accept succeeded, the
+job is assigned to that worker, and every other application was rejected.
+
+    python scripts/stress_accept.py --rounds 50 --applicants 16
+
+Run it against PostgreSQL for meaningful results. On SQLite the scratch
+database is a file rather than the shared in-memory database (whose table
+locks fail concurrent requests outright), so writers queue on the database
+lock instead; requests that still error out are counted, and the
+invariants are checked regardless.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+from collections import Counter
+from decimal import Decimal
+
+from bench_common import scratch_database, timed, report
+
+from django.db import connection
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.jobs.models import Job
+from apps.applications.models import Application
+
+
+def seed(num_applicants):
+    client = User.objects.create(email='client@stress.local', name='Client', role='client')
+    workers = User.objects.bulk_create(
+        [User(email=f'worker{i}@stress.local', name=f'Worker {i}', role='worker') for i in range(num_applicants)]
+    )
+    return client, workers
+
+
+def run_round(client, workers):
+    job = Job.objects.create(
+        client=client, title='Contended job', category='Plumbing', description='Stress test',
+        location='Nairobi', budget=Decimal('1000'),
+    )
+    applications = Application.objects.bulk_create([
+        Application(job=job, worker=worker, message='Pick me', quote=Decimal('900'))
+        for worker in workers
+    ])
+
+    barrier = threading.Barrier(len(applications))
+    outcomes = [None] * len(applications)
+    latencies = [None] * len(applications)
+
+    def accept(index, application_id):
+        api = APIClient()
+        api.force_authenticate(client)
+        barrier.wait()
+        try:
+            latencies[index], response = timed(api.post, f'/api/v1/applications/{application_id}/accept/')
+            outcomes[index] = response.status_code
+        except Exception as exc:
+            outcomes[index] = type(exc).__name__
+        finally:
+            connection.close()
+
+    threads = [
+        threading.Thread(target=accept, args=(index, application.id))
+        for index, application in enumerate(applications)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    job.refresh_from_db()
+    statuses = dict(Application.objects.filter(job=job).values_list('worker_id', 'status'))
+    accepted = [worker_id for worker_id, status in statuses.items() if status == 'accepted']
+    winners = [applications[index].worker_id for index, outcome in enumerate(outcomes) if outcome == 200]
+
+    problems = []
+    if len(winners) > 1:
+        problems.append(f'{len(winners)} accepts succeeded')
+    if len(accepted) > 1:
+        problems.append(f'{len(accepted)} applications accepted')
+    elif accepted:
+        if job.status != 'accepted' or job.worker_id != accepted[0]:
+            problems.append(f'job is {job.status} with worker {job.worker_id}, accepted worker {accepted[0]}')
+        if winners != accepted:
+            problems.append(f'winning requests were for {winners}, accepted worker {accepted[0]}')
+        if sum(1 for status in statuses.values() if status == 'rejected') != len(statuses) - 1:
+            problems.append('other applications were not all rejected')
+    elif job.status != 'pending' or any(status != 'pending' for status in statuses.values()):
+        problems.append('nothing was accepted, but the job or applications changed')
+    elif all(outcome in (200, 400) for outcome in outcomes):
+        # Without errors, somebody must have won
+        problems.append('no accept succeeded')
+    return problems, Counter(outcomes), [latency for latency in latencies if latency is not None]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--applicants', type=int, default=8)
+    args = parser.parse_args()
+    # Lock errors are expected on SQLite and counted below
+    logging.getLogger('django.request').setLevel(logging.CRITICAL)
+
+    if connection.vendor == 'sqlite':
+        connection.settings_dict['TEST']['NAME'] = os.path.join(tempfile.gettempdir(), 'stress_accept.sqlite3')
+        connection.settings_dict['OPTIONS'].setdefault('timeout', 30)
+
+    with scratch_database():
+        client, workers = seed(args.applicants)
+        failed = 0
+        outcomes = Counter()
+        latencies = []
+        for round_number in range(1, args.rounds + 1):
+            problems, round_outcomes, round_latencies = run_round(client, workers)
+            outcomes.update(round_outcomes)
+            latencies.extend(round_latencies)
+            if problems:
+                failed += 1
+                print(f'round {round_number}: ' + '; '.join(problems))
+
+        print(f'{args.rounds} rounds x {args.applicants} concurrent accepts on {connection.vendor}')
+        print('responses: ' + ', '.join(f'{outcome}={count}' for outcome, count in sorted(outcomes.items(), key=str)))
+        report('accept', latencies)
+        if failed:
+            print(f'FAILED: {failed} round(s) broke the single-assignment invariant')
+            return 1
+        print('OK: every job was assigned to exactly one worker')
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())